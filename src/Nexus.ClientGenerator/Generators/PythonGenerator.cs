@@ -12,6 +12,12 @@ namespace Nexus.ClientGenerator
         {
             var sourceTextBuilder = new StringBuilder();
 
+            // read template
+            var basePath = Assembly.GetExecutingAssembly().Location;
+
+            var templateText = File
+                .ReadAllText(Path.Combine(basePath, "..", "Templates", "PythonTemplate.py"));
+
             // add clients
             var groupedClients = document.Paths
                 .GroupBy(path => path.Value.Operations.First().Value.OperationId.Split(new[] { '_' }, 2).First());
@@ -65,7 +71,8 @@ $@"    @property
                     clientGroup.Key,
                     clientGroup.ToDictionary(entry => entry.Key, entry => entry.Value),
                     sourceTextBuilder,
-                    settings);
+                    settings,
+                    templateText);
 
                 sourceTextBuilder.AppendLine();
             }
@@ -88,10 +95,7 @@ $@"    @property
             var models = sourceTextBuilder.ToString();
 
             // Build final source text
-            var basePath = Assembly.GetExecutingAssembly().Location;
-
-            var template = File
-                .ReadAllText(Path.Combine(basePath, "..", "Templates", "PythonTemplate.py"))
+            var template = templateText
                 .Replace("{", "{{")
                 .Replace("}", "}}");
 
@@ -117,16 +121,24 @@ $@"    @property
             string className,
             IDictionary<string, OpenApiPathItem> methodMap,
             StringBuilder sourceTextBuilder,
-            GeneratorSettings settings)
+            GeneratorSettings settings,
+            string templateText)
         {
             var augmentedClassName = className + "Client";
 
             // interface
             /* nothing to do here */
 
+            // extension methods (optional mixin class defined in the template)
+            var extensionClassName = $"_{augmentedClassName}Extensions";
+
+            var baseClass = templateText.Contains($"class {extensionClassName}:")
+                ? $"({extensionClassName})"
+                : string.Empty;
+
             // implementation
             sourceTextBuilder.AppendLine(
-$@"class {augmentedClassName}:
+$@"class {augmentedClassName}{baseClass}:
     """"""Provides methods to interact with {Shared.SplitCamelCase(className).ToLower()}.""""""
 
     _client: {settings.ClientName}
@@ -242,7 +254,7 @@ $@"class {augmentedClassName}:
                 ? "None"
                 : operation.RequestBody?.Content.Keys.First() switch
                 {
-                    "application/json" => $"json.dumps({bodyParameter.Split(":")[0]}, cls=_MyEncoder)",
+                    "application/json" => $"self._client._json_backend.dumps({bodyParameter.Split(":")[0]})",
                     "application/octet-stream" => bodyParameter.Split(":")[0],
                     _ => throw new Exception($"The media type {operation.RequestBody!.Content.Keys.First()} is not supported.")
                 };
@@ -317,7 +329,133 @@ $@"    {propertyName}: {type}
 ");
                     }
                 }
+
+                // specialized (de)serializers
+                var properties = schema.Properties ?? new Dictionary<string, OpenApiSchema>();
+
+                var fromJsonArguments = string.Join($",{Environment.NewLine}", properties
+                    .Select(property =>
+                    {
+                        var value = property.Value.Nullable
+                            ? $"data.get(\"{property.Key}\")"
+                            : $"data[\"{property.Key}\"]";
+
+                        return $"            {Shared.ToSnakeCase(property.Key)}={GetFromJsonExpression(property.Value, value)}";
+                    }));
+
+                var toJsonEntries = string.Join($",{Environment.NewLine}", properties
+                    .Select(property =>
+                    {
+                        var value = $"self.{Shared.ToSnakeCase(property.Key)}";
+                        return $"            \"{property.Key}\": {GetToJsonExpression(property.Value, value)}";
+                    }));
+
+                sourceTextBuilder.AppendLine(
+$@"    @staticmethod
+    def from_json(data: Any) -> {modelName}:
+        return {modelName}(
+{fromJsonArguments})
+
+    def to_json(self) -> dict[str, Any]:
+        return {{
+{toJsonEntries}
+        }}
+");
+            }
+        }
+
+        private string GetFromJsonExpression(OpenApiSchema schema, string value, int depth = 0)
+        {
+            string expression;
+
+            if (schema.Reference is null)
+            {
+                var itemValue = depth == 0 ? "value" : $"value{depth}";
+                var itemKey = depth == 0 ? "key" : $"key{depth}";
+
+                expression = (schema.Type, schema.Format, schema.AdditionalPropertiesAllowed) switch
+                {
+                    (null, _, _) => schema.OneOf.Count switch
+                    {
+                        0 => value,
+                        1 => GetFromJsonExpression(schema.OneOf.First(), value, depth),
+                        _ => throw new Exception("Only zero or one entries are supported.")
+                    },
+                    ("string", "guid", _) => $"UUID({value})",
+                    ("string", "duration", _) => $"_decode_timedelta({value})",
+                    ("string", "date-time", _) => $"_decode_datetime({value})",
+                    ("array", _, _) => GetListExpression(GetFromJsonExpression(schema.Items, itemValue, depth + 1), itemValue, value),
+                    ("object", _, true) => $"{{ _to_snake_case({itemKey}): {GetFromJsonExpression(schema.AdditionalProperties, itemValue, depth + 1)} for {itemKey}, {itemValue} in {value}.items() }}",
+                    (_, _, _) => value
+                };
+            }
+
+            else
+            {
+                expression = schema.Enum.Any()
+                    ? $"_decode({schema.Reference.Id}, {value})"
+                    : $"{schema.Reference.Id}.from_json({value})";
             }
+
+            return schema.Nullable && expression != value
+                ? $"None if {value} is None else {expression}"
+                : expression;
+        }
+
+        private string GetToJsonExpression(OpenApiSchema schema, string value, int depth = 0)
+        {
+            string expression;
+
+            if (schema.Reference is null)
+            {
+                var itemValue = depth == 0 ? "value" : $"value{depth}";
+                var itemKey = depth == 0 ? "key" : $"key{depth}";
+
+                expression = (schema.Type, schema.Format, schema.AdditionalPropertiesAllowed) switch
+                {
+                    (null, _, _) => schema.OneOf.Count switch
+                    {
+                        0 => value,
+                        1 => GetToJsonExpression(schema.OneOf.First(), value, depth),
+                        _ => throw new Exception("Only zero or one entries are supported.")
+                    },
+                    ("string", "guid", _) => $"str({value})",
+                    ("string", "duration", _) => $"_encode_timedelta({value})",
+                    ("string", "date-time", _) => $"{value}.isoformat()",
+                    ("array", _, _) => GetListExpression(GetToJsonExpression(schema.Items, itemValue, depth + 1), itemValue, value),
+                    ("object", _, true) => GetDictExpression(GetToJsonExpression(schema.AdditionalProperties, itemValue, depth + 1), itemKey, itemValue, value),
+                    (_, _, _) => value
+                };
+            }
+
+            else
+            {
+                expression = schema.Enum.Any()
+                    ? $"{value}.value"
+                    : $"{value}.to_json()";
+            }
+
+            return schema.Nullable && expression != value
+                ? $"None if {value} is None else {expression}"
+                : expression;
+        }
+
+        private string GetListExpression(string itemExpression, string itemValue, string value)
+        {
+            // no conversion required
+            if (itemExpression == itemValue)
+                return value;
+
+            return $"[{itemExpression} for {itemValue} in {value}]";
+        }
+
+        private string GetDictExpression(string valueExpression, string itemKey, string itemValue, string value)
+        {
+            // no conversion required
+            if (valueExpression == itemValue)
+                return value;
+
+            return $"{{ {itemKey}: {valueExpression} for {itemKey}, {itemValue} in {value}.items() }}";
         }
 
         private string GetType(string mediaTypeKey, OpenApiMediaType mediaType, bool returnValue = false)
@@ -45,7 +45,7 @@ namespace Nexus.Controllers
             if (_databaseService.TryReadArtifact(artifactId, out var artifactStream))
             {
                 Response.Headers.ContentLength = artifactStream.Length;
-                return File(artifactStream, "application/octet-stream"); // do not set filname here, otherwise <a download="abc.pdf" /> will not work!
+                return File(artifactStream, "application/octet-stream", enableRangeProcessing: true); // do not set filname here, otherwise <a download="abc.pdf" /> will not work!
             }
 
             else
@@ -1 +1,5 @@
-from ._nexus_api import *
\ No newline at end of file
+from ._nexus_api import *
+from ._data_storage import *
+from ._data_cache import *
+from ._catalog_cache import *
+from ._resource_index import *
@@ -0,0 +1,327 @@
+# Python <= 3.9
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import (Any, AsyncIterator, Callable, Optional, Tuple, Type,
+                    TypeVar)
+from urllib.parse import quote
+
+from httpx import codes
+
+from ._data_cache import _lock_file
+from ._nexus_api import (CatalogInfo, CatalogMetadata, CatalogTimeRange,
+                         NexusAsyncClient, ResourceCatalog, StreamResponse,
+                         _decode)
+
+T = TypeVar("T")
+
+@dataclass
+class _CatalogCacheEntry:
+    data: Any
+    etag: Optional[str]
+    expires: float
+    value: Any = None
+
+class CatalogCache:
+    """
+    An opt-in client-side cache for catalog metadata requested via the CatalogsClient.
+
+    The cache provides the cached counterparts of CatalogsClient.get, get_child_catalog_infos, get_time_range and get_metadata. Each kind of request has its own time-to-live. When an entry has expired and the server returned an ETag for it, the entry is revalidated with an If-None-Match request so that unchanged data is not transferred and decoded again. Concurrent requests for the same entry share a single round trip.
+
+    When a folder is specified, the cache is persisted there. Multiple processes may share the folder: only the changed entries are merged into the cache file under a file lock, and the file is written in a worker thread.
+
+    Note: The returned objects are shared between callers and must not be modified.
+    """
+
+    _cache_file_name: str = "catalogs.json"
+
+    def __init__(
+        self,
+        client: NexusAsyncClient,
+        catalog_ttl: timedelta = timedelta(minutes=5),
+        child_catalog_infos_ttl: timedelta = timedelta(minutes=5),
+        time_range_ttl: timedelta = timedelta(minutes=1),
+        metadata_ttl: timedelta = timedelta(minutes=5),
+        is_transient: Optional[Callable[[str], bool]] = None,
+        folder_path: Optional[str] = None):
+        """
+        Initializes a new instance of the CatalogCache.
+
+            Args:
+                client: The client to use.
+                catalog_ttl: The time-to-live of resource catalogs.
+                child_catalog_infos_ttl: The time-to-live of child catalog infos.
+                time_range_ttl: The time-to-live of catalog time ranges.
+                metadata_ttl: The time-to-live of catalog metadata.
+                is_transient: An optional function which indicates if a catalog is transient (see CatalogRegistration.is_transient). Requests for transient catalogs are never cached.
+                folder_path: An optional folder to persist the cache in.
+        """
+
+        self._client = client
+        self._is_transient = is_transient
+        self._folder_path = folder_path
+        self._locks: dict[Tuple[str, str], Tuple[asyncio.Lock, int]] = {}
+        self._save_lock: Optional[asyncio.Lock] = None
+
+        # local changes which have not been written to the cache file yet
+        self._changed_keys: set[Tuple[str, str]] = set()
+        self._removed_keys: set[Tuple[str, str]] = set()
+
+        self._ttls: dict[str, float] = {
+            "catalog": catalog_ttl.total_seconds(),
+            "child-catalog-infos": child_catalog_infos_ttl.total_seconds(),
+            "timerange": time_range_ttl.total_seconds(),
+            "metadata": metadata_ttl.total_seconds()
+        }
+
+        self._entries = self._load()
+
+    async def get(self, catalog_id: str) -> ResourceCatalog:
+        """
+        Gets the specified catalog.
+
+        Args:
+            catalog_id: The catalog identifier.
+        """
+        return await self._get_async(ResourceCatalog, "catalog", catalog_id, "")
+
+    async def get_child_catalog_infos(self, catalog_id: str) -> list[CatalogInfo]:
+        """
+        Gets a list of child catalog info for the provided parent catalog identifier.
+
+        Args:
+            catalog_id: The parent catalog identifier.
+        """
+        return await self._get_async(list[CatalogInfo], "child-catalog-infos", catalog_id, "/child-catalog-infos")
+
+    async def get_time_range(self, catalog_id: str) -> CatalogTimeRange:
+        """
+        Gets the specified catalog's time range.
+
+        Args:
+            catalog_id: The catalog identifier.
+        """
+        return await self._get_async(CatalogTimeRange, "timerange", catalog_id, "/timerange")
+
+    async def get_metadata(self, catalog_id: str) -> CatalogMetadata:
+        """
+        Gets the catalog metadata.
+
+        Args:
+            catalog_id: The catalog identifier.
+        """
+        return await self._get_async(CatalogMetadata, "metadata", catalog_id, "/metadata")
+
+    async def set_metadata(self, catalog_id: str, catalog_metadata: CatalogMetadata) -> None:
+        """
+        Puts the catalog metadata and invalidates the cached data of the catalog.
+
+        Args:
+            catalog_id: The catalog identifier.
+            catalog_metadata: The catalog metadata to put.
+        """
+
+        await self._client.catalogs.set_metadata(catalog_id, catalog_metadata)
+        self.invalidate(catalog_id)
+
+    def invalidate(self, catalog_id: str) -> None:
+        """
+        Removes all cached data of the specified catalog.
+
+        Args:
+            catalog_id: The catalog identifier.
+        """
+
+        for key in [key for key in self._entries if key[1] == catalog_id]:
+            del self._entries[key]
+            self._changed_keys.discard(key)
+            self._removed_keys.add(key)
+
+        self._flush()
+
+    def clear(self) -> None:
+        """Removes all cached data."""
+
+        self._entries.clear()
+        self._changed_keys.clear()
+        self._removed_keys.clear()
+
+        self._write_changes({}, set(), clear=True)
+
+    async def _get_async(self, typeOfT: Type[T], kind: str, catalog_id: str, relative_url: str) -> T:
+
+        url = f"/api/v1/catalogs/{quote(catalog_id, safe='')}{relative_url}"
+
+        # transient catalogs must be reloaded on each request
+        if self._is_transient is not None and self._is_transient(catalog_id):
+            return await self._client._invoke_async(typeOfT, "GET", url, "application/json", None, None)
+
+        key = (kind, catalog_id)
+
+        async with self._lock(key):
+
+            entry = self._entries.get(key)
+            now = time.time()
+
+            if entry is not None and entry.expires > now:
+                return self._get_value(typeOfT, entry)
+
+            # revalidate expired entry
+            headers = None if entry is None or entry.etag is None else { "If-None-Match": entry.etag }
+
+            async with await self._client._invoke_async(StreamResponse, "GET", url, "application/json", None, None, headers) as stream_response:
+
+                response = stream_response.response
+
+                if entry is not None and response.status_code == codes.NOT_MODIFIED:
+                    entry.expires = now + self._ttls[kind]
+
+                else:
+                    data = self._client.json_backend.loads(await response.aread())
+                    entry = _CatalogCacheEntry(data, response.headers.get("ETag"), now + self._ttls[kind])
+                    self._entries[key] = entry
+
+            self._changed_keys.add(key)
+            self._removed_keys.discard(key)
+
+            await self._save_async()
+
+            return self._get_value(typeOfT, entry)
+
+    @asynccontextmanager
+    async def _lock(self, key: Tuple[str, str]) -> AsyncIterator[None]:
+
+        # the lock of a key is removed as soon as there are no more waiters
+        lock, count = self._locks.get(key, (None, 0))
+
+        if lock is None:
+            lock = asyncio.Lock()
+
+        self._locks[key] = (lock, count + 1)
+
+        try:
+            async with lock:
+                yield
+
+        finally:
+            lock, count = self._locks[key]
+
+            if count == 1:
+                del self._locks[key]
+
+            else:
+                self._locks[key] = (lock, count - 1)
+
+    def _get_value(self, typeOfT: Type[T], entry: _CatalogCacheEntry) -> T:
+
+        # decode only once
+        if entry.value is None:
+            entry.value = _decode(typeOfT, entry.data)
+
+        return entry.value
+
+    def _load(self) -> dict[Tuple[str, str], _CatalogCacheEntry]:
+
+        if self._folder_path is None:
+            return {}
+
+        cache_file_path = os.path.join(self._folder_path, self._cache_file_name)
+
+        if not os.path.isfile(cache_file_path):
+            return {}
+
+        with open(cache_file_path) as json_file:
+            jsonObject = json.load(json_file)
+
+        return {
+            (entry["kind"], entry["catalogId"]): _CatalogCacheEntry(entry["data"], entry["etag"], entry["expires"])
+            for entry in jsonObject
+        }
+
+    async def _save_async(self):
+
+        if self._folder_path is None:
+            return
+
+        # the lock must be created within the event loop (Python <= 3.9)
+        if self._save_lock is None:
+            self._save_lock = asyncio.Lock()
+
+        async with self._save_lock:
+
+            # the changes may have been written by a concurrent request in the meantime
+            if not self._changed_keys and not self._removed_keys:
+                return
+
+            changed_entries, removed_keys = self._take_changes()
+
+            try:
+                await asyncio.to_thread(self._write_changes, changed_entries, removed_keys)
+
+            except BaseException:
+                self._changed_keys.update(key for key in changed_entries if key in self._entries)
+                self._removed_keys.update(removed_keys - self._changed_keys)
+                raise
+
+    def _flush(self):
+
+        if self._folder_path is None:
+            return
+
+        self._write_changes(*self._take_changes())
+
+    def _take_changes(self) -> Tuple[dict[Tuple[str, str], dict[str, Any]], set[Tuple[str, str]]]:
+
+        changed_entries: dict[Tuple[str, str], dict[str, Any]] = {}
+
+        for kind, catalog_id in self._changed_keys:
+            entry = self._entries[(kind, catalog_id)]
+            changed_entries[(kind, catalog_id)] = { "kind": kind, "catalogId": catalog_id, "data": entry.data, "etag": entry.etag, "expires": entry.expires }
+
+        removed_keys = self._removed_keys
+        self._changed_keys = set()
+        self._removed_keys = set()
+
+        return (changed_entries, removed_keys)
+
+    def _write_changes(
+        self,
+        changed_entries: dict[Tuple[str, str], dict[str, Any]],
+        removed_keys: set[Tuple[str, str]],
+        clear: bool = False):
+
+        if self._folder_path is None:
+            return
+
+        os.makedirs(self._folder_path, exist_ok=True)
+
+        cache_file_path = os.path.join(self._folder_path, self._cache_file_name)
+        temp_file_path = cache_file_path + ".tmp"
+
+        # other processes may have changed the cache file in the meantime, so only the local changes are merged into it
+        with _lock_file(cache_file_path + ".lock"):
+
+            entries: dict[Tuple[str, str], dict[str, Any]] = {}
+
+            if not clear and os.path.isfile(cache_file_path):
+
+                with open(cache_file_path) as json_file:
+                    jsonObject = json.load(json_file)
+
+                entries = { (entry["kind"], entry["catalogId"]): entry for entry in jsonObject }
+
+            for key in removed_keys:
+                entries.pop(key, None)
+
+            entries.update(changed_entries)
+
+            with open(temp_file_path, "w") as json_file:
+                json.dump(list(entries.values()), json_file)
+
+            os.replace(temp_file_path, cache_file_path)
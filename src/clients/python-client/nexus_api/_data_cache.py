@@ -0,0 +1,571 @@
+# Python <= 3.9
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import time
+from array import array
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Iterator, Optional, Tuple
+
+from ._data_storage import _EPOCH, MemoryMappedStorage, _to_element_index
+from ._nexus_api import (NexusAsyncClient, _to_element_count,
+                         _to_sample_period)
+
+def _merge_interval(intervals: list[list[int]], start: int, stop: int) -> list[list[int]]:
+
+    result: list[list[int]] = []
+
+    for interval in sorted(intervals + [[start, stop]]):
+
+        if result and interval[0] <= result[-1][1]:
+            result[-1][1] = max(result[-1][1], interval[1])
+
+        else:
+            result.append(list(interval))
+
+    return result
+
+def _remove_interval(intervals: list[list[int]], start: int, stop: int) -> list[list[int]]:
+
+    result: list[list[int]] = []
+
+    for interval_start, interval_stop in intervals:
+
+        if interval_start < start:
+            result.append([interval_start, min(interval_stop, start)])
+
+        if interval_stop > stop:
+            result.append([max(interval_start, stop), interval_stop])
+
+    return result
+
+def _find_gaps(intervals: list[list[int]], start: int, stop: int) -> list[list[int]]:
+
+    gaps: list[list[int]] = []
+    current = start
+
+    for interval_start, interval_stop in intervals:
+
+        if interval_stop <= current:
+            continue
+
+        if interval_start >= stop:
+            break
+
+        if interval_start > current:
+            gaps.append([current, interval_start])
+
+        current = max(current, interval_stop)
+
+    if current < stop:
+        gaps.append([current, stop])
+
+    return gaps
+
+def _clip_intervals(intervals: list[list[int]], start: int, stop: int) -> list[list[int]]:
+
+    return [
+        [max(interval_start, start), min(interval_stop, stop)]
+        for interval_start, interval_stop in intervals
+        if interval_start < stop and interval_stop > start
+    ]
+
+def _apply_changes(
+    resources: dict,
+    local_resources: dict,
+    touched_blocks: set[Tuple[str, int]],
+    removed_blocks: set[Tuple[str, int]],
+    block_element_count: int) -> None:
+
+    for resource_path, block in removed_blocks:
+
+        entry = resources.get(resource_path)
+
+        if entry is None:
+            continue
+
+        block_start = block * block_element_count
+        entry["intervals"] = _remove_interval(entry["intervals"], block_start, block_start + block_element_count)
+        entry["blocks"].pop(str(block), None)
+
+        if not entry["blocks"]:
+            del resources[resource_path]
+
+    for resource_path, block in touched_blocks:
+
+        local_entry = local_resources.get(resource_path)
+        last_access = None if local_entry is None else local_entry["blocks"].get(str(block))
+
+        if local_entry is None or last_access is None:
+            continue
+
+        entry = resources.setdefault(resource_path, { "intervals": [], "blocks": {} })
+        block_start = block * block_element_count
+
+        entry["blocks"][str(block)] = max(entry["blocks"].get(str(block), 0), last_access)
+
+        for interval_start, interval_stop in _clip_intervals(local_entry["intervals"], block_start, block_start + block_element_count):
+            entry["intervals"] = _merge_interval(entry["intervals"], interval_start, interval_stop)
+
+@contextmanager
+def _lock_file(file_path: str) -> Iterator[None]:
+
+    # the lock is released by the OS when the process dies
+    with open(file_path, "a+b") as lock_file:
+
+        if os.name == "nt":
+            import msvcrt
+            lock_file.seek(0)
+            msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+
+            try:
+                yield
+
+            finally:
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+
+        else:
+            import fcntl
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+
+            try:
+                yield
+
+            finally:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+def _get_file_version(file_path: str) -> Optional[Tuple[int, int, int]]:
+
+    # the file is replaced atomically, i.e. every version has its own inode
+    try:
+        stat = os.stat(file_path)
+
+    except FileNotFoundError:
+        return None
+
+    return (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+class DataCache:
+    """
+    A persistent, opt-in client-side cache for data requested via the DataClient.
+
+    The data of each resource is stored in memory-mapped blocks of a fixed number of elements (see MemoryMappedStorage). The cache keeps track of the intervals that have already been downloaded so that only the missing gaps are requested from the server. When the size budget is exceeded, the least recently used blocks are evicted.
+
+    Multiple processes may share the same cache folder: the index file is updated under a file lock and the changes of each process are merged into it. The index is reloaded when it has been changed by another process. Access times alone are not written immediately but together with the next change or when the cache is closed.
+
+    Note: The cache assumes that the data of the requested resources does not change afterwards. When this cannot be guaranteed (e.g. for data near the current time), the affected resources should be invalidated.
+    """
+
+    _index_file_name: str = "index.json"
+
+    def __init__(
+        self,
+        client: NexusAsyncClient,
+        folder_path: str,
+        max_size: int,
+        block_element_count: int = 2**20,
+        max_concurrency: int = 4,
+        max_open_maps: int = 64):
+        """
+        Initializes a new instance of the DataCache.
+
+            Args:
+                client: The client to use to download missing data.
+                folder_path: The folder to store the cached data in.
+                max_size: The size budget of the cache in bytes.
+                block_element_count: The number of elements per cache block.
+                max_concurrency: The maximum number of concurrent requests.
+                max_open_maps: The maximum number of memory-mapped cache files to keep open.
+        """
+
+        if block_element_count <= 0:
+            raise Exception("The block element count must be greater than zero.")
+
+        self._client = client
+        self._folder_path = folder_path
+        self._index_file_path = os.path.join(folder_path, self._index_file_name)
+        self._max_size = max_size
+        self._block_element_count = block_element_count
+        self._max_concurrency = max_concurrency
+        self._locks: dict[str, asyncio.Lock] = {}
+        self._index_lock: Optional[asyncio.Lock] = None
+        self._pinned_blocks: dict[Tuple[str, int], int] = {}
+        self._storage = MemoryMappedStorage(folder_path, block_element_count, max_open_maps)
+
+        # local changes which have not been merged into the index file yet
+        self._touched_blocks: set[Tuple[str, int]] = set()
+        self._removed_blocks: set[Tuple[str, int]] = set()
+
+        self._index_version: Optional[Tuple[int, int, int]] = None
+        self._index = self._load_index()
+        self._block_count = self._count_blocks()
+
+    @property
+    def size(self) -> int:
+        """Gets the current size of the cache in bytes."""
+        return self._block_count * self._block_element_count * 8
+
+    @property
+    def storage(self) -> MemoryMappedStorage:
+        """Gets the underlying storage."""
+        return self._storage
+
+    async def get(self, resource_path: str, begin: datetime, end: datetime) -> array[float]:
+        """
+        Gets the requested data from the cache and downloads missing data.
+
+        Args:
+            resource_path: The path to the resource data to get.
+            begin: Start date/time.
+            end: End date/time.
+        """
+
+        sample_period = _to_sample_period(resource_path)
+        element_count = _to_element_count(begin, end, sample_period)
+        doubleBuffer = array("d", [0.0]) * element_count
+
+        async with self._locks.setdefault(resource_path, asyncio.Lock()):
+            await self._update(resource_path, begin, end)
+            self._storage.read_into(resource_path, begin, end, memoryview(doubleBuffer))
+
+        return doubleBuffer
+
+    async def get_views(self, resource_path: str, begin: datetime, end: datetime) -> list[memoryview[float]]:
+        """
+        Gets the requested data as float64 memoryviews into the memory-mapped cache files and downloads missing data. The data is not copied.
+
+        Args:
+            resource_path: The path to the resource data to get.
+            begin: Start date/time.
+            end: End date/time.
+        """
+
+        async with self._locks.setdefault(resource_path, asyncio.Lock()):
+            await self._update(resource_path, begin, end)
+            return self._storage.get_views(resource_path, begin, end)
+
+    async def _update(self, resource_path: str, begin: datetime, end: datetime):
+
+        sample_period = _to_sample_period(resource_path)
+        start = _to_element_index(begin, sample_period)
+        stop = start + _to_element_count(begin, end, sample_period)
+        blocks = range(start // self._block_element_count, (stop - 1) // self._block_element_count + 1)
+
+        # pin the affected blocks so that concurrent requests do not evict them
+        for block in blocks:
+            self._pinned_blocks[(resource_path, block)] = self._pinned_blocks.get((resource_path, block), 0) + 1
+
+        try:
+
+            # other processes may have removed blocks in the meantime
+            await self._revalidate(resource_path, blocks)
+
+            entry = self._register_blocks(resource_path, blocks)
+            is_changed = False
+
+            # download missing data directly into the cache files
+            for gap_start, gap_stop in _find_gaps(entry["intervals"], start, stop):
+
+                gap_begin = _EPOCH + gap_start * sample_period
+                gap_end = _EPOCH + gap_stop * sample_period
+
+                await self._storage.download(self._client, resource_path, gap_begin, gap_end, self._max_concurrency)
+
+                # a concurrent request may have replaced the index in the meantime
+                entry = self._register_blocks(resource_path, blocks)
+                entry["intervals"] = _merge_interval(entry["intervals"], gap_start, gap_stop)
+                is_changed = True
+
+            # the index is only written when the cached data has changed (and not for cache hits)
+            if is_changed:
+                self._evict()
+                await self._save_index()
+
+        finally:
+
+            for block in blocks:
+
+                pin_count = self._pinned_blocks.pop((resource_path, block)) - 1
+
+                if pin_count > 0:
+                    self._pinned_blocks[(resource_path, block)] = pin_count
+
+    def invalidate(self, resource_path: str, begin: Optional[datetime] = None, end: Optional[datetime] = None) -> None:
+        """
+        Removes cached data of the specified resource.
+
+        Args:
+            resource_path: The path to the resource data to invalidate.
+            begin: The optional start date/time. If not specified, all data of the resource is invalidated.
+            end: The optional end date/time. If not specified, all data of the resource is invalidated.
+        """
+
+        self._merge_index(*self._read_index_if_changed())
+        entry = self._index.get(resource_path)
+
+        if entry is None:
+            return
+
+        if begin is None or end is None:
+            blocks = [int(block) for block in entry["blocks"]]
+
+        else:
+            sample_period = _to_sample_period(resource_path)
+            start = _to_element_index(begin, sample_period)
+            stop = _to_element_index(end, sample_period)
+            blocks = range(start // self._block_element_count, (stop - 1) // self._block_element_count + 1)
+
+            # a partially invalidated block is not removed, so its remaining intervals must be written, too
+            entry["intervals"] = _remove_interval(entry["intervals"], start, stop)
+            self._removed_blocks.update((resource_path, block) for block in blocks if str(block) in entry["blocks"])
+            self._touched_blocks.update((resource_path, block) for block in blocks if str(block) in entry["blocks"])
+            blocks = []
+
+        for block in blocks:
+            self._remove_block(resource_path, block)
+
+        self._flush_index()
+
+    def clear(self) -> None:
+        """Removes all cached data."""
+
+        self._merge_index(*self._read_index_if_changed())
+
+        for resource_path in list(self._index.keys()):
+            self.invalidate(resource_path)
+
+    def close(self) -> None:
+        """Writes pending access times to the index file and closes the memory-mapped cache files which are not referenced by views anymore."""
+
+        if self._touched_blocks or self._removed_blocks:
+            self._flush_index()
+
+        self._storage.close()
+
+    def _register_blocks(self, resource_path: str, blocks: range) -> dict:
+
+        entry = self._index.setdefault(resource_path, { "intervals": [], "blocks": {} })
+        now = time.time()
+
+        for block in blocks:
+
+            if str(block) not in entry["blocks"]:
+                self._block_count += 1
+
+            entry["blocks"][str(block)] = now
+            self._touched_blocks.add((resource_path, block))
+            self._removed_blocks.discard((resource_path, block))
+
+        return entry
+
+    def _evict(self):
+
+        if self.size <= self._max_size:
+            return
+
+        blocks = sorted(
+            (last_access, resource_path, int(block))
+            for resource_path, entry in self._index.items()
+            for block, last_access in entry["blocks"].items())
+
+        for _, resource_path, block in blocks:
+
+            if self.size <= self._max_size:
+                break
+
+            # never evict the blocks of pending requests
+            if (resource_path, block) in self._pinned_blocks:
+                continue
+
+            self._remove_block(resource_path, block)
+
+    def _remove_block(self, resource_path: str, block: int):
+
+        entry = self._index[resource_path]
+        block_start = block * self._block_element_count
+
+        entry["intervals"] = _remove_interval(entry["intervals"], block_start, block_start + self._block_element_count)
+
+        if entry["blocks"].pop(str(block), None) is not None:
+            self._block_count -= 1
+
+        self._touched_blocks.discard((resource_path, block))
+        self._removed_blocks.add((resource_path, block))
+
+        self._storage.remove_block(resource_path, block)
+
+        if not entry["blocks"]:
+            del self._index[resource_path]
+
+    def _get_index_lock(self) -> asyncio.Lock:
+
+        # the lock must be created within the event loop (Python <= 3.9)
+        if self._index_lock is None:
+            self._index_lock = asyncio.Lock()
+
+        return self._index_lock
+
+    def _count_blocks(self) -> int:
+        return sum(len(entry["blocks"]) for entry in self._index.values())
+
+    def _read_index_file(self) -> Optional[dict]:
+
+        if not os.path.isfile(self._index_file_path):
+            return None
+
+        with open(self._index_file_path) as json_file:
+            return json.load(json_file)
+
+    def _read_resources(self) -> dict:
+
+        index = self._read_index_file()
+
+        # the cache layout depends on the block size
+        if index is None or index.get("block_element_count") != self._block_element_count:
+            return {}
+
+        return index["resources"]
+
+    def _load_index(self) -> dict:
+
+        with _lock_file(self._index_file_path + ".lock"):
+            index = self._read_index_file()
+            self._index_version = _get_file_version(self._index_file_path)
+
+        if index is None:
+            return {}
+
+        # the cache layout depends on the block size
+        if index.get("block_element_count") == self._block_element_count:
+            return index["resources"]
+
+        for resource_path, entry in index["resources"].items():
+            for block in entry["blocks"]:
+                self._storage.remove_block(resource_path, int(block))
+
+        return {}
+
+    async def _revalidate(self, resource_path: str, blocks: range):
+
+        async with self._get_index_lock():
+            resources, version, missing_blocks = await asyncio.to_thread(self._read_changes, resource_path, blocks)
+            self._merge_index(resources, version)
+
+        # the block files may have been removed by another process which has not updated the index yet
+        entry = self._index.get(resource_path)
+
+        for block in missing_blocks:
+
+            if entry is not None and str(block) in entry["blocks"]:
+                self._remove_block(resource_path, block)
+
+            # an open map of a removed file must not be used for new data
+            else:
+                self._storage.remove_block(resource_path, block)
+
+    def _read_changes(self, resource_path: str, blocks: range) -> Tuple[Optional[dict], Optional[Tuple[int, int, int]], list[int]]:
+
+        resources, version = self._read_index_if_changed()
+
+        missing_blocks = [
+            block for block in blocks
+            if not os.path.isfile(self._storage.get_block_file_path(resource_path, block))
+        ]
+
+        return (resources, version, missing_blocks)
+
+    def _read_index_if_changed(self) -> Tuple[Optional[dict], Optional[Tuple[int, int, int]]]:
+
+        version = _get_file_version(self._index_file_path)
+
+        if version == self._index_version:
+            return (None, version)
+
+        with _lock_file(self._index_file_path + ".lock"):
+            return (self._read_resources(), _get_file_version(self._index_file_path))
+
+    def _merge_index(self, resources: Optional[dict], version: Optional[Tuple[int, int, int]]):
+
+        # the index file has been changed by another process
+        if resources is not None:
+            _apply_changes(resources, self._index, self._touched_blocks, self._removed_blocks, self._block_element_count)
+            self._set_index(resources, version)
+
+    async def _save_index(self):
+
+        async with self._get_index_lock():
+
+            touched_blocks, removed_blocks = self._take_changes()
+
+            # the worker thread gets its own copy of the changed entries
+            local_resources: dict = {}
+
+            for resource_path, _ in touched_blocks:
+
+                entry = self._index.get(resource_path)
+
+                if entry is not None and resource_path not in local_resources:
+                    local_resources[resource_path] = { "intervals": [list(interval) for interval in entry["intervals"]], "blocks": dict(entry["blocks"]) }
+
+            try:
+                resources, version = await asyncio.to_thread(self._write_index, local_resources, touched_blocks, removed_blocks)
+
+            except BaseException:
+                self._touched_blocks.update(touched_blocks - self._removed_blocks)
+                self._removed_blocks.update(removed_blocks - self._touched_blocks)
+                raise
+
+            # keep the changes which have been made in the meantime
+            _apply_changes(resources, self._index, self._touched_blocks, self._removed_blocks, self._block_element_count)
+            self._set_index(resources, version)
+
+    def _flush_index(self):
+
+        touched_blocks, removed_blocks = self._take_changes()
+        resources, version = self._write_index(self._index, touched_blocks, removed_blocks)
+        self._set_index(resources, version)
+
+    def _take_changes(self) -> Tuple[set[Tuple[str, int]], set[Tuple[str, int]]]:
+
+        changes = (self._touched_blocks, self._removed_blocks)
+        self._touched_blocks = set()
+        self._removed_blocks = set()
+
+        return changes
+
+    def _write_index(
+        self,
+        local_resources: dict,
+        touched_blocks: set[Tuple[str, int]],
+        removed_blocks: set[Tuple[str, int]]) -> Tuple[dict, Optional[Tuple[int, int, int]]]:
+
+        temp_file_path = self._index_file_path + ".tmp"
+
+        # other processes may have changed the index in the meantime, so the local changes are merged into the current index file
+        with _lock_file(self._index_file_path + ".lock"):
+
+            resources = self._read_resources()
+            _apply_changes(resources, local_resources, touched_blocks, removed_blocks, self._block_element_count)
+
+            with open(temp_file_path, "w") as json_file:
+                json.dump({ "block_element_count": self._block_element_count, "resources": resources }, json_file)
+
+            os.replace(temp_file_path, self._index_file_path)
+
+            return (resources, _get_file_version(self._index_file_path))
+
+    def _set_index(self, resources: dict, version: Optional[Tuple[int, int, int]]):
+        self._index = resources
+        self._index_version = version
+        self._block_count = self._count_blocks()
+
+    # "disposable" methods
+    def __enter__(self) -> DataCache:
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        self.close()
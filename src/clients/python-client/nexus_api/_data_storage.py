@@ -0,0 +1,266 @@
+# Python <= 3.9
+from __future__ import annotations
+
+import mmap
+import os
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from typing import Iterator, Tuple
+from urllib.parse import quote
+
+from ._nexus_api import (NexusAsyncClient, _create_semaphore, _gather,
+                         _to_element_count, _to_sample_period)
+
+_EPOCH = datetime(1, 1, 1, tzinfo=timezone.utc)
+
+def _to_element_index(value: datetime, sample_period: timedelta) -> int:
+
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+
+    offset = value - _EPOCH
+
+    if offset % sample_period != timedelta(0):
+        raise Exception(f"The date/time {value} is not a multiple of the sample period {sample_period}.")
+
+    return offset // sample_period
+
+class MemoryMappedStorage:
+    """
+    A storage for downloaded data which is backed by memory-mapped files.
+
+    The data of each resource is stored in files of a fixed number of float64 elements (blocks) which are aligned to multiples of the sample period. Downloaded data is written directly into the memory-mapped files and the stored data is exposed as memoryviews into these files. This way, multiple processes can share the same data via the page cache and datasets larger than the available memory can be processed. A numpy.ndarray view can be obtained via numpy.frombuffer(view) or numpy.memmap(storage.get_block_file_path(...)).
+    """
+
+    def __init__(self, folder_path: str, block_element_count: int = 2**20, max_open_maps: int = 64):
+        """
+        Initializes a new instance of the MemoryMappedStorage.
+
+            Args:
+                folder_path: The folder to store the data in.
+                block_element_count: The number of elements per block file.
+                max_open_maps: The maximum number of memory-mapped files to keep open. The least recently used maps which are not referenced by views anymore are closed first.
+        """
+
+        if block_element_count <= 0:
+            raise Exception("The block element count must be greater than zero.")
+
+        if max_open_maps <= 0:
+            raise Exception("The maximum number of open maps must be greater than zero.")
+
+        self._folder_path = folder_path
+        self._block_element_count = block_element_count
+        self._max_open_maps = max_open_maps
+        self._maps: OrderedDict[Tuple[str, int], mmap.mmap] = OrderedDict()
+
+        # maps of removed blocks which are still referenced by views
+        self._removed_maps: list[mmap.mmap] = []
+
+        os.makedirs(folder_path, exist_ok=True)
+
+    @property
+    def block_element_count(self) -> int:
+        """Gets the number of elements per block file."""
+        return self._block_element_count
+
+    async def download(
+        self,
+        client: NexusAsyncClient,
+        resource_path: str,
+        begin: datetime,
+        end: datetime,
+        max_concurrency: int = 4) -> None:
+        """
+        Downloads the requested data directly into the block files. There is one request per affected block.
+
+        Args:
+            client: The client to use.
+            resource_path: The path to the resource data to download.
+            begin: Start date/time.
+            end: End date/time.
+            max_concurrency: The maximum number of concurrent requests.
+        """
+
+        sample_period = _to_sample_period(resource_path)
+        element_count = _to_element_count(begin, end, sample_period)
+        start = _to_element_index(begin, sample_period)
+        semaphore = _create_semaphore(max_concurrency)
+
+        async def download_block(block: int, offset: int, length: int):
+
+            block_start = block * self._block_element_count + offset
+            block_begin = _EPOCH + block_start * sample_period
+            block_end = block_begin + length * sample_period
+
+            # the view keeps the map open while the request is pending
+            target = memoryview(self._get_map(resource_path, block, create=True))[offset * 8:(offset + length) * 8]
+
+            try:
+                async with semaphore:
+                    async with await client.data.get_stream(resource_path, block_begin, block_end) as response:
+                        actual_length = await response.read_into(target)
+
+            finally:
+                target.release()
+
+            if actual_length != length:
+                raise Exception(f"Expected {length} elements for resource {resource_path} but received {actual_length}.")
+
+        await _gather(
+            download_block(block, offset, length)
+            for block, offset, length, _ in self._get_block_slices(start, element_count))
+
+    def get_views(self, resource_path: str, begin: datetime, end: datetime) -> list[memoryview[float]]:
+        """
+        Gets float64 memoryviews into the block files which together cover the requested period.
+
+        Args:
+            resource_path: The path to the resource data.
+            begin: Start date/time.
+            end: End date/time.
+        """
+
+        sample_period = _to_sample_period(resource_path)
+        element_count = _to_element_count(begin, end, sample_period)
+        start = _to_element_index(begin, sample_period)
+
+        return [
+            memoryview(self._get_map(resource_path, block, create=False))[offset * 8:(offset + length) * 8].cast("d")
+            for block, offset, length, _ in self._get_block_slices(start, element_count)
+        ]
+
+    def read_into(self, resource_path: str, begin: datetime, end: datetime, target: memoryview) -> None:
+        """
+        Copies the stored data of the requested period into the provided buffer.
+
+        Args:
+            resource_path: The path to the resource data.
+            begin: Start date/time.
+            end: End date/time.
+            target: A writable, contiguous buffer to copy the data into.
+        """
+
+        byteBuffer = memoryview(target).cast("B")
+        offset = 0
+
+        for view in self.get_views(resource_path, begin, end):
+            length = view.nbytes
+            byteBuffer[offset:offset + length] = view.cast("B")
+            offset += length
+
+    def get_block_file_path(self, resource_path: str, block: int) -> str:
+        """
+        Gets the path of the specified block file.
+
+        Args:
+            resource_path: The path to the resource data.
+            block: The block index, i.e. the element index since 0001-01-01 divided by the block element count.
+        """
+        return os.path.join(self._folder_path, quote(resource_path, safe=""), f"{block}.dat")
+
+    def remove_block(self, resource_path: str, block: int) -> None:
+        """
+        Removes the specified block file.
+
+        Args:
+            resource_path: The path to the resource data.
+            block: The block index.
+        """
+
+        memory_map = self._maps.pop((resource_path, block), None)
+
+        if memory_map is not None:
+            try:
+                memory_map.close()
+
+            # there are still views into the map, so it is closed later (but never reused for the new block file)
+            except BufferError:
+                self._removed_maps.append(memory_map)
+
+        try:
+            os.remove(self.get_block_file_path(resource_path, block))
+
+        except FileNotFoundError:
+            pass
+
+    def close(self) -> None:
+        """Closes all memory-mapped files which are not referenced by views anymore."""
+        self._close_maps(max_open_maps=0)
+
+    def _close_maps(self, max_open_maps: int):
+
+        for memory_map in list(self._removed_maps):
+
+            try:
+                memory_map.close()
+                self._removed_maps.remove(memory_map)
+
+            except BufferError:
+                pass
+
+        # least recently used maps first
+        for key in list(self._maps.keys()):
+
+            if len(self._maps) + len(self._removed_maps) <= max_open_maps:
+                break
+
+            try:
+                self._maps[key].close()
+                del self._maps[key]
+
+            except BufferError:
+                pass
+
+    def _get_map(self, resource_path: str, block: int, create: bool) -> mmap.mmap:
+
+        key = (resource_path, block)
+        memory_map = self._maps.get(key)
+
+        if memory_map is None:
+
+            # keep the number of open file descriptors bounded
+            self._close_maps(max_open_maps=self._max_open_maps - 1)
+
+            file_path = self.get_block_file_path(resource_path, block)
+            length = self._block_element_count * 8
+
+            if not os.path.exists(file_path):
+
+                if not create:
+                    raise Exception(f"There is no data for resource {resource_path} and block {block}.")
+
+                os.makedirs(os.path.dirname(file_path), exist_ok=True)
+
+                with open(file_path, "ab") as file:
+                    file.truncate(length)
+
+            with open(file_path, "r+b") as file:
+                memory_map = mmap.mmap(file.fileno(), length)
+
+            self._maps[key] = memory_map
+
+        else:
+            self._maps.move_to_end(key)
+
+        return memory_map
+
+    def _get_block_slices(self, start: int, element_count: int) -> Iterator[Tuple[int, int, int, int]]:
+
+        current = start
+        stop = start + element_count
+
+        while current < stop:
+
+            block, offset = divmod(current, self._block_element_count)
+            length = min(self._block_element_count - offset, stop - current)
+
+            yield (block, offset, length, current - start)
+
+            current += length
+
+    # "disposable" methods
+    def __enter__(self) -> MemoryMappedStorage:
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        self.close()
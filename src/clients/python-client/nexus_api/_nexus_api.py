@@ -1,24 +1,38 @@
 # Python <= 3.9
 from __future__ import annotations
 
+import asyncio
 import base64
 import dataclasses
+import importlib
+import ipaddress
 import json
+import mmap
 import os
 import re
+import socket
+import tempfile
+import time
 import typing
+from abc import ABC, abstractmethod
 from array import array
+from contextvars import ContextVar, Token
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from enum import Enum
+from functools import lru_cache
+from heapq import heappop, heappush
 from json import JSONEncoder
 from pathlib import Path
-from typing import (Any, AsyncIterable, Awaitable, Iterable, Optional, Tuple,
-                    Type, TypeVar, Union)
+from typing import (Any, AsyncIterable, AsyncIterator, Awaitable, Callable,
+                    Iterable, Optional, Tuple, Type, TypeVar, Union)
 from urllib.parse import quote
+from urllib.request import getproxies
 from uuid import UUID
+from zipfile import ZipFile
 
-from httpx import AsyncClient, Request, Response, codes
+from httpx import (AsyncClient, AsyncHTTPTransport, Limits, Proxy, Request,
+                   Response, Timeout, TransportError, codes)
 
 # 0 = Namespace
 # 1 = ClientName
@@ -34,7 +48,10 @@ from httpx import AsyncClient, Request, Response, codes
 
 T = TypeVar("T")
 snake_case_pattern = re.compile('((?<=[a-z0-9])[A-Z]|(?!^)[A-Z](?=[a-z]))')
+_decoders: dict[Any, Callable[[Any], Any]] = {}
 timespan_pattern = re.compile('^(?:([0-9]+)\\.)?([0-9]{2}):([0-9]{2}):([0-9]{2})(?:\\.([0-9]+))?$')
+unit_string_pattern = re.compile('^([0-9]+)_(ns|us|ms|s|min)(?:_|$)')
+unit_string_factors = { "us": 1, "ms": 1000, "s": 1000000, "min": 60000000 }
 
 class _MyEncoder(JSONEncoder):
 
@@ -51,14 +68,16 @@ class _MyEncoder(JSONEncoder):
 
         # timedelta
         elif isinstance(value, timedelta):
-            hours, remainder = divmod(value.seconds, 3600)
-            minutes, seconds = divmod(remainder, 60)
-            result = f"{int(value.days)}.{int(hours):02}:{int(minutes):02}:{int(seconds):02}.{value.microseconds}"
+            result = _encode_timedelta(value)
 
         # enum
         elif isinstance(value, Enum):
             result = value.value
 
+        # model (specialized serializer)
+        elif hasattr(value, "to_json"):
+            result = value.to_json()
+
         # dataclass
         elif dataclasses.is_dataclass(value):
             result = {}
@@ -76,10 +95,328 @@ class _MyEncoder(JSONEncoder):
         components = value.split("_")
         return components[0] + ''.join(x.title() for x in components[1:])
 
+class JsonBackend(ABC):
+    """A JSON backend which parses response data and serializes request data."""
+
+    @abstractmethod
+    def loads(self, data: bytes) -> Any:
+        """
+        Parses JSON data.
+
+        Args:
+            data: The UTF-8 encoded JSON data.
+        """
+        pass
+
+    @abstractmethod
+    def dumps(self, value: Any) -> Union[str, bytes]:
+        """
+        Serializes a value to JSON.
+
+        Args:
+            value: The value to serialize.
+        """
+        pass
+
+class StdlibJsonBackend(JsonBackend):
+    """A JSON backend which is based on the json module of the standard library."""
+
+    def loads(self, data: bytes) -> Any:
+        return json.loads(data)
+
+    def dumps(self, value: Any) -> Union[str, bytes]:
+        return json.dumps(value, cls=_MyEncoder)
+
+class OrjsonBackend(JsonBackend):
+    """A JSON backend which is based on the orjson package (pip install orjson)."""
+
+    def __init__(self):
+        """Initializes a new instance of the OrjsonBackend."""
+
+        import orjson
+
+        self._orjson = orjson
+
+        # orjson would otherwise serialize dataclasses and date/times on its own (with snake case property names and a different date/time format)
+        self._option = orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_PASSTHROUGH_DATETIME
+        self._default = _MyEncoder().default
+
+    def loads(self, data: bytes) -> Any:
+        return self._orjson.loads(data)
+
+    def dumps(self, value: Any) -> Union[str, bytes]:
+        return self._orjson.dumps(value, default=self._default, option=self._option)
+
+def _create_json_backend() -> JsonBackend:
+
+    try:
+        return OrjsonBackend()
+
+    # orjson is not installed
+    except ImportError:
+        return StdlibJsonBackend()
+
+class TokenStore(ABC):
+    """
+    A store for refresh tokens. The methods are called from a worker thread so that blocking I/O does not stall the event loop.
+    """
+
+    @abstractmethod
+    def load(self, key: str) -> Optional[str]:
+        """
+        Loads the refresh token which is stored under the specified key or returns None if there is no such token.
+
+        Args:
+            key: The key, i.e. the refresh token the user has initially signed in with.
+        """
+        pass
+
+    @abstractmethod
+    def save(self, key: str, refresh_token: str) -> None:
+        """
+        Stores the refresh token under the specified key.
+
+        Args:
+            key: The key, i.e. the refresh token the user has initially signed in with.
+            refresh_token: The current refresh token.
+        """
+        pass
+
+class FileTokenStore(TokenStore):
+    """
+    A token store which stores each refresh token in a JSON file. The files are replaced atomically so that multiple processes can share the same folder without observing partially written tokens.
+    """
+
+    def __init__(self, folder_path: Optional[str] = None):
+        """
+        Initializes a new instance of the FileTokenStore.
+
+            Args:
+                folder_path: The folder to store the tokens in. Defaults to ~/.nexus-api/tokens.
+        """
+        self._folder_path = folder_path if folder_path is not None else os.path.join(str(Path.home()), ".nexus-api", "tokens")
+
+    @property
+    def folder_path(self) -> str:
+        """Gets the folder the tokens are stored in."""
+        return self._folder_path
+
+    def load(self, key: str) -> Optional[str]:
+
+        try:
+            with open(self._get_file_path(key)) as json_file:
+                return _decode(str, json.load(json_file))
+
+        except FileNotFoundError:
+            return None
+
+    def save(self, key: str, refresh_token: str) -> None:
+
+        Path(self._folder_path).mkdir(parents=True, exist_ok=True)
+
+        file_path = self._get_file_path(key)
+
+        # each writer gets its own temp file, so concurrent writers never interleave
+        file_descriptor, temp_file_path = tempfile.mkstemp(dir=self._folder_path, suffix=".tmp")
+
+        try:
+            with os.fdopen(file_descriptor, "w") as json_file:
+                json.dump(refresh_token, json_file, indent=4, cls=_MyEncoder)
+
+            os.replace(temp_file_path, file_path)
+
+        except BaseException:
+            os.remove(temp_file_path)
+            raise
+
+    def _get_file_path(self, key: str) -> str:
+        return os.path.join(self._folder_path, quote(key, safe="") + ".json")
+
+class MemoryTokenStore(TokenStore):
+    """A token store which keeps the refresh tokens in memory only, e.g. for tests or short-lived processes."""
+
+    def __init__(self):
+        """Initializes a new instance of the MemoryTokenStore."""
+        self._tokens: dict[str, str] = {}
+
+    def load(self, key: str) -> Optional[str]:
+        return self._tokens.get(key)
+
+    def save(self, key: str, refresh_token: str) -> None:
+        self._tokens[key] = refresh_token
+
+class KeyringTokenStore(TokenStore):
+    """A token store which is based on the system keyring via the keyring package (pip install nexus-api[keyring])."""
+
+    def __init__(self, service_name: str = "nexus-api"):
+        """
+        Initializes a new instance of the KeyringTokenStore.
+
+            Args:
+                service_name: The service name to store the tokens under.
+        """
+
+        try:
+            keyring = importlib.import_module("keyring")
+
+        except ImportError:
+            raise Exception("The KeyringTokenStore requires the keyring package (pip install nexus-api[keyring]).")
+
+        self._keyring = keyring
+        self._service_name = service_name
+
+    def load(self, key: str) -> Optional[str]:
+        return self._keyring.get_password(self._service_name, key)
+
+    def save(self, key: str, refresh_token: str) -> None:
+        self._keyring.set_password(self._service_name, key, refresh_token)
+
+@dataclass(frozen=True)
+class TransportProfile:
+    """
+    Connection pool and transport settings of the HTTP client (see NexusAsyncClient.create). Predefined profiles are available via transport_profiles.
+    """
+
+    max_connections: Optional[int] = 100
+    """The maximum number of concurrent connections (None = unlimited)."""
+
+    max_keepalive_connections: Optional[int] = 20
+    """The maximum number of idle connections which are kept alive (None = unlimited)."""
+
+    keepalive_expiry: Optional[float] = 5.0
+    """The time in seconds after which idle connections are closed."""
+
+    connect_timeout: Optional[float] = 5.0
+    """The timeout in seconds to establish a connection."""
+
+    read_timeout: Optional[float] = 5.0
+    """The timeout in seconds to receive a chunk of data."""
+
+    write_timeout: Optional[float] = 5.0
+    """The timeout in seconds to send a chunk of data."""
+
+    pool_timeout: Optional[float] = 5.0
+    """The timeout in seconds to wait for a free connection of the pool."""
+
+    http2: bool = False
+    """A value which indicates if HTTP/2 is used to multiplex requests over a single connection. This requires the h2 package (pip install httpx[http2])."""
+
+    receive_buffer_size: Optional[int] = None
+    """The optional size of the socket receive buffer in bytes (requires httpx >= 0.26)."""
+
+    def create_http_client(self, base_url: str) -> AsyncClient:
+        """
+        Creates a new HTTP client with the settings of this profile.
+
+        Args:
+            base_url: The base URL to use.
+        """
+
+        limits = Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry)
+
+        timeout = Timeout(
+            connect=self.connect_timeout,
+            read=self.read_timeout,
+            write=self.write_timeout,
+            pool=self.pool_timeout)
+
+        if self.receive_buffer_size is None:
+            return AsyncClient(base_url=base_url, timeout=timeout, limits=limits, http2=self.http2)
+
+        socket_options = [(socket.SOL_SOCKET, socket.SO_RCVBUF, self.receive_buffer_size)]
+        transport = AsyncHTTPTransport(limits=limits, http2=self.http2, socket_options=socket_options)
+
+        # a custom transport bypasses the proxy settings of the environment (HTTP_PROXY, HTTPS_PROXY, NO_PROXY), so they are mounted explicitly
+        mounts = {
+            pattern: None if proxy is None else AsyncHTTPTransport(limits=limits, http2=self.http2, socket_options=socket_options, proxy=proxy)
+            for pattern, proxy in _get_environment_proxies().items()
+        }
+
+        return AsyncClient(base_url=base_url, timeout=timeout, transport=transport, mounts=mounts)
+
+def _get_environment_proxies() -> dict[str, Optional[Proxy]]:
+
+    proxies = getproxies()
+    mounts: dict[str, Optional[Proxy]] = {}
+
+    for scheme in ("http", "https", "all"):
+
+        url = proxies.get(scheme)
+
+        if url:
+            mounts[f"{scheme}://"] = Proxy(url if "://" in url else f"http://{url}")
+
+    for host in proxies.get("no", "").split(","):
+
+        host = host.strip()
+
+        # no proxy at all
+        if host == "*":
+            return {}
+
+        elif not host:
+            continue
+
+        elif "://" in host:
+            mounts[host] = None
+
+        else:
+
+            # IP addresses must match exactly, host names also match their subdomains
+            try:
+                address = ipaddress.ip_address(host)
+                mounts[f"all://[{host}]" if address.version == 6 else f"all://{host}"] = None
+
+            except ValueError:
+                mounts[f"all://*{host.lstrip('.')}"] = None
+
+    return mounts
+
+transport_profiles: dict[str, TransportProfile] = {
+
+    # the defaults of httpx
+    "default": TransportProfile(),
+
+    # few long-running streams of large data
+    "bulk-download": TransportProfile(
+        max_connections=8,
+        max_keepalive_connections=8,
+        keepalive_expiry=60.0,
+        connect_timeout=10.0,
+        read_timeout=300.0,
+        write_timeout=300.0,
+        pool_timeout=None,
+        receive_buffer_size=4 * 2**20),
+
+    # many concurrent short requests
+    "metadata": TransportProfile(
+        max_connections=200,
+        max_keepalive_connections=100,
+        keepalive_expiry=30.0,
+        connect_timeout=5.0,
+        read_timeout=10.0,
+        write_timeout=10.0,
+        pool_timeout=60.0)
+}
+"""The predefined transport profiles by name. Custom profiles can be added."""
+
 def _decode(cls: Type[T], data: Any) -> T:
+    return _get_decoder(cls)(data)
 
-    if data is None:
-        return typing.cast(T, None)
+def _get_decoder(cls: Any) -> Callable[[Any], Any]:
+
+    decoder = _decoders.get(cls)
+
+    if decoder is None:
+        decoder = _create_decoder(cls)
+        _decoders[cls] = decoder
+
+    return decoder
+
+def _create_decoder(cls: Any) -> Callable[[Any], Any]:
 
     origin = typing.cast(Type, typing.get_origin(cls))
     args = typing.get_args(cls)
@@ -89,35 +426,23 @@ def _decode(cls: Type[T], data: Any) -> T:
         # Optional
         if origin is Union and type(None) in args:
 
-            baseType = args[0]
-            instance3 = _decode(baseType, data)
-
-            return typing.cast(T, instance3)
+            base_decoder = _get_decoder(args[0])
+            return lambda data: None if data is None else base_decoder(data)
 
         # list
         elif issubclass(origin, list):
 
-            listType = args[0]
-            instance1: list = list()
-
-            for value in data:
-                instance1.append(_decode(listType, value))
-
-            return typing.cast(T, instance1)
+            item_decoder = _get_decoder(args[0])
+            return lambda data: None if data is None else [item_decoder(value) for value in data]
         
         # dict
         elif issubclass(origin, dict):
 
-            keyType = args[0]
-            valueType = args[1]
-
-            instance2: dict = dict()
+            key_decoder = _get_decoder(args[0])
+            value_decoder = _get_decoder(args[1])
 
-            for key, value in data.items():
-                key = snake_case_pattern.sub(r'_\1', key).lower()
-                instance2[_decode(keyType, key)] = _decode(valueType, value)
-
-            return typing.cast(T, instance2)
+            return lambda data: None if data is None else \
+                { key_decoder(_to_snake_case(key)): value_decoder(value) for key, value in data.items() }
 
         # default
         else:
@@ -125,66 +450,150 @@ def _decode(cls: Type[T], data: Any) -> T:
 
     # datetime
     elif issubclass(cls, datetime):
-        return typing.cast(T, datetime.strptime(data[:-1], "%Y-%m-%dT%H:%M:%S.%f"))
+        return _decode_datetime
 
     # timedelta
     elif issubclass(cls, timedelta):
-        # ^(?:([0-9]+)\.)?([0-9]Nexus-Configuration):([0-9]Nexus-Configuration):([0-9]Nexus-Configuration)(?:\.([0-9]+))?$
-        # 12:08:07
-        # 12:08:07.1250000
-        # 3000.00:08:07
-        # 3000.00:08:07.1250000
-        match = timespan_pattern.match(data)
-
-        if match:
-            days = int(match.group(1)) if match.group(1) else 0
-            hours = int(match.group(2)) if match.group(2) else 0
-            minutes = int(match.group(3)) if match.group(3) else 0
-            seconds = int(match.group(4)) if match.group(4) else 0
-            milliseconds = int(match.group(5)) if match.group(5) else 0
-
-            return typing.cast(T, timedelta(days=days, hours=hours, minutes=minutes, seconds=seconds, milliseconds=milliseconds))
-
-        else:
-            raise Exception(f"Unable to deserialize {data} into value of type timedelta.")
+        return _decode_timedelta
 
     # UUID
     elif issubclass(cls, UUID):
-        return typing.cast(T, UUID(data))
-       
+        return lambda data: None if data is None else UUID(data)
+
+    # enum
+    elif issubclass(cls, Enum):
+
+        # accept the member values (e.g. RAN_TO_COMPLETION) and the member names used by the server (e.g. RanToCompletion)
+        members = { member.value: member for member in cls }
+
+        def decode_enum(data: Any) -> Any:
+
+            if data is None:
+                return None
+
+            member = members.get(data)
+
+            if member is None:
+                member = cls(_to_snake_case(data).upper())
+                members[data] = member
+
+            return member
+
+        return decode_enum
+
     # dataclass
     elif dataclasses.is_dataclass(cls):
 
-        p = []
+        # the field decoders are resolved on first use to support recursive types
+        type_hints: dict[str, Any] = {}
+        field_decoders: dict[str, Tuple[str, Callable[[Any], Any]]] = {}
+        create_instance = typing.cast(Callable[..., Any], cls)
+
+        def decode_dataclass(data: Any) -> Any:
+
+            if data is None:
+                return None
 
-        for name, value in data.items():
+            if not type_hints:
+                type_hints.update(typing.get_type_hints(cls))
 
-            type_hints = typing.get_type_hints(cls)
-            name = snake_case_pattern.sub(r'_\1', name).lower()
-            parameterType = typing.cast(Type, type_hints.get(name))
-            value = _decode(parameterType, value)
+            parameters: dict[str, Any] = {}
 
-            p.append(value)
+            for key, value in data.items():
+
+                field_decoder = field_decoders.get(key)
+
+                if field_decoder is None:
+
+                    name = _to_snake_case(key)
+                    parameter_type = type_hints.get(name)
+
+                    # ignore unknown properties
+                    if parameter_type is None:
+                        continue
+
+                    field_decoder = (name, _get_decoder(parameter_type))
+                    field_decoders[key] = field_decoder
+
+                parameters[field_decoder[0]] = field_decoder[1](value)
+
+            return create_instance(**parameters)
 
-        parameters_count = len(p)
+        # prefer the specialized deserializer of the model
+        from_json = getattr(cls, "from_json", None)
 
-        if (parameters_count == 0): return cls()
-        if (parameters_count == 1): return cls(p[0])
-        if (parameters_count == 2): return cls(p[0], p[1])
-        if (parameters_count == 3): return cls(p[0], p[1], p[2])
-        if (parameters_count == 4): return cls(p[0], p[1], p[2], p[3])
-        if (parameters_count == 5): return cls(p[0], p[1], p[2], p[3], p[4])
-        if (parameters_count == 6): return cls(p[0], p[1], p[2], p[3], p[4], p[5])
-        if (parameters_count == 7): return cls(p[0], p[1], p[2], p[3], p[4], p[5], p[6])
-        if (parameters_count == 8): return cls(p[0], p[1], p[2], p[3], p[4], p[5], p[6], p[7])
-        if (parameters_count == 9): return cls(p[0], p[1], p[2], p[3], p[4], p[5], p[6], p[7], p[8])
-        if (parameters_count == 10): return cls(p[0], p[1], p[2], p[3], p[4], p[5], p[6], p[7], p[8], p[9])
+        if from_json is None:
+            return decode_dataclass
 
-        raise Exception("Dataclasses with more than 10 parameters cannot be deserialized.")
+        camel_case_keys = frozenset(_to_camel_case(field.name) for field in dataclasses.fields(cls))
+
+        def decode_model(data: Any) -> Any:
+
+            if data is None:
+                return None
+
+            # the specialized deserializer only supports camel case property names
+            if camel_case_keys.isdisjoint(data):
+                return decode_dataclass(data)
+
+            return from_json(data)
+
+        return decode_model
 
     # default
     else:
-        return data
+        return _decode_value
+
+def _decode_value(data: Any) -> Any:
+    return data
+
+def _decode_datetime(data: Any) -> Any:
+
+    if data is None:
+        return None
+
+    return datetime.strptime(data[:-1], "%Y-%m-%dT%H:%M:%S.%f")
+
+def _decode_timedelta(data: Any) -> Any:
+
+    if data is None:
+        return None
+
+    # 12:08:07
+    # 12:08:07.1250000
+    # 3000.00:08:07
+    # 3000.00:08:07.1250000
+    match = timespan_pattern.match(data)
+
+    if match:
+        days = int(match.group(1)) if match.group(1) else 0
+        hours = int(match.group(2)) if match.group(2) else 0
+        minutes = int(match.group(3)) if match.group(3) else 0
+        seconds = int(match.group(4)) if match.group(4) else 0
+        # the fraction of a second has up to 7 digits (ticks)
+        microseconds = int(match.group(5)[:6].ljust(6, "0")) if match.group(5) else 0
+
+        return timedelta(days=days, hours=hours, minutes=minutes, seconds=seconds, microseconds=microseconds)
+
+    else:
+        raise Exception(f"Unable to deserialize {data} into value of type timedelta.")
+
+def _encode_timedelta(value: timedelta) -> str:
+    hours, remainder = divmod(value.seconds, 3600)
+    minutes, seconds = divmod(remainder, 60)
+    return f"{int(value.days)}.{int(hours):02}:{int(minutes):02}:{int(seconds):02}.{value.microseconds:06}"
+
+@lru_cache(maxsize=4096)
+def _to_snake_case(value: str) -> str:
+    return snake_case_pattern.sub(r'_\1', value).lower()
+
+def _to_camel_case(value: str) -> str:
+    components = value.split("_")
+    return components[0] + ''.join(x.title() for x in components[1:])
+
+@lru_cache(maxsize=1024)
+def _encode_configuration(configuration: Tuple[Tuple[str, str], ...]) -> str:
+    return base64.b64encode(json.dumps(dict(configuration)).encode("utf-8")).decode("utf-8")
 
 def _to_string(value: Any) -> str:
 
@@ -194,6 +603,147 @@ def _to_string(value: Any) -> str:
     else:
         return str(value)
 
+def _to_sample_period(resource_path: str) -> timedelta:
+
+    # /a/b/c/T1/10_ms, /a/b/c/T1/10_min_mean or /a/b/c/T1/10_min_mean#base=1_s
+    representation_id = resource_path.split("#")[0].split("/")[-1]
+    match = unit_string_pattern.match(representation_id)
+
+    if not match:
+        raise Exception(f"Unable to determine the sample period of resource path {resource_path}.")
+
+    value = int(match.group(1))
+    unit = match.group(2)
+
+    # timedelta has a resolution of one microsecond
+    if unit == "ns":
+
+        if value % 1000 != 0:
+            raise Exception(f"The sample period of resource path {resource_path} is less than one microsecond and cannot be represented as timedelta.")
+
+        return timedelta(microseconds=value // 1000)
+
+    return timedelta(microseconds=value * unit_string_factors[unit])
+
+def _to_element_count(begin: datetime, end: datetime, sample_period: timedelta) -> int:
+
+    if end <= begin:
+        raise Exception("The end date/time must be greater than the begin date/time.")
+
+    if (end - begin) % sample_period != timedelta(0):
+        raise Exception("The period must be a multiple of the sample period.")
+
+    return (end - begin) // sample_period
+
+def _create_semaphore(max_concurrency: int) -> asyncio.Semaphore:
+
+    if max_concurrency <= 0:
+        raise Exception("The maximum concurrency must be greater than zero.")
+
+    return asyncio.Semaphore(max_concurrency)
+
+def _get_token_expiration(access_token: str) -> Optional[float]:
+
+    # the access token is a JWT (header.payload.signature) with the expiration time (exp) in its payload
+    try:
+        payload = access_token.split(".")[1]
+        jsonObject = json.loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+
+        return float(jsonObject["exp"])
+
+    except Exception:
+        return None
+
+class _RateLimiter:
+
+    def __init__(self, bytes_per_second: float):
+
+        if bytes_per_second <= 0:
+            raise Exception("The byte rate must be greater than zero.")
+
+        self._bytes_per_second = bytes_per_second
+        self._next_time = 0.0
+
+    async def acquire(self, byte_count: int):
+
+        # reserve the next free time slot
+        now = asyncio.get_running_loop().time()
+        start = max(now, self._next_time)
+        self._next_time = start + byte_count / self._bytes_per_second
+
+        if start > now:
+            await asyncio.sleep(start - now)
+
+class _FileChunks:
+
+    # this object can be iterated multiple times so that requests can be sent again after a token refresh
+    def __init__(self, file_path: str, chunk_size: int, rate_limiter: Optional[_RateLimiter]):
+
+        if chunk_size <= 0:
+            raise Exception("The chunk size must be greater than zero.")
+
+        self._file_path = file_path
+        self._chunk_size = chunk_size
+        self._rate_limiter = rate_limiter
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+
+        with open(self._file_path, "rb") as file:
+
+            length = os.fstat(file.fileno()).st_size
+
+            # empty files cannot be mapped
+            if length == 0:
+                return
+
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as memory_map:
+
+                for offset in range(0, length, self._chunk_size):
+
+                    chunk = memory_map[offset:offset + self._chunk_size]
+
+                    if self._rate_limiter is not None:
+                        await self._rate_limiter.acquire(len(chunk))
+
+                    yield chunk
+
+async def _gather(awaitables: Iterable[Awaitable[T]]) -> list[T]:
+
+    # unlike asyncio.gather, cancel all remaining tasks on the first error
+    tasks = [asyncio.ensure_future(awaitable) for awaitable in awaitables]
+
+    try:
+        return await asyncio.gather(*tasks)
+
+    except:
+        for task in tasks:
+            task.cancel()
+
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+def _split_export_parameters(parameters: ExportParameters, shards: int) -> list[ExportParameters]:
+
+    begin = parameters.begin
+    end = parameters.end
+    file_period = parameters.file_period
+
+    # a zero file period means that there is only a single file
+    if shards <= 1 or file_period <= timedelta(0):
+        return [parameters]
+
+    # the file boundaries are multiples of the file period since 0001-01-01
+    epoch = datetime(1, 1, 1, tzinfo=begin.tzinfo)
+    first_boundary = epoch + ((begin - epoch) // file_period + 1) * file_period
+    boundary_count = -(-(end - first_boundary) // file_period) if end > first_boundary else 0
+    file_count = boundary_count + 1
+    shards = min(shards, file_count)
+
+    # distribute the files evenly
+    cuts = [begin] + [first_boundary + (i * file_count // shards - 1) * file_period for i in range(1, shards)] + [end]
+
+    return [dataclasses.replace(parameters, begin=shard_begin, end=shard_end) for shard_begin, shard_end in zip(cuts, cuts[1:])]
+
 class StreamResponse:
     """A stream response."""
 
@@ -214,6 +764,72 @@ class StreamResponse:
 
         return doubleBuffer 
 
+    async def iter_doubles(self, chunk_elements: int = 65536) -> AsyncIterator[array[float]]:
+        """
+        Iterates over the data in blocks of floats as they are received. In contrast to read_as_double, the response is never buffered as a whole.
+
+        Args:
+            chunk_elements: The maximum number of floats per block.
+        """
+
+        if chunk_elements <= 0:
+            raise Exception("The number of elements per chunk must be greater than zero.")
+
+        chunk_size = chunk_elements * 8
+        byteBuffer = bytearray()
+
+        async for chunk in self._response.aiter_bytes(chunk_size):
+
+            byteBuffer += chunk
+
+            # emit full blocks only and keep the remainder for the next chunk
+            # so that the blocks stay aligned to 8-byte boundaries
+            while len(byteBuffer) >= chunk_size:
+                yield array("d", byteBuffer[:chunk_size])
+                del byteBuffer[:chunk_size]
+
+        if len(byteBuffer) % 8 != 0:
+            raise Exception("The data length is invalid.")
+
+        if byteBuffer:
+            yield array("d", byteBuffer)
+
+    async def read_into(self, target: Any) -> int:
+        """
+        Reads the data into the provided buffer without allocating an intermediate array and returns the number of floats written.
+
+        Args:
+            target: A writable, contiguous buffer of float64 values (e.g. an array("d") or a numpy.ndarray of type float64) or of raw bytes (e.g. a bytearray).
+        """
+
+        view = memoryview(target)
+
+        # other element types would silently receive the raw float64 bytes
+        if view.format not in ("d", "B"):
+            raise Exception(f"The target buffer must contain float64 values or raw bytes but its format is '{view.format}'.")
+
+        targetBuffer = view.cast("B")
+
+        if targetBuffer.readonly:
+            raise Exception("The target buffer must be writable.")
+
+        offset = 0
+
+        async for chunk in self._response.aiter_bytes():
+
+            length = len(chunk)
+
+            if offset + length > len(targetBuffer):
+                raise Exception("The target buffer is too small.")
+
+            targetBuffer[offset:offset + length] = chunk
+            offset += length
+
+        if offset % 8 != 0:
+            raise Exception("The data length is invalid.")
+
+        return offset // 8
+
     @property
     def response(self) -> Response:
         """Gets the underlying response."""
@@ -240,16 +856,20 @@ class NexusException(Exception):
 
 class _DisposableConfiguration:
     _client : NexusAsyncClient
+    _token: Token
 
-    def __init__(self, client: NexusAsyncClient):
+    def __init__(self, client: NexusAsyncClient, token: Token):
         self._client = client
+        self._token = token
 
     # "disposable" methods
     def __enter__(self):
         pass
 
     def __exit__(self, exc_type, exc_value, exc_traceback):
-        self._client.clear_configuration()
+
+        # restore the configuration which was active before
+        self._client._configuration.reset(self._token)
 
 @dataclass
 class ResourceCatalog:
@@ -271,6 +891,20 @@ class ResourceCatalog:
     resources: Optional[list[Resource]]
     """Gets the list of representations."""
 
+    @staticmethod
+    def from_json(data: Any) -> ResourceCatalog:
+        return ResourceCatalog(
+            id=data["id"],
+            properties=data.get("properties"),
+            resources=None if data.get("resources") is None else [Resource.from_json(value) for value in data.get("resources")])
+
+    def to_json(self) -> dict[str, Any]:
+        return {
+            "id": self.id,
+            "properties": self.properties,
+            "resources": None if self.resources is None else [value.to_json() for value in self.resources]
+        }
+
 
 @dataclass
 class Resource:
@@ -292,6 +926,20 @@ class Resource:
     representations: Optional[list[Representation]]
     """Gets the list of representations."""
 
+    @staticmethod
+    def from_json(data: Any) -> Resource:
+        return Resource(
+            id=data["id"],
+            properties=data.get("properties"),
+            representations=None if data.get("representations") is None else [Representation.from_json(value) for value in data.get("representations")])
+
+    def to_json(self) -> dict[str, Any]:
+        return {
+            "id": self.id,
+            "properties": self.properties,
+            "representations": None if self.representations is None else [value.to_json() for value in self.representations]
+        }
+
 
 @dataclass
 class Representation:
@@ -309,6 +957,18 @@ class Representation:
     sample_period: timedelta
     """The sample period."""
 
+    @staticmethod
+    def from_json(data: Any) -> Representation:
+        return Representation(
+            data_type=_decode(NexusDataType, data["dataType"]),
+            sample_period=_decode_timedelta(data["samplePeriod"]))
+
+    def to_json(self) -> dict[str, Any]:
+        return {
+            "dataType": self.data_type.value,
+            "samplePeriod": _encode_timedelta(self.sample_period)
+        }
+
 
 class NexusDataType(Enum):
     """Specifies the Nexus data type."""
@@ -404,6 +1064,40 @@ class CatalogInfo:
     package_reference_id: UUID
     """The package reference identifier."""
 
+    @staticmethod
+    def from_json(data: Any) -> CatalogInfo:
+        return CatalogInfo(
+            id=data["id"],
+            title=data["title"],
+            contact=data.get("contact"),
+            license=data.get("license"),
+            is_readable=data["isReadable"],
+            is_writable=data["isWritable"],
+            is_released=data["isReleased"],
+            is_visible=data["isVisible"],
+            is_owner=data["isOwner"],
+            data_source_info_url=data.get("dataSourceInfoUrl"),
+            data_source_type=data["dataSourceType"],
+            data_source_registration_id=UUID(data["dataSourceRegistrationId"]),
+            package_reference_id=UUID(data["packageReferenceId"]))
+
+    def to_json(self) -> dict[str, Any]:
+        return {
+            "id": self.id,
+            "title": self.title,
+            "contact": self.contact,
+            "license": self.license,
+            "isReadable": self.is_readable,
+            "isWritable": self.is_writable,
+            "isReleased": self.is_released,
+            "isVisible": self.is_visible,
+            "isOwner": self.is_owner,
+            "dataSourceInfoUrl": self.data_source_info_url,
+            "dataSourceType": self.data_source_type,
+            "dataSourceRegistrationId": str(self.data_source_registration_id),
+            "packageReferenceId": str(self.package_reference_id)
+        }
+
 
 @dataclass
 class CatalogTimeRange:
@@ -421,6 +1115,18 @@ class CatalogTimeRange:
     end: datetime
     """The date/time of the last data in the catalog."""
 
+    @staticmethod
+    def from_json(data: Any) -> CatalogTimeRange:
+        return CatalogTimeRange(
+            begin=_decode_datetime(data["begin"]),
+            end=_decode_datetime(data["end"]))
+
+    def to_json(self) -> dict[str, Any]:
+        return {
+            "begin": self.begin.isoformat(),
+            "end": self.end.isoformat()
+        }
+
 
 @dataclass
 class CatalogAvailability:
@@ -434,6 +1140,16 @@ class CatalogAvailability:
     data: list[float]
     """The actual availability data."""
 
+    @staticmethod
+    def from_json(data: Any) -> CatalogAvailability:
+        return CatalogAvailability(
+            data=data["data"])
+
+    def to_json(self) -> dict[str, Any]:
+        return {
+            "data": self.data
+        }
+
 
 @dataclass
 class CatalogMetadata:
@@ -455,6 +1171,20 @@ class CatalogMetadata:
     overrides: Optional[ResourceCatalog]
     """Overrides for the catalog."""
 
+    @staticmethod
+    def from_json(data: Any) -> CatalogMetadata:
+        return CatalogMetadata(
+            contact=data.get("contact"),
+            group_memberships=data.get("groupMemberships"),
+            overrides=None if data.get("overrides") is None else ResourceCatalog.from_json(data.get("overrides")))
+
+    def to_json(self) -> dict[str, Any]:
+        return {
+            "contact": self.contact,
+            "groupMemberships": self.group_memberships,
+            "overrides": None if self.overrides is None else self.overrides.to_json()
+        }
+
 
 @dataclass
 class Job:
@@ -480,6 +1210,22 @@ class Job:
     parameters: Optional[object]
     """The job parameters."""
 
+    @staticmethod
+    def from_json(data: Any) -> Job:
+        return Job(
+            id=UUID(data["id"]),
+            type=data["type"],
+            owner=data["owner"],
+            parameters=data.get("parameters"))
+
+    def to_json(self) -> dict[str, Any]:
+        return {
+            "id": str(self.id),
+            "type": self.type,
+            "owner": self.owner,
+            "parameters": self.parameters
+        }
+
 
 @dataclass
 class JobStatus:
@@ -509,6 +1255,24 @@ class JobStatus:
     result: Optional[object]
     """The nullable result."""
 
+    @staticmethod
+    def from_json(data: Any) -> JobStatus:
+        return JobStatus(
+            start=_decode_datetime(data["start"]),
+            status=_decode(TaskStatus, data["status"]),
+            progress=data["progress"],
+            exception_message=data.get("exceptionMessage"),
+            result=data.get("result"))
+
+    def to_json(self) -> dict[str, Any]:
+        return {
+            "start": self.start.isoformat(),
+            "status": self.status.value,
+            "progress": self.progress,
+            "exceptionMessage": self.exception_message,
+            "result": self.result
+        }
+
 
 class TaskStatus(Enum):
     """"""
@@ -534,275 +1298,1039 @@ class TaskStatus(Enum):
     CANCELED = "CANCELED"
     """Canceled""",
 
-    FAULTED = "FAULTED"
-    """Faulted"""
+    FAULTED = "FAULTED"
+    """Faulted"""
+
+
+@dataclass
+class ExportParameters:
+    """
+    A structure for export parameters.
+
+    Args:
+        begin: The start date/time.
+        end: The end date/time.
+        file_period: The file period.
+        type: The writer type.
+        resource_paths: The resource paths to export.
+        configuration: The configuration.
+    """
+
+    begin: datetime
+    """The start date/time."""
+
+    end: datetime
+    """The end date/time."""
+
+    file_period: timedelta
+    """The file period."""
+
+    type: str
+    """The writer type."""
+
+    resource_paths: list[str]
+    """The resource paths to export."""
+
+    configuration: dict[str, str]
+    """The configuration."""
+
+    @staticmethod
+    def from_json(data: Any) -> ExportParameters:
+        return ExportParameters(
+            begin=_decode_datetime(data["begin"]),
+            end=_decode_datetime(data["end"]),
+            file_period=_decode_timedelta(data["filePeriod"]),
+            type=data["type"],
+            resource_paths=data["resourcePaths"],
+            configuration={ _to_snake_case(key): value for key, value in data["configuration"].items() })
+
+    def to_json(self) -> dict[str, Any]:
+        return {
+            "begin": self.begin.isoformat(),
+            "end": self.end.isoformat(),
+            "filePeriod": _encode_timedelta(self.file_period),
+            "type": self.type,
+            "resourcePaths": self.resource_paths,
+            "configuration": self.configuration
+        }
+
+
+@dataclass
+class PackageReference:
+    """
+    A package reference.
+
+    Args:
+        id: The unique identifier of the package reference.
+        provider: The provider which loads the package.
+        configuration: The configuration of the package reference.
+    """
+
+    id: UUID
+    """The unique identifier of the package reference."""
+
+    provider: str
+    """The provider which loads the package."""
+
+    configuration: dict[str, str]
+    """The configuration of the package reference."""
+
+    @staticmethod
+    def from_json(data: Any) -> PackageReference:
+        return PackageReference(
+            id=UUID(data["id"]),
+            provider=data["provider"],
+            configuration={ _to_snake_case(key): value for key, value in data["configuration"].items() })
+
+    def to_json(self) -> dict[str, Any]:
+        return {
+            "id": str(self.id),
+            "provider": self.provider,
+            "configuration": self.configuration
+        }
+
+
+@dataclass
+class ExtensionDescription:
+    """
+    An extension description.
+
+    Args:
+        type: The extension type.
+        description: A nullable description.
+        project_url: A nullable project website URL.
+        repository_url: A nullable source repository URL.
+        additional_info: A nullable dictionary with additional information.
+    """
+
+    type: str
+    """The extension type."""
+
+    description: Optional[str]
+    """A nullable description."""
+
+    project_url: Optional[str]
+    """A nullable project website URL."""
+
+    repository_url: Optional[str]
+    """A nullable source repository URL."""
+
+    additional_info: Optional[dict[str, str]]
+    """A nullable dictionary with additional information."""
+
+    @staticmethod
+    def from_json(data: Any) -> ExtensionDescription:
+        return ExtensionDescription(
+            type=data["type"],
+            description=data.get("description"),
+            project_url=data.get("projectUrl"),
+            repository_url=data.get("repositoryUrl"),
+            additional_info=None if data.get("additionalInfo") is None else { _to_snake_case(key): value for key, value in data.get("additionalInfo").items() })
+
+    def to_json(self) -> dict[str, Any]:
+        return {
+            "type": self.type,
+            "description": self.description,
+            "projectUrl": self.project_url,
+            "repositoryUrl": self.repository_url,
+            "additionalInfo": self.additional_info
+        }
+
+
+@dataclass
+class DataSourceRegistration:
+    """
+    A data source registration.
+
+    Args:
+        id: The unique identifier of the data source registration.
+        type: The type of the data source.
+        resource_locator: An URL which points to the data.
+        configuration: Configuration parameters for the instantiated source.
+        info_url: An optional info URL.
+        release_pattern: An optional regular expressions pattern to select the catalogs to be released. By default, all catalogs will be released.
+        visibility_pattern: An optional regular expressions pattern to select the catalogs to be visible. By default, all catalogs will be visible.
+    """
+
+    id: UUID
+    """The unique identifier of the data source registration."""
+
+    type: str
+    """The type of the data source."""
+
+    resource_locator: str
+    """An URL which points to the data."""
+
+    configuration: dict[str, str]
+    """Configuration parameters for the instantiated source."""
+
+    info_url: Optional[str]
+    """An optional info URL."""
+
+    release_pattern: str
+    """An optional regular expressions pattern to select the catalogs to be released. By default, all catalogs will be released."""
+
+    visibility_pattern: str
+    """An optional regular expressions pattern to select the catalogs to be visible. By default, all catalogs will be visible."""
+
+    @staticmethod
+    def from_json(data: Any) -> DataSourceRegistration:
+        return DataSourceRegistration(
+            id=UUID(data["id"]),
+            type=data["type"],
+            resource_locator=data["resourceLocator"],
+            configuration={ _to_snake_case(key): value for key, value in data["configuration"].items() },
+            info_url=data.get("infoUrl"),
+            release_pattern=data["releasePattern"],
+            visibility_pattern=data["visibilityPattern"])
+
+    def to_json(self) -> dict[str, Any]:
+        return {
+            "id": str(self.id),
+            "type": self.type,
+            "resourceLocator": self.resource_locator,
+            "configuration": self.configuration,
+            "infoUrl": self.info_url,
+            "releasePattern": self.release_pattern,
+            "visibilityPattern": self.visibility_pattern
+        }
+
+
+@dataclass
+class AuthenticationSchemeDescription:
+    """
+    Describes an OpenID connect provider.
+
+    Args:
+        scheme: The scheme.
+        display_name: The display name.
+    """
+
+    scheme: str
+    """The scheme."""
+
+    display_name: str
+    """The display name."""
+
+    @staticmethod
+    def from_json(data: Any) -> AuthenticationSchemeDescription:
+        return AuthenticationSchemeDescription(
+            scheme=data["scheme"],
+            display_name=data["displayName"])
+
+    def to_json(self) -> dict[str, Any]:
+        return {
+            "scheme": self.scheme,
+            "displayName": self.display_name
+        }
+
+
+@dataclass
+class TokenPair:
+    """
+    A token pair.
+
+    Args:
+        access_token: The JWT token.
+        refresh_token: The refresh token.
+    """
+
+    access_token: str
+    """The JWT token."""
+
+    refresh_token: str
+    """The refresh token."""
+
+    @staticmethod
+    def from_json(data: Any) -> TokenPair:
+        return TokenPair(
+            access_token=data["accessToken"],
+            refresh_token=data["refreshToken"])
+
+    def to_json(self) -> dict[str, Any]:
+        return {
+            "accessToken": self.access_token,
+            "refreshToken": self.refresh_token
+        }
+
+
+@dataclass
+class RefreshTokenRequest:
+    """
+    A refresh token request.
+
+    Args:
+        refresh_token: The refresh token.
+    """
+
+    refresh_token: str
+    """The refresh token."""
+
+    @staticmethod
+    def from_json(data: Any) -> RefreshTokenRequest:
+        return RefreshTokenRequest(
+            refresh_token=data["refreshToken"])
+
+    def to_json(self) -> dict[str, Any]:
+        return {
+            "refreshToken": self.refresh_token
+        }
+
+
+@dataclass
+class RevokeTokenRequest:
+    """
+    A revoke token request.
+
+    Args:
+        token: The refresh token.
+    """
+
+    token: str
+    """The refresh token."""
+
+    @staticmethod
+    def from_json(data: Any) -> RevokeTokenRequest:
+        return RevokeTokenRequest(
+            token=data["token"])
+
+    def to_json(self) -> dict[str, Any]:
+        return {
+            "token": self.token
+        }
+
+
+@dataclass
+class NexusUser:
+    """
+    Represents a user.
+
+    Args:
+        id: The user identifier.
+        name: The user name.
+        refresh_tokens: The list of refresh tokens.
+        claims: The map of claims.
+    """
+
+    id: str
+    """The user identifier."""
+
+    name: str
+    """The user name."""
+
+    refresh_tokens: list[RefreshToken]
+    """The list of refresh tokens."""
+
+    claims: dict[str, NexusClaim]
+    """The map of claims."""
+
+    @staticmethod
+    def from_json(data: Any) -> NexusUser:
+        return NexusUser(
+            id=data["id"],
+            name=data["name"],
+            refresh_tokens=[RefreshToken.from_json(value) for value in data["refreshTokens"]],
+            claims={ _to_snake_case(key): NexusClaim.from_json(value) for key, value in data["claims"].items() })
+
+    def to_json(self) -> dict[str, Any]:
+        return {
+            "id": self.id,
+            "name": self.name,
+            "refreshTokens": [value.to_json() for value in self.refresh_tokens],
+            "claims": { key: value.to_json() for key, value in self.claims.items() }
+        }
+
+
+@dataclass
+class RefreshToken:
+    """
+    A refresh token.
+
+    Args:
+        token: The refresh token.
+        created: The date/time when the token was created.
+        expires: The date/time when the token expires.
+        revoked: The date/time when the token was revoked.
+        replaced_by_token: The token that replaced this one.
+        is_expired: A boolean that indicates if the token has expired.
+        is_revoked: A boolean that indicates if the token has been revoked.
+        is_active: A boolean that indicates if the token is active.
+    """
+
+    token: str
+    """The refresh token."""
+
+    created: datetime
+    """The date/time when the token was created."""
+
+    expires: datetime
+    """The date/time when the token expires."""
+
+    revoked: Optional[datetime]
+    """The date/time when the token was revoked."""
+
+    replaced_by_token: Optional[str]
+    """The token that replaced this one."""
+
+    is_expired: bool
+    """A boolean that indicates if the token has expired."""
+
+    is_revoked: bool
+    """A boolean that indicates if the token has been revoked."""
+
+    is_active: bool
+    """A boolean that indicates if the token is active."""
+
+    @staticmethod
+    def from_json(data: Any) -> RefreshToken:
+        return RefreshToken(
+            token=data["token"],
+            created=_decode_datetime(data["created"]),
+            expires=_decode_datetime(data["expires"]),
+            revoked=None if data.get("revoked") is None else _decode_datetime(data.get("revoked")),
+            replaced_by_token=data.get("replacedByToken"),
+            is_expired=data["isExpired"],
+            is_revoked=data["isRevoked"],
+            is_active=data["isActive"])
+
+    def to_json(self) -> dict[str, Any]:
+        return {
+            "token": self.token,
+            "created": self.created.isoformat(),
+            "expires": self.expires.isoformat(),
+            "revoked": None if self.revoked is None else self.revoked.isoformat(),
+            "replacedByToken": self.replaced_by_token,
+            "isExpired": self.is_expired,
+            "isRevoked": self.is_revoked,
+            "isActive": self.is_active
+        }
+
+
+@dataclass
+class NexusClaim:
+    """
+    Represents a claim.
+
+    Args:
+        type: The claim type.
+        value: The claim value.
+    """
+
+    type: str
+    """The claim type."""
+
+    value: str
+    """The claim value."""
+
+    @staticmethod
+    def from_json(data: Any) -> NexusClaim:
+        return NexusClaim(
+            type=data["type"],
+            value=data["value"])
+
+    def to_json(self) -> dict[str, Any]:
+        return {
+            "type": self.type,
+            "value": self.value
+        }
+
+
+
+class _ArtifactsClientExtensions:
+    """Provides extension methods to interact with artifacts."""
+
+    _client: NexusAsyncClient
+
+    async def download_to(
+        self,
+        artifact_id: str,
+        file_path: str,
+        chunk_size: int = 2**20,
+        max_retries: int = 3) -> None:
+        """
+        Downloads the specified artifact to a file without buffering it in memory. The data is first written to a temporary file (file_path + ".part") which is renamed when its size has been verified. Downloads which are interrupted during this call are resumed with HTTP range requests. An existing temporary file from a previous call is discarded.
+
+        Args:
+            artifact_id: The artifact identifier.
+            file_path: The path of the target file.
+            chunk_size: The size of the chunks which are written to the file.
+            max_retries: The maximum number of retries after an interrupted download.
+        """
+
+        url = f"/api/v1/artifacts/{quote(artifact_id, safe='')}"
+        temp_file_path = file_path + ".part"
+
+        # the temporary file of a previous call may belong to a different version of the artifact
+        offset = 0
+        validator: Optional[str] = None
+
+        for attempt in range(max_retries + 1):
+
+            headers = None
+
+            if offset > 0:
+                headers = { "Range": f"bytes={offset}-" }
+
+                # the server sends the complete artifact (200) instead of the range if it has changed in the meantime
+                if validator is not None:
+                    headers["If-Range"] = validator
+
+            try:
+
+                async with await self._client._invoke_async(StreamResponse, "GET", url, "application/octet-stream", None, None, headers) as stream_response:
+
+                    response = stream_response.response
+
+                    # the server does not support range requests or the artifact has changed
+                    if response.status_code != codes.PARTIAL_CONTENT:
+                        offset = 0
+
+                        # weak entity tags must not be used with If-Range
+                        etag = response.headers.get("ETag")
+                        validator = etag if etag is not None and not etag.startswith("W/") else response.headers.get("Last-Modified")
+
+                    content_length = response.headers.get("Content-Length")
+                    expected_size = None if content_length is None else offset + int(content_length)
+
+                    with open(temp_file_path, "ab" if offset > 0 else "wb") as file:
+
+                        try:
+                            async for chunk in response.aiter_bytes(chunk_size):
+                                file.write(chunk)
+
+                        finally:
+                            offset = file.tell()
+
+                        size = offset
+
+            except TransportError:
+
+                if attempt == max_retries:
+                    raise
+
+                continue
+
+            # the download has been interrupted without error
+            if expected_size is not None and size != expected_size:
+                continue
+
+            os.replace(temp_file_path, file_path)
+            return
+
+        raise Exception(f"The artifact {artifact_id} could not be downloaded completely.")
+
+class _CatalogsClientExtensions:
+    """Provides extension methods to interact with catalogs."""
+
+    _client: NexusAsyncClient
+
+    async def upload_attachment_from_path(
+        self,
+        catalog_id: str,
+        attachment_id: str,
+        file_path: str,
+        chunk_size: int = 2**20) -> None:
+        """
+        Uploads the specified file as an attachment. The file is memory-mapped and streamed in chunks, i.e. it is never loaded into memory completely.
+
+        Args:
+            catalog_id: The catalog identifier.
+            attachment_id: The attachment identifier.
+            file_path: The path of the file to upload.
+            chunk_size: The size of the uploaded chunks.
+        """
+        await self._upload_attachment_from_path(catalog_id, attachment_id, file_path, chunk_size, None)
+
+    async def upload_attachments_from_paths(
+        self,
+        attachments: Iterable[Tuple[str, str, str]],
+        max_concurrency: int = 4,
+        max_bytes_per_second: Optional[float] = None,
+        chunk_size: int = 2**20) -> None:
+        """
+        Uploads the specified files as attachments concurrently. The files are memory-mapped and streamed in chunks.
+
+        Args:
+            attachments: The (catalog identifier, attachment identifier, file path) tuples.
+            max_concurrency: The maximum number of concurrent uploads.
+            max_bytes_per_second: The optional maximum upload rate of all uploads together.
+            chunk_size: The size of the uploaded chunks.
+        """
+
+        semaphore = _create_semaphore(max_concurrency)
+        rate_limiter = None if max_bytes_per_second is None else _RateLimiter(max_bytes_per_second)
+
+        async def upload(catalog_id: str, attachment_id: str, file_path: str):
+            async with semaphore:
+                await self._upload_attachment_from_path(catalog_id, attachment_id, file_path, chunk_size, rate_limiter)
+
+        await _gather(upload(catalog_id, attachment_id, file_path) for catalog_id, attachment_id, file_path in attachments)
+
+    async def _upload_attachment_from_path(
+        self,
+        catalog_id: str,
+        attachment_id: str,
+        file_path: str,
+        chunk_size: int,
+        rate_limiter: Optional[_RateLimiter]):
+
+        url = f"/api/v1/catalogs/{quote(catalog_id, safe='')}/attachments/{quote(attachment_id, safe='')}"
+        content = _FileChunks(file_path, chunk_size, rate_limiter)
+
+        # send the length upfront instead of using chunked transfer encoding
+        headers = { "Content-Length": str(os.path.getsize(file_path)) }
+
+        async with await self._client._invoke_async(StreamResponse, "PUT", url, "application/octet-stream", "application/octet-stream", content, headers):
+            pass
+
+    def walk(
+        self,
+        root: str = "/",
+        max_concurrency: int = 8,
+        depth: Optional[int] = None) -> AsyncIterator[CatalogInfo]:
+        """
+        Traverses the catalog tree below the root catalog breadth-first and yields the catalog infos as soon as they arrive.
+
+        Args:
+            root: The identifier of the root catalog.
+            max_concurrency: The maximum number of concurrent requests.
+            depth: The optional maximum depth relative to the root catalog (1 = child catalogs only).
+        """
+        return self._walk(root, max_concurrency, depth, lambda catalog_info, catalog: catalog_info, False)
+
+    def walk_with_catalogs(
+        self,
+        root: str = "/",
+        max_concurrency: int = 8,
+        depth: Optional[int] = None) -> AsyncIterator[Tuple[CatalogInfo, ResourceCatalog]]:
+        """
+        Traverses the catalog tree below the root catalog breadth-first, prefetches the resource catalogs and yields them together with their catalog infos as soon as they arrive.
+
+        Args:
+            root: The identifier of the root catalog.
+            max_concurrency: The maximum number of concurrent requests.
+            depth: The optional maximum depth relative to the root catalog (1 = child catalogs only).
+        """
+        return self._walk(root, max_concurrency, depth, lambda catalog_info, catalog: (catalog_info, catalog), True)
+
+    async def _walk(
+        self,
+        root: str,
+        max_concurrency: int,
+        depth: Optional[int],
+        select: Callable[[CatalogInfo, Optional[ResourceCatalog]], Any],
+        prefetch_catalogs: bool) -> AsyncIterator[Any]:
+
+        if depth is not None and depth <= 0:
+            return
+
+        semaphore = _create_semaphore(max_concurrency)
+        tasks: set[asyncio.Future] = set()
+        completed_tasks: asyncio.Queue[asyncio.Future] = asyncio.Queue()
+
+        def start(awaitable: Awaitable[list[Any]]):
+
+            task = asyncio.ensure_future(awaitable)
+            tasks.add(task)
+
+            def on_done(task: asyncio.Future):
+                tasks.discard(task)
+                completed_tasks.put_nowait(task)
+
+            task.add_done_callback(on_done)
+
+        async def get_catalog(catalog_info: CatalogInfo) -> list[Any]:
+
+            async with semaphore:
+                catalog = await self._client.catalogs.get(catalog_info.id)
+
+            return [select(catalog_info, catalog)]
+
+        async def visit(catalog_id: str, level: int) -> list[Any]:
+
+            async with semaphore:
+                catalog_infos = await self._client.catalogs.get_child_catalog_infos(catalog_id)
+
+            # the tasks are started in breadth-first order and the semaphore is fair
+            if depth is None or level < depth:
+                for catalog_info in catalog_infos:
+                    start(visit(catalog_info.id, level + 1))
+
+            if prefetch_catalogs:
+
+                for catalog_info in catalog_infos:
+                    start(get_catalog(catalog_info))
+
+                return []
+
+            return [select(catalog_info, None) for catalog_info in catalog_infos]
+
+        start(visit(root, 1))
+
+        try:
+
+            while tasks or not completed_tasks.empty():
+
+                task = await completed_tasks.get()
+
+                for item in task.result():
+                    yield item
+
+        finally:
+
+            for task in list(tasks):
+                task.cancel()
+
+class _DataClientExtensions:
+    """Provides extension methods to interact with data."""
+
+    _client: NexusAsyncClient
+
+    async def get_stream_parallel(
+        self,
+        resource_path: str,
+        begin: datetime,
+        end: datetime,
+        parts: int = 4,
+        part_period: Optional[timedelta] = None,
+        max_concurrency: int = 4) -> array[float]:
+        """
+        Gets the requested data by splitting the period into parts which are downloaded concurrently.
+
+        Args:
+            resource_path: The path to the resource data to stream.
+            begin: Start date/time.
+            end: End date/time.
+            parts: The number of parts. It is ignored when the part period is specified.
+            part_period: The period of a single part. It must be a multiple of the sample period.
+            max_concurrency: The maximum number of concurrent requests.
+        """
+
+        sample_period = _to_sample_period(resource_path)
+        element_count = _to_element_count(begin, end, sample_period)
+
+        if part_period is None:
+
+            if parts <= 0:
+                raise Exception("The number of parts must be greater than zero.")
+
+            # round up so that there are no more than the requested number of parts
+            part_element_count = max(1, -(-element_count // parts))
+
+        else:
+
+            if part_period <= timedelta(0) or part_period % sample_period != timedelta(0):
+                raise Exception("The part period must be a positive multiple of the sample period.")
+
+            part_element_count = part_period // sample_period
+
+        doubleBuffer = array("d", [0.0]) * element_count
+        byteBuffer = memoryview(doubleBuffer).cast("B")
+        semaphore = _create_semaphore(max_concurrency)
+
+        await _gather(
+            self._read_part_into(
+                resource_path, 
+                begin + offset * sample_period, 
+                begin + min(offset + part_element_count, element_count) * sample_period, 
+                byteBuffer[offset * 8:min(offset + part_element_count, element_count) * 8], 
+                semaphore)
+            for offset in range(0, element_count, part_element_count))
+
+        return doubleBuffer
 
+    async def get_many(
+        self,
+        resource_paths: list[str],
+        begin: datetime,
+        end: datetime,
+        max_concurrency: int = 8,
+        target: Any = None) -> Tuple[memoryview[float], list[str]]:
+        """
+        Gets the requested data of multiple resources with a common sample period as a single matrix.
 
-@dataclass
-class ExportParameters:
-    """
-    A structure for export parameters.
+        The data of each resource is stored contiguously (column-major order). The returned memoryview has the shape (resource count, element count) and can be turned into a matrix with one column per resource via numpy.asarray(data).T without copying.
 
-    Args:
-        begin: The start date/time.
-        end: The end date/time.
-        file_period: The file period.
-        type: The writer type.
-        resource_paths: The resource paths to export.
-        configuration: The configuration.
-    """
+        Args:
+            resource_paths: The paths to the resource data to stream.
+            begin: Start date/time.
+            end: End date/time.
+            max_concurrency: The maximum number of concurrent requests.
+            target: An optional writable float64 buffer to write the data into. It must either be a C-contiguous one-dimensional buffer with resource count x element count elements, a C-contiguous matrix of shape (resource count, element count) or a Fortran-ordered (column-major) matrix of shape (element count, resource count), e.g. numpy.empty((element_count, resource_count), order="F").
+        """
 
-    begin: datetime
-    """The start date/time."""
+        if not resource_paths:
+            raise Exception("At least one resource path must be provided.")
 
-    end: datetime
-    """The end date/time."""
+        sample_periods = set(_to_sample_period(resource_path) for resource_path in resource_paths)
 
-    file_period: timedelta
-    """The file period."""
+        if len(sample_periods) != 1:
+            raise Exception("All resources must share the same sample period.")
 
-    type: str
-    """The writer type."""
+        sample_period = next(iter(sample_periods))
+        element_count = _to_element_count(begin, end, sample_period)
+        resource_count = len(resource_paths)
 
-    resource_paths: list[str]
-    """The resource paths to export."""
+        if target is None:
+            target = array("d", [0.0]) * (resource_count * element_count)
 
-    configuration: dict[str, str]
-    """The configuration."""
+        view = memoryview(target)
 
+        if view.format != "d":
+            raise Exception(f"The target buffer must contain float64 values but its format is '{view.format}'.")
 
-@dataclass
-class PackageReference:
-    """
-    A package reference.
+        # the columns of a column-major matrix are contiguous, so its transpose is a C-contiguous (resource count, element count) matrix
+        if view.ndim == 2 and view.shape == (element_count, resource_count) and view.f_contiguous:
 
-    Args:
-        id: The unique identifier of the package reference.
-        provider: The provider which loads the package.
-        configuration: The configuration of the package reference.
-    """
+            import numpy
 
-    id: UUID
-    """The unique identifier of the package reference."""
+            byteBuffer = numpy.asarray(target).T.data.cast("B")
 
-    provider: str
-    """The provider which loads the package."""
+        elif view.ndim == 1 or (view.ndim == 2 and view.shape == (resource_count, element_count)):
 
-    configuration: dict[str, str]
-    """The configuration of the package reference."""
+            if not view.c_contiguous:
+                raise Exception("The target buffer must be C-contiguous.")
 
+            byteBuffer = view.cast("B")
 
-@dataclass
-class ExtensionDescription:
-    """
-    An extension description.
+        else:
+            raise Exception(f"The target buffer must be one-dimensional, a C-contiguous matrix of shape ({resource_count}, {element_count}) or a column-major matrix of shape ({element_count}, {resource_count}).")
 
-    Args:
-        type: The extension type.
-        description: A nullable description.
-        project_url: A nullable project website URL.
-        repository_url: A nullable source repository URL.
-        additional_info: A nullable dictionary with additional information.
-    """
+        if len(byteBuffer) != resource_count * element_count * 8:
+            raise Exception(f"The target buffer must have a size of exactly {resource_count * element_count * 8} bytes.")
 
-    type: str
-    """The extension type."""
+        semaphore = _create_semaphore(max_concurrency)
+        column_length = element_count * 8
 
-    description: Optional[str]
-    """A nullable description."""
+        await _gather(
+            self._read_part_into(
+                resource_path, 
+                begin, 
+                end, 
+                byteBuffer[i * column_length:(i + 1) * column_length], 
+                semaphore)
+            for i, resource_path in enumerate(resource_paths))
 
-    project_url: Optional[str]
-    """A nullable project website URL."""
+        return (byteBuffer.cast("d", [resource_count, element_count]), list(resource_paths))
 
-    repository_url: Optional[str]
-    """A nullable source repository URL."""
+    async def _read_part_into(
+        self,
+        resource_path: str,
+        begin: datetime,
+        end: datetime,
+        target: memoryview,
+        semaphore: asyncio.Semaphore):
 
-    additional_info: Optional[dict[str, str]]
-    """A nullable dictionary with additional information."""
+        async with semaphore:
+            async with await self._client.data.get_stream(resource_path, begin, end) as response:
+                actual_length = await response.read_into(target)
 
+        if actual_length * 8 != len(target):
+            raise Exception(f"Expected {len(target) // 8} elements for resource {resource_path} and period {begin} to {end} but received {actual_length}.")
 
-@dataclass
-class DataSourceRegistration:
-    """
-    A data source registration.
+class _JobsClientExtensions:
+    """Provides extension methods to interact with jobs."""
 
-    Args:
-        id: The unique identifier of the data source registration.
-        type: The type of the data source.
-        resource_locator: An URL which points to the data.
-        configuration: Configuration parameters for the instantiated source.
-        info_url: An optional info URL.
-        release_pattern: An optional regular expressions pattern to select the catalogs to be released. By default, all catalogs will be released.
-        visibility_pattern: An optional regular expressions pattern to select the catalogs to be visible. By default, all catalogs will be visible.
-    """
+    _client: NexusAsyncClient
 
-    id: UUID
-    """The unique identifier of the data source registration."""
+    _completed_task_statuses = (TaskStatus.RAN_TO_COMPLETION, TaskStatus.CANCELED, TaskStatus.FAULTED)
 
-    type: str
-    """The type of the data source."""
+    async def wait(
+        self,
+        job_ids: Iterable[UUID],
+        min_interval: timedelta = timedelta(milliseconds=500),
+        max_interval: timedelta = timedelta(seconds=30),
+        max_concurrency: int = 4) -> dict[UUID, JobStatus]:
+        """
+        Waits until all jobs have completed (i.e. they ran to completion, were canceled or faulted) and returns their final status.
 
-    resource_locator: str
-    """An URL which points to the data."""
+        Args:
+            job_ids: The job identifiers.
+            min_interval: The minimum polling interval of a single job.
+            max_interval: The maximum polling interval of a single job.
+            max_concurrency: The maximum number of concurrent requests.
+        """
 
-    configuration: dict[str, str]
-    """Configuration parameters for the instantiated source."""
+        job_statuses: dict[UUID, JobStatus] = {}
 
-    info_url: Optional[str]
-    """An optional info URL."""
+        async for job_id, job_status in self.watch(job_ids, min_interval, max_interval, max_concurrency):
+            job_statuses[job_id] = job_status
 
-    release_pattern: str
-    """An optional regular expressions pattern to select the catalogs to be released. By default, all catalogs will be released."""
+        return job_statuses
 
-    visibility_pattern: str
-    """An optional regular expressions pattern to select the catalogs to be visible. By default, all catalogs will be visible."""
+    async def watch(
+        self,
+        job_ids: Iterable[UUID],
+        min_interval: timedelta = timedelta(milliseconds=500),
+        max_interval: timedelta = timedelta(seconds=30),
+        max_concurrency: int = 4) -> AsyncIterator[Tuple[UUID, JobStatus]]:
+        """
+        Polls the status of the jobs until they have completed and yields the status updates. All jobs are tracked by a single scheduler. The polling interval of each job adapts to its progress rate, i.e. a job is polled again around its expected completion time and the interval is doubled (up to the maximum interval) as long as there is no progress.
 
+        Args:
+            job_ids: The job identifiers.
+            min_interval: The minimum polling interval of a single job.
+            max_interval: The maximum polling interval of a single job.
+            max_concurrency: The maximum number of concurrent requests.
+        """
 
-@dataclass
-class AuthenticationSchemeDescription:
-    """
-    Describes an OpenID connect provider.
+        if max_concurrency <= 0:
+            raise Exception("The maximum concurrency must be greater than zero.")
 
-    Args:
-        scheme: The scheme.
-        display_name: The display name.
-    """
+        loop = asyncio.get_running_loop()
+        min_seconds = min_interval.total_seconds()
+        max_seconds = max_interval.total_seconds()
 
-    scheme: str
-    """The scheme."""
+        # (due time, sequence number, job id)
+        schedule: list[Tuple[float, int, UUID]] = []
+        sequence_number = 0
 
-    display_name: str
-    """The display name."""
+        # job id -> (last poll time, last status, polling interval)
+        states: dict[UUID, Tuple[float, JobStatus, float]] = {}
 
+        for job_id in job_ids:
+            schedule.append((loop.time(), sequence_number, job_id))
+            sequence_number += 1
 
-@dataclass
-class TokenPair:
-    """
-    A token pair.
+        while schedule:
 
-    Args:
-        access_token: The JWT token.
-        refresh_token: The refresh token.
-    """
+            delay = schedule[0][0] - loop.time()
 
-    access_token: str
-    """The JWT token."""
+            if delay > 0:
+                await asyncio.sleep(delay)
 
-    refresh_token: str
-    """The refresh token."""
+            now = loop.time()
+            due_job_ids: list[UUID] = []
 
+            while schedule and schedule[0][0] <= now and len(due_job_ids) < max_concurrency:
+                due_job_ids.append(heappop(schedule)[2])
 
-@dataclass
-class RefreshTokenRequest:
-    """
-    A refresh token request.
+            job_statuses = await _gather(self._client.jobs.get_job_status(job_id) for job_id in due_job_ids)
+            now = loop.time()
 
-    Args:
-        refresh_token: The refresh token.
-    """
+            for job_id, job_status in zip(due_job_ids, job_statuses):
 
-    refresh_token: str
-    """The refresh token."""
+                state = states.get(job_id)
 
+                if state is None:
+                    interval = min_seconds
 
-@dataclass
-class RevokeTokenRequest:
-    """
-    A revoke token request.
+                else:
 
-    Args:
-        token: The refresh token.
-    """
+                    last_time, last_status, last_interval = state
+                    elapsed = now - last_time
+                    rate = (job_status.progress - last_status.progress) / elapsed if elapsed > 0 else 0
 
-    token: str
-    """The refresh token."""
+                    # poll again around the expected completion time
+                    if rate > 0:
+                        interval = (1 - job_status.progress) / rate
 
+                    # back off
+                    else:
+                        interval = last_interval * 2
 
-@dataclass
-class NexusUser:
-    """
-    Represents a user.
+                interval = min(max(interval, min_seconds), max_seconds)
 
-    Args:
-        id: The user identifier.
-        name: The user name.
-        refresh_tokens: The list of refresh tokens.
-        claims: The map of claims.
-    """
+                if job_status.status not in self._completed_task_statuses:
+                    states[job_id] = (now, job_status, interval)
+                    heappush(schedule, (now + interval, sequence_number, job_id))
+                    sequence_number += 1
 
-    id: str
-    """The user identifier."""
+                if state is None or job_status.status != state[1].status or job_status.progress != state[1].progress:
+                    yield (job_id, job_status)
 
-    name: str
-    """The user name."""
+    async def export_to(
+        self,
+        file_path: str,
+        parameters: ExportParameters,
+        min_interval: timedelta = timedelta(milliseconds=500),
+        max_interval: timedelta = timedelta(seconds=30),
+        chunk_size: int = 2**20,
+        max_retries: int = 3) -> bool:
+        """
+        Exports the requested data, waits for the export job to complete and downloads the resulting artifact (a zip file) to the specified file. Returns False if there is no data to export.
 
-    refresh_tokens: list[RefreshToken]
-    """The list of refresh tokens."""
+        Args:
+            file_path: The path of the target file.
+            parameters: The export parameters.
+            min_interval: The minimum polling interval.
+            max_interval: The maximum polling interval.
+            chunk_size: The size of the chunks which are written to the file.
+            max_retries: The maximum number of retries after an interrupted download.
+        """
 
-    claims: dict[str, NexusClaim]
-    """The map of claims."""
+        job = await self._client.jobs.export(parameters)
+        job_status = (await self.wait([job.id], min_interval, max_interval))[job.id]
 
+        if job_status.status != TaskStatus.RAN_TO_COMPLETION:
+            raise Exception(f"The export job {job.id} did not run to completion (status: {job_status.status.value}, message: {job_status.exception_message}).")
 
-@dataclass
-class RefreshToken:
-    """
-    A refresh token.
+        artifact_id = typing.cast(str, job_status.result)
 
-    Args:
-        token: The refresh token.
-        created: The date/time when the token was created.
-        expires: The date/time when the token expires.
-        revoked: The date/time when the token was revoked.
-        replaced_by_token: The token that replaced this one.
-        is_expired: A boolean that indicates if the token has expired.
-        is_revoked: A boolean that indicates if the token has been revoked.
-        is_active: A boolean that indicates if the token is active.
-    """
+        # there is no data
+        if not artifact_id:
+            return False
 
-    token: str
-    """The refresh token."""
+        await self._client.artifacts.download_to(artifact_id, file_path, chunk_size, max_retries)
 
-    created: datetime
-    """The date/time when the token was created."""
+        return True
 
-    expires: datetime
-    """The date/time when the token expires."""
+    async def export_sharded(
+        self,
+        folder_path: str,
+        parameters: ExportParameters,
+        shards: int = 4,
+        max_concurrency: int = 4,
+        min_interval: timedelta = timedelta(milliseconds=500),
+        max_interval: timedelta = timedelta(seconds=30),
+        chunk_size: int = 2**20,
+        max_retries: int = 3) -> list[str]:
+        """
+        Splits the export period on file period boundaries into multiple export jobs which run concurrently. The resulting artifacts are downloaded and extracted into the specified folder. Returns the names of the extracted files.
 
-    revoked: Optional[datetime]
-    """The date/time when the token was revoked."""
+        Args:
+            folder_path: The target folder.
+            parameters: The export parameters.
+            shards: The maximum number of export jobs. It is limited by the number of files.
+            max_concurrency: The maximum number of concurrently running export jobs.
+            min_interval: The minimum polling interval.
+            max_interval: The maximum polling interval.
+            chunk_size: The size of the chunks which are written to the file.
+            max_retries: The maximum number of retries after an interrupted download.
+        """
 
-    replaced_by_token: Optional[str]
-    """The token that replaced this one."""
+        semaphore = _create_semaphore(max_concurrency)
+        os.makedirs(folder_path, exist_ok=True)
 
-    is_expired: bool
-    """A boolean that indicates if the token has expired."""
+        async def export_shard(shard: int, shard_parameters: ExportParameters, temp_folder_path: str) -> list[str]:
 
-    is_revoked: bool
-    """A boolean that indicates if the token has been revoked."""
+            zip_file_path = os.path.join(temp_folder_path, f"shard{shard}.zip")
 
-    is_active: bool
-    """A boolean that indicates if the token is active."""
+            async with semaphore:
+                exported = await self.export_to(zip_file_path, shard_parameters, min_interval, max_interval, chunk_size, max_retries)
 
+            if not exported:
+                return []
 
-@dataclass
-class NexusClaim:
-    """
-    Represents a claim.
+            try:
+                with ZipFile(zip_file_path) as zip_file:
+                    zip_file.extractall(folder_path)
+                    return zip_file.namelist()
 
-    Args:
-        type: The claim type.
-        value: The claim value.
-    """
+            finally:
+                os.remove(zip_file_path)
 
-    type: str
-    """The claim type."""
+        # each call uses its own temporary folder so that concurrent or interrupted calls do not share the shard files
+        with tempfile.TemporaryDirectory(prefix=".shards-", dir=folder_path) as temp_folder_path:
 
-    value: str
-    """The claim value."""
+            file_names = await _gather(
+                export_shard(shard, shard_parameters, temp_folder_path)
+                for shard, shard_parameters in enumerate(_split_export_parameters(parameters, shards)))
 
+        return sorted(set(file_name for shard_file_names in file_names for file_name in shard_file_names))
 
 
-class ArtifactsClient:
+class ArtifactsClient(_ArtifactsClientExtensions):
     """Provides methods to interact with artifacts."""
 
     _client: NexusAsyncClient
@@ -824,7 +2352,7 @@ class ArtifactsClient:
         return self._client._invoke_async(StreamResponse, "GET", url, "application/octet-stream", None, None)
 
 
-class CatalogsClient:
+class CatalogsClient(_CatalogsClientExtensions):
     """Provides methods to interact with catalogs."""
 
     _client: NexusAsyncClient
@@ -978,10 +2506,10 @@ class CatalogsClient:
         url = "/api/v1/catalogs/{catalogId}/metadata"
         url = url.replace("{catalogId}", quote(str(catalog_id), safe=""))
 
-        return self._client._invoke_async(type(None), "PUT", url, "", "application/json", json.dumps(catalog_metadata, cls=_MyEncoder))
+        return self._client._invoke_async(type(None), "PUT", url, "", "application/json", self._client._json_backend.dumps(catalog_metadata))
 
 
-class DataClient:
+class DataClient(_DataClientExtensions):
     """Provides methods to interact with data."""
 
     _client: NexusAsyncClient
@@ -1013,7 +2541,7 @@ class DataClient:
         return self._client._invoke_async(StreamResponse, "GET", url, "application/octet-stream", None, None)
 
 
-class JobsClient:
+class JobsClient(_JobsClientExtensions):
     """Provides methods to interact with jobs."""
 
     _client: NexusAsyncClient
@@ -1067,7 +2595,7 @@ class JobsClient:
 
         url = "/api/v1/jobs/export"
 
-        return self._client._invoke_async(Job, "POST", url, "application/json", "application/json", json.dumps(parameters, cls=_MyEncoder))
+        return self._client._invoke_async(Job, "POST", url, "application/json", "application/json", self._client._json_backend.dumps(parameters))
 
     def load_packages(self) -> Awaitable[Job]:
         """
@@ -1132,7 +2660,7 @@ class PackageReferencesClient:
 
         url = "/api/v1/packagereferences"
 
-        return self._client._invoke_async(type(None), "PUT", url, "", "application/json", json.dumps(package_reference, cls=_MyEncoder))
+        return self._client._invoke_async(type(None), "PUT", url, "", "application/json", self._client._json_backend.dumps(package_reference))
 
     def delete(self, package_reference_id: UUID) -> Awaitable[None]:
         """
@@ -1216,7 +2744,7 @@ class SourcesClient:
         query: str = "?" + "&".join(f"{key}={value}" for (key, value) in queryValues.items())
         url += query
 
-        return self._client._invoke_async(StreamResponse, "PUT", url, "application/octet-stream", "application/json", json.dumps(registration, cls=_MyEncoder))
+        return self._client._invoke_async(StreamResponse, "PUT", url, "application/octet-stream", "application/json", self._client._json_backend.dumps(registration))
 
     def delete_registration(self, registration_id: UUID, username: Optional[str] = None) -> Awaitable[StreamResponse]:
         """
@@ -1268,7 +2796,7 @@ class SystemClient:
 
         url = "/api/v1/system/configuration"
 
-        return self._client._invoke_async(type(None), "PUT", url, "", "application/json", json.dumps(configuration, cls=_MyEncoder))
+        return self._client._invoke_async(type(None), "PUT", url, "", "application/json", self._client._json_backend.dumps(configuration))
 
 
 class UsersClient:
@@ -1339,7 +2867,7 @@ class UsersClient:
 
         url = "/api/v1/users/refresh-token"
 
-        return self._client._invoke_async(TokenPair, "POST", url, "application/json", "application/json", json.dumps(request, cls=_MyEncoder))
+        return self._client._invoke_async(TokenPair, "POST", url, "application/json", "application/json", self._client._json_backend.dumps(request))
 
     def revoke_token(self, request: RevokeTokenRequest) -> Awaitable[StreamResponse]:
         """
@@ -1350,7 +2878,7 @@ class UsersClient:
 
         url = "/api/v1/users/revoke-token"
 
-        return self._client._invoke_async(StreamResponse, "POST", url, "application/octet-stream", "application/json", json.dumps(request, cls=_MyEncoder))
+        return self._client._invoke_async(StreamResponse, "POST", url, "application/octet-stream", "application/json", self._client._json_backend.dumps(request))
 
     def get_me(self) -> Awaitable[NexusUser]:
         """
@@ -1430,7 +2958,7 @@ class UsersClient:
         url = url.replace("{userId}", quote(str(user_id), safe=""))
         url = url.replace("{claimId}", quote(str(claim_id), safe=""))
 
-        return self._client._invoke_async(StreamResponse, "PUT", url, "application/octet-stream", "application/json", json.dumps(claim, cls=_MyEncoder))
+        return self._client._invoke_async(StreamResponse, "PUT", url, "application/octet-stream", "application/json", self._client._json_backend.dumps(claim))
 
     def delete_claim(self, user_id: str, claim_id: UUID) -> Awaitable[StreamResponse]:
         """
@@ -1476,11 +3004,15 @@ class NexusAsyncClient:
     _nexus_configuration_header_key: str = "Nexus-Configuration"
     _authorization_header_key: str = "Authorization"
 
-    _token_folder_path: str = os.path.join(str(Path.home()), ".nexus-api", "tokens")
-
     _token_pair: Optional[TokenPair]
     _http_client: AsyncClient
-    _token_file_path: Optional[str]
+    _token_store: TokenStore
+    _token_key: Optional[str]
+    _json_backend: JsonBackend
+    _token_refresh_margin: Optional[timedelta]
+    _access_token_expiration: Optional[float]
+    _refresh_task: Optional[asyncio.Future]
+    _configuration: ContextVar[Optional[str]]
 
     _artifacts: ArtifactsClient
     _catalogs: CatalogsClient
@@ -1494,21 +3026,45 @@ class NexusAsyncClient:
 
 
     @classmethod
-    def create(cls, base_url: str) -> NexusAsyncClient:
+    def create(
+        cls,
+        base_url: str,
+        json_backend: Optional[JsonBackend] = None,
+        token_refresh_margin: Optional[timedelta] = None,
+        token_store: Optional[TokenStore] = None,
+        transport_profile: Union[str, TransportProfile] = "default") -> NexusAsyncClient:
         """
         Initializes a new instance of the NexusAsyncClient
         
             Args:
                 base_url: The base URL to use.
+                json_backend: The JSON backend to use. If not specified, orjson is used when it is installed and the json module of the standard library otherwise.
+                token_refresh_margin: If specified, the access token is refreshed proactively when it expires within this period.
+                token_store: The store for refresh tokens. Defaults to a FileTokenStore in ~/.nexus-api/tokens.
+                transport_profile: The connection pool and transport settings or the name of a predefined profile (see transport_profiles), e.g. "bulk-download" or "metadata".
         """
-        return NexusAsyncClient(AsyncClient(base_url=base_url))
 
-    def __init__(self, http_client: AsyncClient):
+        if isinstance(transport_profile, str):
+
+            profile = transport_profiles.get(transport_profile)
+
+            if profile is None:
+                raise Exception(f"The transport profile {transport_profile} does not exist.")
+
+        else:
+            profile = transport_profile
+
+        return NexusAsyncClient(profile.create_http_client(base_url), json_backend, token_refresh_margin, token_store)
+
+    def __init__(self, http_client: AsyncClient, json_backend: Optional[JsonBackend] = None, token_refresh_margin: Optional[timedelta] = None, token_store: Optional[TokenStore] = None):
         """
         Initializes a new instance of the NexusAsyncClient
         
             Args:
                 http_client: The HTTP client to use.
+                json_backend: The JSON backend to use. If not specified, orjson is used when it is installed and the json module of the standard library otherwise.
+                token_refresh_margin: If specified, the access token is refreshed proactively when it expires within this period.
+                token_store: The store for refresh tokens. Defaults to a FileTokenStore in ~/.nexus-api/tokens.
         """
 
         if http_client.base_url is None:
@@ -1516,6 +3072,13 @@ class NexusAsyncClient:
 
         self._http_client = http_client
         self._token_pair = None
+        self._json_backend = json_backend if json_backend is not None else _create_json_backend()
+        self._token_refresh_margin = token_refresh_margin
+        self._access_token_expiration = None
+        self._refresh_task = None
+        self._token_store = token_store if token_store is not None else FileTokenStore()
+        self._token_key = None
+        self._configuration = ContextVar(f"nexus_configuration_{id(self)}", default=None)
 
         self._artifacts = ArtifactsClient(self)
         self._catalogs = CatalogsClient(self)
@@ -1533,6 +3096,11 @@ class NexusAsyncClient:
         """Gets a value which indicates if the user is authenticated."""
         return self._token_pair is not None
 
+    @property
+    def json_backend(self) -> JsonBackend:
+        """Gets the JSON backend."""
+        return self._json_backend
+
     @property
     def artifacts(self) -> ArtifactsClient:
         """Gets the ArtifactsClient."""
@@ -1587,52 +3155,68 @@ class NexusAsyncClient:
             token_pair: The refresh token.
         """
 
-        actual_refresh_token: str
+        self._token_key = refresh_token
 
-        self._token_file_path = os.path.join(self._token_folder_path, quote(refresh_token, safe="") + ".json")
-        
-        if Path(self._token_file_path).is_file():
-            with open(self._token_file_path) as json_file:
-                jsonObject = json.load(json_file)
-                actual_refresh_token = _decode(str, jsonObject)
-
-        else:
-            Path(self._token_folder_path).mkdir(parents=True, exist_ok=True)
+        # the refresh token may have been rotated in the meantime (possibly by another process)
+        actual_refresh_token = await asyncio.to_thread(self._token_store.load, refresh_token)
 
-            with open(self._token_file_path, "w") as json_file:
-                json.dump(refresh_token, json_file, indent=4, cls=_MyEncoder)
-                actual_refresh_token = refresh_token
+        if actual_refresh_token is None:
+            await asyncio.to_thread(self._token_store.save, refresh_token, refresh_token)
+            actual_refresh_token = refresh_token
                 
         await self._refresh_token_async(actual_refresh_token)
 
-    def attach_configuration(self, configuration: dict[str, str]) -> Any:
-        """Attaches configuration data to subsequent Nexus API requests."""
+    async def warm_up(self, connection_count: int = 1) -> None:
+        """
+        Pre-opens connections to the server so that the first requests do not have to wait for the connection setup (TCP and TLS handshakes).
+
+        Args:
+            connection_count: The number of connections to open. With HTTP/2, a single connection is sufficient.
+        """
 
-        encoded_json = base64.b64encode(json.dumps(configuration).encode("utf-8")).decode("utf-8")
+        # concurrent requests require separate connections
+        await asyncio.gather(*[self.users.get_authentication_schemes() for _ in range(connection_count)])
+
+    def attach_configuration(self, configuration: dict[str, str]) -> Any:
+        """
+        Attaches configuration data to subsequent Nexus API requests of the current context (i.e. the current task and the tasks it creates afterwards). This way, concurrent tasks can share a single client with different configurations.
 
-        if self._nexus_configuration_header_key in self._http_client.headers:
-            del self._http_client.headers[self._nexus_configuration_header_key]
+        Args:
+            configuration: The configuration data.
+        """
 
-        self._http_client.headers[self._nexus_configuration_header_key] = encoded_json
+        encoded_json = _encode_configuration(tuple(configuration.items()))
+        token = self._configuration.set(encoded_json)
 
-        return _DisposableConfiguration(self)
+        return _DisposableConfiguration(self, token)
 
     def clear_configuration(self) -> None:
-        """Clears configuration data for all subsequent Nexus API requests."""
+        """Clears configuration data for all subsequent Nexus API requests of the current context."""
+        self._configuration.set(None)
+
+    async def _invoke_async(self, typeOfT: Type[T], method: str, relative_url: str, accept_header_value: Optional[str], content_type_value: Optional[str], content: Union[None, str, bytes, Iterable[bytes], AsyncIterable[bytes]], headers: Optional[dict[str, str]] = None) -> T:
 
-        if self._nexus_configuration_header_key in self._http_client.headers:
-            del self._http_client.headers[self._nexus_configuration_header_key]
+        # refresh the access token shortly before it expires
+        if self._token_refresh_margin is not None and self._access_token_expiration is not None:
 
-    async def _invoke_async(self, typeOfT: Type[T], method: str, relative_url: str, accept_header_value: Optional[str], content_type_value: Optional[str], content: Union[None, str, bytes, Iterable[bytes], AsyncIterable[bytes]]) -> T:
+            if time.time() + self._token_refresh_margin.total_seconds() >= self._access_token_expiration:
+
+                try:
+                    await self._refresh_token_once_async(self._http_client.headers.get(self._authorization_header_key))
+
+                # the token may still be valid, otherwise the request below fails
+                except Exception:
+                    pass
 
         # prepare request
-        request = self._build_request_message(method, relative_url, content, content_type_value, accept_header_value)
+        request = self._build_request_message(method, relative_url, content, content_type_value, accept_header_value, headers)
 
-        # send request
-        response = await self._http_client.send(request)
+        # send request (stream responses are not buffered)
+        is_stream_response = typeOfT is StreamResponse
+        response = await self._http_client.send(request, stream=is_stream_response)
 
-        # process response
-        if not response.is_success:
+        # process response (304 is only returned for conditional requests)
+        if not response.is_success and response.status_code != codes.NOT_MODIFIED:
             
             # try to refresh the access token
             if response.status_code == codes.UNAUTHORIZED and self._token_pair is not None:
@@ -1645,24 +3229,26 @@ class NexusAsyncClient:
                     if "The token expired at" in www_authenticate_header:
 
                         try:
-                            await self._refresh_token_async(self._token_pair.refresh_token)
+                            await self._refresh_token_once_async(request.headers.get(self._authorization_header_key))
 
-                            new_request = self._build_request_message(method, relative_url, content, content_type_value, accept_header_value)
-                            new_response = await self._http_client.send(new_request)
+                            new_request = self._build_request_message(method, relative_url, content, content_type_value, accept_header_value, headers)
+                            new_response = await self._http_client.send(new_request, stream=is_stream_response)
 
                             if new_response is not None:
                                 await response.aclose()
                                 response = new_response
                                 sign_out = False
 
-                        except:
+                        # a canceled request must not sign out the others
+                        except Exception:
                             pass
 
                 if sign_out:
                     self.sign_out()
 
-            if not response.is_success:
+            if not response.is_success and response.status_code != codes.NOT_MODIFIED:
 
+                await response.aread()
                 message = response.text
                 status_code = f"N00.{response.status_code}"
 
@@ -1682,7 +3268,7 @@ class NexusAsyncClient:
 
             else:
 
-                jsonObject = json.loads(response.text)
+                jsonObject = self._json_backend.loads(response.content)
                 return_value = _decode(typeOfT, jsonObject)
 
                 if return_value is None:
@@ -1691,12 +3277,12 @@ class NexusAsyncClient:
                 return return_value
 
         finally:
-            if typeOfT is not StreamResponse:
+            if not is_stream_response:
                 await response.aclose()
     
-    def _build_request_message(self, method: str, relative_url: str, content: Any, content_type_value: Optional[str], accept_header_value: Optional[str]) -> Request:
+    def _build_request_message(self, method: str, relative_url: str, content: Any, content_type_value: Optional[str], accept_header_value: Optional[str], headers: Optional[dict[str, str]] = None) -> Request:
        
-        request_message = self._http_client.build_request(method, relative_url, content = content)
+        request_message = self._http_client.build_request(method, relative_url, content = content, headers = headers)
 
         if content_type_value is not None:
             request_message.headers["Content-Type"] = content_type_value
@@ -1704,19 +3290,62 @@ class NexusAsyncClient:
         if accept_header_value is not None:
             request_message.headers["Accept"] = accept_header_value
 
+        encoded_configuration = self._configuration.get()
+
+        if encoded_configuration is not None and self._nexus_configuration_header_key not in request_message.headers:
+            request_message.headers[self._nexus_configuration_header_key] = encoded_configuration
+
         return request_message
 
+    async def _refresh_token_once_async(self, authorization_header_value: Optional[str]):
+
+        # the refresh request itself must not wait for the refresh
+        if self._refresh_task is not None and asyncio.current_task() is self._refresh_task:
+            return
+
+        # the token has already been refreshed by another request
+        if self._http_client.headers.get(self._authorization_header_key) != authorization_header_value:
+            return
+
+        # all concurrent requests share a single refresh
+        if self._refresh_task is None:
+
+            if self._token_pair is None:
+                raise Exception("The user is not signed in.")
+
+            def on_done(_):
+                self._refresh_task = None
+
+            self._refresh_task = asyncio.ensure_future(self._refresh_token_async(self._token_pair.refresh_token))
+            self._refresh_task.add_done_callback(on_done)
+
+        # a canceled request must not cancel the refresh of the others
+        await asyncio.shield(self._refresh_task)
+
     async def _refresh_token_async(self, refresh_token):
         # see https://github.com/AzureAD/azure-activedirectory-identitymodel-extensions-for-dotnet/blob/dev/src/Microsoft.IdentityModel.Tokens/Validators.cs#L390
 
         refresh_request = RefreshTokenRequest(refresh_token)
-        token_pair = await self.users.refresh_token(refresh_request)
 
-        if self._token_file_path is not None:
-            Path(self._token_folder_path).mkdir(parents=True, exist_ok=True)
-            
-            with open(self._token_file_path, "w") as json_file:
-                json.dump(token_pair.refresh_token, json_file, indent=4, cls=_MyEncoder)
+        try:
+            token_pair = await self.users.refresh_token(refresh_request)
+
+        # another process which shares the token store may have rotated the refresh token in the meantime
+        except NexusException:
+
+            if self._token_key is None:
+                raise
+
+            stored_refresh_token = await asyncio.to_thread(self._token_store.load, self._token_key)
+
+            if stored_refresh_token is None or stored_refresh_token == refresh_token:
+                raise
+
+            refresh_request = RefreshTokenRequest(stored_refresh_token)
+            token_pair = await self.users.refresh_token(refresh_request)
+
+        if self._token_key is not None:
+            await asyncio.to_thread(self._token_store.save, self._token_key, token_pair.refresh_token)
 
         authorizationHeaderValue = f"Bearer {token_pair.access_token}"
 
@@ -1725,6 +3354,7 @@ class NexusAsyncClient:
 
         self._http_client.headers[self._authorization_header_key] = authorizationHeaderValue
         self._token_pair = token_pair
+        self._access_token_expiration = _get_token_expiration(token_pair.access_token)
 
     def sign_out(self) -> None:
 
@@ -1732,6 +3362,7 @@ class NexusAsyncClient:
             del self._http_client.headers[self._authorization_header_key]
 
         self._token_pair = None
+        self._access_token_expiration = None
 
     # "disposable" methods
     async def __aenter__(self) -> NexusAsyncClient:
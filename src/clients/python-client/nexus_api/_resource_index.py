@@ -0,0 +1,255 @@
+# Python <= 3.9
+from __future__ import annotations
+
+import gzip
+import json
+from dataclasses import dataclass
+from typing import Iterable, Optional
+
+from ._nexus_api import NexusAsyncClient, Resource, ResourceCatalog
+
+_DESCRIPTION = "Description"
+
+def _get_trigrams(value: str) -> set[str]:
+    return { value[i:i + 3] for i in range(len(value) - 2) }
+
+def _get_properties(resource: Resource) -> dict[str, object]:
+
+    # the properties are arbitrary JSON data
+    properties = resource.properties
+    return properties if isinstance(properties, dict) else {}
+
+def _get_property_values(value: object) -> list[str]:
+
+    if isinstance(value, str):
+        return [value]
+
+    elif isinstance(value, list):
+        return [item for item in value if isinstance(item, str)]
+
+    else:
+        return []
+
+@dataclass(frozen=True)
+class ResourceIndexEntry:
+    """
+    An entry of the resource index.
+
+    Args:
+        path: The path of the resource (catalog identifier + resource identifier).
+        catalog_id: The identifier of the catalog the resource belongs to.
+        resource: The resource.
+    """
+
+    path: str
+    """The path of the resource (catalog identifier + resource identifier)."""
+
+    catalog_id: str
+    """The identifier of the catalog the resource belongs to."""
+
+    resource: Resource
+    """The resource."""
+
+class ResourceIndex:
+    """
+    A local, searchable index of the resources of one or more catalogs.
+
+    Resources can be looked up by their path and found by their property values (e.g. the unit or the groups) and by parts of their description. The property values are stored in inverted indexes and the descriptions in a trigram index so that queries do not need to scan all resources. The index can be saved to and loaded from a compressed file.
+    """
+
+    def __init__(self):
+        """Initializes a new instance of the ResourceIndex."""
+
+        self._entries: dict[str, ResourceIndexEntry] = {}
+        self._catalog_paths: dict[str, set[str]] = {}
+        self._property_index: dict[str, dict[str, set[str]]] = {}
+        self._trigram_index: dict[str, set[str]] = {}
+        self._descriptions: dict[str, str] = {}
+
+    @classmethod
+    async def build(cls, client: NexusAsyncClient, root: str = "/", max_concurrency: int = 8) -> ResourceIndex:
+        """
+        Builds a new index from all catalogs below the root catalog.
+
+        Args:
+            client: The client to use.
+            root: The identifier of the root catalog.
+            max_concurrency: The maximum number of concurrent requests.
+        """
+
+        index = ResourceIndex()
+
+        async for _, catalog in client.catalogs.walk_with_catalogs(root, max_concurrency):
+            index.add(catalog)
+
+        return index
+
+    @classmethod
+    def load(cls, file_path: str) -> ResourceIndex:
+        """
+        Loads an index from the specified file.
+
+        Args:
+            file_path: The path of the index file.
+        """
+
+        index = ResourceIndex()
+
+        with gzip.open(file_path, "rt", encoding="utf-8") as json_file:
+            jsonObject = json.load(json_file)
+
+        for catalog_id, resources in jsonObject.items():
+            index._add_resources(catalog_id, (Resource.from_json(resource) for resource in resources))
+
+        return index
+
+    def save(self, file_path: str) -> None:
+        """
+        Saves the index to the specified file.
+
+        Args:
+            file_path: The path of the index file.
+        """
+
+        jsonObject = {
+            catalog_id: [self._entries[path].resource.to_json() for path in sorted(paths)]
+            for catalog_id, paths in self._catalog_paths.items()
+        }
+
+        with gzip.open(file_path, "wt", encoding="utf-8") as json_file:
+            json.dump(jsonObject, json_file, separators=(",", ":"))
+
+    def add(self, catalog: ResourceCatalog) -> None:
+        """
+        Adds the resources of the specified catalog to the index. Previously added resources of the catalog are replaced.
+
+        Args:
+            catalog: The catalog to add.
+        """
+
+        self.remove(catalog.id)
+        self._add_resources(catalog.id, catalog.resources or [])
+
+    def remove(self, catalog_id: str) -> None:
+        """
+        Removes the resources of the specified catalog from the index.
+
+        Args:
+            catalog_id: The identifier of the catalog to remove.
+        """
+
+        for path in self._catalog_paths.pop(catalog_id, set()):
+
+            entry = self._entries.pop(path)
+
+            for key, value in _get_properties(entry.resource).items():
+
+                values = self._property_index.get(key)
+
+                if values is None:
+                    continue
+
+                for property_value in _get_property_values(value):
+
+                    paths = values.get(property_value)
+
+                    if paths is not None:
+                        paths.discard(path)
+
+                        if not paths:
+                            del values[property_value]
+
+            description = self._descriptions.pop(path, None)
+
+            if description is not None:
+                for trigram in _get_trigrams(description):
+
+                    paths = self._trigram_index[trigram]
+                    paths.discard(path)
+
+                    if not paths:
+                        del self._trigram_index[trigram]
+
+    def get(self, path: str) -> Optional[ResourceIndexEntry]:
+        """
+        Gets the entry of the specified resource.
+
+        Args:
+            path: The path of the resource (catalog identifier + resource identifier), e.g. /A/B/C/T1.
+        """
+        return self._entries.get(path)
+
+    def find(
+        self,
+        properties: Optional[dict[str, str]] = None,
+        description: Optional[str] = None,
+        catalog_id: Optional[str] = None) -> list[ResourceIndexEntry]:
+        """
+        Finds all resources which match all of the specified criteria.
+
+        Args:
+            properties: The required property values, e.g. { "Unit": "m/s", "Groups": "Group 1" }. For list properties like the groups, one of the items must match.
+            description: A case-insensitive part of the description.
+            catalog_id: The identifier of the catalog the resources must belong to.
+        """
+
+        candidates: list[set[str]] = []
+
+        if catalog_id is not None:
+            candidates.append(self._catalog_paths.get(catalog_id, set()))
+
+        for key, value in (properties or {}).items():
+            candidates.append(self._property_index.get(key, {}).get(value, set()))
+
+        if description is not None:
+
+            description = description.lower()
+            trigrams = _get_trigrams(description)
+
+            if trigrams:
+                candidates.extend(self._trigram_index.get(trigram, set()) for trigram in trigrams)
+
+            else:
+                candidates.append(set(self._descriptions.keys()))
+
+        if not candidates:
+            paths: Iterable[str] = self._entries.keys()
+
+        else:
+            candidates.sort(key=len)
+            paths = set.intersection(*candidates)
+
+        # the trigrams may match even if the description does not contain the search text
+        if description is not None:
+            paths = (path for path in paths if description in self._descriptions[path])
+
+        return sorted((self._entries[path] for path in paths), key=lambda entry: entry.path)
+
+    def _add_resources(self, catalog_id: str, resources: Iterable[Resource]):
+
+        catalog_paths = self._catalog_paths.setdefault(catalog_id, set())
+
+        for resource in resources:
+
+            path = f"{catalog_id}/{resource.id}"
+            properties = _get_properties(resource)
+
+            self._entries[path] = ResourceIndexEntry(path, catalog_id, resource)
+            catalog_paths.add(path)
+
+            for key, value in properties.items():
+                for property_value in _get_property_values(value):
+                    self._property_index.setdefault(key, {}).setdefault(property_value, set()).add(path)
+
+            description = properties.get(_DESCRIPTION)
+
+            if isinstance(description, str):
+
+                description = description.lower()
+                self._descriptions[path] = description
+
+                for trigram in _get_trigrams(description):
+                    self._trigram_index.setdefault(trigram, set()).add(path)
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -69,6 +69,11 @@ setuptools.setup(
     },
     python_requires=">=3.9",
     install_requires=[
-        "httpx>=0.22.0"
-    ]
+        "httpx>=0.26.0"
+    ],
+    extras_require={
+        "orjson": ["orjson>=3.6.0"],
+        "http2": ["httpx[http2]>=0.26.0"],
+        "keyring": ["keyring>=23.0.0"]
+    }
 )
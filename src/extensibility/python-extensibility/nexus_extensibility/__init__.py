@@ -1,5 +1,8 @@
+from ._buffer_pool import *
 from ._data_model_extensions import *
 from ._data_model import *
 from ._extensibility_data_source import *
 from ._extensibility_utilities import *
-from ._i_extension import *
\ No newline at end of file
+from ._i_extension import *
+from ._structured_file_data_source import *
+from ._typed_views import *
\ No newline at end of file
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import threading
+from typing import Any, Tuple
+
+from ._data_model import NexusDataType
+from ._typed_views import cast_buffer
+
+_MIN_SIZE_CLASS = 4096
+_ZEROS = bytes(2**20)
+
+def _clear(view: memoryview):
+
+    # copy from a shared block of zeros instead of allocating a new one per call
+    for offset in range(0, len(view), len(_ZEROS)):
+        length = min(len(_ZEROS), len(view) - offset)
+        view[offset:offset + length] = _ZEROS[:length]
+
+class BufferPool:
+    """
+    A pool of reusable byte buffers, e.g. for the data and status buffers of read requests.
+
+    The buffers are grouped into size classes (powers of two) and each size class keeps a limited number of released buffers (arena) to be rented again. This way, data sources which read repeatedly run with almost no allocations. The pool is thread-safe.
+
+    Note: A released buffer must not be used afterwards, including memoryviews which were derived from it (e.g. via cast).
+    """
+
+    def __init__(self, max_buffers_per_size_class: int = 8):
+        """
+        Initializes a new instance of the BufferPool.
+
+            Args:
+                max_buffers_per_size_class: The maximum number of released buffers which are kept per size class.
+        """
+
+        self._max_buffers_per_size_class = max_buffers_per_size_class
+        self._arenas: dict[int, list[bytearray]] = {}
+        self._lock = threading.Lock()
+
+    def rent(self, length: int, clear: bool = True) -> memoryview:
+        """
+        Rents a buffer of the specified length.
+
+        Args:
+            length: The length of the buffer in bytes.
+            clear: A value which indicates if a reused buffer is zero-initialized. Newly allocated buffers are always zero-initialized.
+        """
+
+        if length < 0:
+            raise Exception("The length must be greater than or equal to zero.")
+
+        size_class = max(_MIN_SIZE_CLASS, 1 << (length - 1).bit_length())
+
+        with self._lock:
+            arena = self._arenas.get(size_class)
+            buffer = arena.pop() if arena else None
+
+        if buffer is None:
+            # bytearray(n) is zero-initialized without creating intermediate objects
+            view = memoryview(bytearray(size_class))[:length]
+
+        else:
+            view = memoryview(buffer)[:length]
+
+            if clear:
+                _clear(view)
+
+        return view
+
+    def rent_typed(self, element_count: int, data_type: NexusDataType, clear: bool = True) -> memoryview[Any]:
+        """
+        Rents a buffer for the specified number of elements and returns it as typed memoryview (see cast_buffer).
+
+        Args:
+            element_count: The number of elements.
+            data_type: The data type of the buffer elements.
+            clear: A value which indicates if a reused buffer is zero-initialized.
+        """
+
+        view = self.rent(element_count * ((int(data_type) & 0xFF) >> 3), clear)
+        typed_view = cast_buffer(view, data_type)
+
+        # the typed view keeps the buffer exported
+        view.release()
+
+        return typed_view
+
+    def release(self, view: memoryview) -> None:
+        """
+        Returns a rented buffer to the pool.
+
+        Args:
+            view: The memoryview which was returned by rent or rent_typed.
+        """
+
+        buffer = view.obj
+        view.release()
+
+        if not isinstance(buffer, bytearray) or len(buffer) < _MIN_SIZE_CLASS or len(buffer) & (len(buffer) - 1) != 0:
+            raise Exception("The buffer has not been rented from a buffer pool.")
+
+        with self._lock:
+
+            arena = self._arenas.setdefault(len(buffer), [])
+
+            if len(arena) < self._max_buffers_per_size_class:
+                arena.append(buffer)
+
+    def rent_buffers(self, element_count: int, element_size: int) -> Tuple[memoryview, memoryview]:
+        """
+        Rents a zero-initialized data buffer and a zero-initialized status buffer (one byte per element).
+
+        Args:
+            element_count: The number of elements.
+            element_size: The number of bytes per element.
+        """
+        return (self.rent(element_count * element_size), self.rent(element_count))
+
+    def clear(self) -> None:
+        """Removes all released buffers from the pool."""
+
+        with self._lock:
+            self._arenas.clear()
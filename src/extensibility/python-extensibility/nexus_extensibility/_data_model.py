@@ -146,8 +146,8 @@ class Representation:
 
     @property
     def element_size(self) -> int:
-        """The number of bits per element."""
-        return (int(self.data_type) and 0xFF) >> 3
+        """The number of bytes per element."""
+        return (int(self.data_type) & 0xFF) >> 3
 
 class Resource:
     """
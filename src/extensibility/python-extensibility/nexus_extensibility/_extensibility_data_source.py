@@ -3,11 +3,13 @@ from abc import ABC, abstractmethod
 from array import array
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Awaitable, Callable, List, Protocol, Tuple
+from typing import Any, Callable, List, Protocol, Tuple
 from urllib.parse import ParseResult
 
-from ._data_model import CatalogItem, CatalogRegistration, ResourceCatalog
+from ._data_model import (CatalogItem, CatalogRegistration, NexusDataType,
+                          ResourceCatalog)
 from ._i_extension import IExtension
+from ._typed_views import cast_buffer, to_numpy_array
 
 ################# DATA SOURCE TYPES ###############
 
@@ -86,6 +88,18 @@ class ReadRequest:
     status: memoryview
     """The status buffer. A value of 0x01 ('1') indicates that the corresponding value in the data buffer is valid, otherwise it is treated as float("NaN")."""
 
+    def typed_data(self) -> memoryview:
+        """Gets a typed view of the data buffer (e.g. format "d" for FLOAT64) without copying the data."""
+        return cast_buffer(self.data, self.catalog_item.representation.data_type)
+
+    def data_array(self) -> Any:
+        """Gets a numpy.ndarray view of the data buffer without copying the data (requires numpy)."""
+        return to_numpy_array(self.data, self.catalog_item.representation.data_type)
+
+    def status_array(self) -> Any:
+        """Gets a numpy.ndarray view (uint8) of the status buffer without copying the data (requires numpy)."""
+        return to_numpy_array(self.status, NexusDataType.UINT8)
+
 class ReadDataHandler(Protocol):
     """
     A handler to read data.
@@ -121,7 +135,7 @@ class IDataSource(IExtension, ABC):
         pass
 
     @abstractmethod
-    async def get_catalog_registrations_async(self, path: str) -> Awaitable[List[CatalogRegistration]]:
+    async def get_catalog_registrations_async(self, path: str) -> List[CatalogRegistration]:
         """
         Gets the catalog registrations that are located under path.
 
@@ -131,7 +145,7 @@ class IDataSource(IExtension, ABC):
         pass
 
     @abstractmethod
-    async def get_catalog_async(self, catalog_id: str) -> Awaitable[ResourceCatalog]:
+    async def get_catalog_async(self, catalog_id: str) -> ResourceCatalog:
         """
         Gets the requested ResourceCatalog.
 
@@ -141,7 +155,7 @@ class IDataSource(IExtension, ABC):
         pass
 
     @abstractmethod
-    async def get_time_range_async(self, catalog_id: str) -> Awaitable[Tuple[datetime, datetime]]:
+    async def get_time_range_async(self, catalog_id: str) -> Tuple[datetime, datetime]:
         """
         Gets the time range of the ResourceCatalog.
 
@@ -151,7 +165,7 @@ class IDataSource(IExtension, ABC):
         pass
 
     @abstractmethod
-    async def get_availability_async(self, catalogId: str, begin: datetime, end: datetime) -> Awaitable[float]:
+    async def get_availability_async(self, catalog_id: str, begin: datetime, end: datetime) -> float:
         """
         Gets the availability of the ResourceCatalog.
 
@@ -169,7 +183,7 @@ class IDataSource(IExtension, ABC):
         end: datetime,
         requests: list[ReadRequest], 
         read_data: ReadDataHandler,
-        report_progress: Callable[[float], None]) -> Awaitable[float]:
+        report_progress: Callable[[float], None]) -> None:
         """
         Performs a number of read requests.
 
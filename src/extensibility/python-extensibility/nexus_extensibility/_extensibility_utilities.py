@@ -1,18 +1,32 @@
 from abc import ABC
 from datetime import datetime, timedelta
-from typing import Tuple
+from typing import Optional, Tuple
 
+from ._buffer_pool import BufferPool
 from ._data_model import Representation
 
 
 class ExtensibilityUtilities(ABC):
 
     @staticmethod
-    def create_buffers(representation: Representation, begin: datetime, end: datetime) -> Tuple[memoryview, memoryview]:
+    def create_buffers(representation: Representation, begin: datetime, end: datetime, pool: Optional[BufferPool] = None) -> Tuple[memoryview, memoryview]:
+        """
+        Creates zero-initialized data and status buffers for the specified period.
+
+        Args:
+            representation: The representation.
+            begin: Start date/time.
+            end: End date/time.
+            pool: An optional buffer pool to rent the buffers from. The buffers should be returned via BufferPool.release when they are no longer needed.
+        """
+
         element_count = ExtensibilityUtilities._calculate_element_count(begin, end, representation.sample_period)
 
-        data = bytearray([0] * element_count * representation.element_size)
-        status = bytearray([0] * element_count * representation.element_size)
+        if pool is not None:
+            return pool.rent_buffers(element_count, representation.element_size)
+
+        data = bytearray(element_count * representation.element_size)
+        status = bytearray(element_count)
 
         return (memoryview(data), memoryview(status))
 
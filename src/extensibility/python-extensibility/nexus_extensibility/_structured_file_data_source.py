@@ -0,0 +1,625 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import mmap
+import os
+import re
+import time
+from abc import abstractmethod
+from bisect import bisect_left
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Callable, Optional, Tuple
+from urllib.parse import quote
+from urllib.request import url2pathname
+
+from ._data_model import CatalogItem
+from ._extensibility_data_source import (DataSourceContext, IDataSource,
+                                         LogLevel, ReadDataHandler,
+                                         ReadRequest)
+
+_DEFAULT_DATE = datetime(1900, 1, 1)
+_EPOCH = datetime(1, 1, 1)
+
+# folders which have been modified this recently may still change within the resolution of their modification time
+_MTIME_SAFETY_MARGIN = 2.0
+
+################# STRUCTURED FILE DATA SOURCE TYPES ###############
+
+@dataclass(frozen=True)
+class FileSource:
+    """
+    A structure to hold information about a file-based database.
+
+    Args:
+        path_segments: A list of strptime format strings that describe the folder structure of the data. An example of a file that is located under the path "group-A/2020-01" would translate into the list ["group-A", "%Y-%m"].
+        file_template: A strptime format string that describes the file naming scheme, e.g. "%Y-%m-%d_%H-%M-%S.dat".
+        file_date_time_preselector: An optional regular expression to select only relevant parts of a file name (e.g. to select the date/time in case there is more than one kind of file in the same folder). In case of a file named 20200101_13_my-id_1234.dat the preselector could be like "(.{11})_my-id".
+        file_date_time_selector: An optional date/time selector which is mandatory when the preselector is provided. In case of a file named like "20200101_13_my-id_1234.dat", and a preselector of "(.{11})_my-id", the selector should be like "%Y%m%d_%H".
+        file_period: The period per file.
+        utc_offset: The utc offset of the file.
+    """
+
+    path_segments: Tuple[str, ...]
+    """A list of strptime format strings that describe the folder structure of the data."""
+
+    file_template: str
+    """A strptime format string that describes the file naming scheme."""
+
+    file_date_time_preselector: Optional[str]
+    """An optional regular expression to select only relevant parts of a file name."""
+
+    file_date_time_selector: Optional[str]
+    """An optional date/time selector which is mandatory when the preselector is provided."""
+
+    file_period: timedelta
+    """The period per file."""
+
+    utc_offset: timedelta
+    """The utc offset of the file."""
+
+    def __post_init__(self):
+        # file sources are used as dictionary keys
+        object.__setattr__(self, "path_segments", tuple(self.path_segments))
+
+@dataclass
+class FileSourceProvider:
+    """
+    A file source provider provides information about the data files within a database.
+
+    Args:
+        single: A function that takes a catalog item and returns the corresponding file source information.
+        all: A dictionary that maps a catalog identifier to all file sources that belong to that catalog.
+    """
+
+    single: Callable[[CatalogItem], FileSource]
+    """A function that takes a catalog item and returns the corresponding file source information."""
+
+    all: dict[str, list[FileSource]]
+    """A dictionary that maps a catalog identifier to all file sources that belong to that catalog."""
+
+@dataclass
+class ReadInfo:
+    """
+    A structure to hold read information.
+
+    Args:
+        file_path: The path of the file to read.
+        catalog_item: The catalog item to read.
+        data: The data buffer.
+        status: The status buffer.
+        file_begin: The begin date/time of the file (UTC).
+        file_offset: The element offset within the file.
+        file_block: The element count to read from the file.
+        file_length: The expected total number of elements within the file.
+    """
+
+    file_path: str
+    """The path of the file to read."""
+
+    catalog_item: CatalogItem
+    """The catalog item to read."""
+
+    data: memoryview
+    """The data buffer."""
+
+    status: memoryview
+    """The status buffer."""
+
+    file_begin: datetime
+    """The begin date/time of the file (UTC)."""
+
+    file_offset: int
+    """The element offset within the file."""
+
+    file_block: int
+    """The element count to read from the file."""
+
+    file_length: int
+    """The expected total number of elements within the file."""
+
+################# FILE INDEX ###############
+
+def _to_naive_utc(value: datetime) -> datetime:
+
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+
+    return value
+
+def _try_parse(value: str, template: str) -> Optional[datetime]:
+
+    try:
+        return datetime.strptime(value, template)
+
+    except ValueError:
+        return None
+
+def _try_get_file_begin(file_name: str, file_source: FileSource, folder_begin: Optional[datetime]) -> Optional[datetime]:
+
+    file_template = file_source.file_template
+
+    # select the relevant parts of more complex file names
+    if file_source.file_date_time_preselector:
+
+        if not file_source.file_date_time_selector:
+            raise Exception("When a file date/time preselector is provided, the selector itself must be provided too.")
+
+        match = re.search(file_source.file_date_time_preselector, file_name)
+
+        if match is None:
+            return None
+
+        file_template = file_source.file_date_time_selector
+        file_name = "".join(group or "" for group in match.groups())
+
+    file_begin = _try_parse(file_name, file_template)
+
+    if file_begin is None:
+        return None
+
+    # date + time
+    if file_begin.date() != _DEFAULT_DATE.date():
+        return file_begin
+
+    # time only or no date/time at all: combine with the folder date/time
+    if folder_begin is None:
+        return None
+
+    return datetime.combine(folder_begin.date(), file_begin.time()) if file_begin != _DEFAULT_DATE else folder_begin
+
+class _FileIndex:
+
+    def __init__(self, file_source: FileSource, folders: Optional[dict[str, dict[str, Any]]] = None):
+
+        self.file_source = file_source
+        self.folders: dict[str, dict[str, Any]] = folders or {}
+        self.begins: list[datetime] = []
+        self.file_paths: list[str] = []
+
+        self._rebuild()
+
+    def update(self, root: str) -> bool:
+
+        visited: set[str] = set()
+        changed = self._visit(root, "", 0, None, visited, time.time())
+
+        for relative_path in [relative_path for relative_path in self.folders if relative_path not in visited]:
+            del self.folders[relative_path]
+            changed = True
+
+        if changed:
+            self._rebuild()
+
+        return changed
+
+    def find(self, begin: datetime, end: datetime) -> list[Tuple[datetime, str]]:
+
+        # all files which begin within (begin - file period, end)
+        start = bisect_left(self.begins, begin - self.file_source.file_period + timedelta(microseconds=1))
+        stop = bisect_left(self.begins, end)
+
+        return list(zip(self.begins[start:stop], self.file_paths[start:stop]))
+
+    def _visit(self, root: str, relative_path: str, depth: int, folder_begin: Optional[datetime], visited: set[str], now: float) -> bool:
+
+        path_segments = self.file_source.path_segments
+        folder_path = os.path.join(root, relative_path)
+
+        try:
+            mtime = os.stat(folder_path).st_mtime
+
+        except FileNotFoundError:
+            return False
+
+        visited.add(relative_path)
+
+        entry = self.folders.get(relative_path)
+        changed = False
+
+        # only folders whose entries have changed are scanned again
+        if entry is None or entry["mtime"] != mtime:
+
+            folders: list[str] = []
+            files: list[Tuple[str, str]] = []
+
+            with os.scandir(folder_path) as folder_entries:
+                for folder_entry in folder_entries:
+
+                    if depth < len(path_segments):
+                        if folder_entry.is_dir() and _try_parse(folder_entry.name, path_segments[depth]) is not None:
+                            folders.append(folder_entry.name)
+
+                    elif folder_entry.is_file():
+
+                        file_begin = _try_get_file_begin(folder_entry.name, self.file_source, folder_begin)
+
+                        if file_begin is not None:
+                            files.append((folder_entry.name, file_begin.isoformat()))
+
+            entry = {
+                "mtime": mtime if now - mtime > _MTIME_SAFETY_MARGIN else None,
+                "folders": sorted(folders),
+                "files": sorted(files)
+            }
+
+            self.folders[relative_path] = entry
+            changed = True
+
+        for folder_name in entry["folders"]:
+
+            child_begin = _try_parse(folder_name, path_segments[depth])
+
+            # deeper folders carry more fine-grained date/time information
+            if child_begin is None or child_begin == _DEFAULT_DATE:
+                child_begin = folder_begin
+
+            child_changed = self._visit(root, os.path.join(relative_path, folder_name), depth + 1, child_begin, visited, now)
+            changed = changed or child_changed
+
+        return changed
+
+    def _rebuild(self):
+
+        utc_offset = self.file_source.utc_offset
+
+        files = sorted(
+            (datetime.fromisoformat(file_begin) - utc_offset, os.path.join(relative_path, file_name))
+            for relative_path, entry in self.folders.items()
+            for file_name, file_begin in entry["files"])
+
+        self.begins = [file_begin for file_begin, _ in files]
+        self.file_paths = [file_path for _, file_path in files]
+
+################# STRUCTURED FILE DATA SOURCE ###############
+
+class StructuredFileDataSource(IDataSource):
+    """
+    A base class to simplify reading data from structured, file-based data sources.
+
+    The files of each file source are tracked in an index which maps the files to their begin date/times. The index is persisted and updated incrementally: only folders whose modification time has changed are scanned again. Requests which span multiple files are read in parallel worker threads.
+    """
+
+    # This implementation assumes the following:
+    #
+    # (1) The top-most folders carry rough date/time information while deeper nested
+    # folders carry more fine-grained date/time information (e.g. /2019-12/2019-12-31_12-00-00.dat).
+    #
+    # (2) The files are always located in the most nested folder and not distributed
+    # over the hierarchy.
+    #
+    # (3) File periods are constant (except for partially written files).
+    #
+    # (4) UTC offset is a correction factor that should be selected so that the parsed
+    # date/time of a file points to the UTC date/time of the very first representation within
+    # that file.
+    #
+    # (5) Only file URLs are supported
+
+    root: str
+    """The root path of the database."""
+
+    context: DataSourceContext
+    """The data source context."""
+
+    file_source_provider: FileSourceProvider
+    """The file source provider."""
+
+    max_concurrency: int = 4
+    """The maximum number of files which are read in parallel."""
+
+    _index_file_name: str = "index.json"
+
+    async def set_context_async(self, context: DataSourceContext):
+        """
+        Invoked by Nexus right after construction to provide the context. Subclasses which override this method must call the base implementation.
+
+        Args:
+            context: The context.
+        """
+
+        self.root = url2pathname(context.resource_locator.path)
+        self.context = context
+        self.file_source_provider = await self.get_file_source_provider_async()
+
+        self._indexes: dict[FileSource, _FileIndex] = {}
+        self._index_lock = asyncio.Lock()
+        self._load_indexes()
+
+    @abstractmethod
+    async def get_file_source_provider_async(self) -> FileSourceProvider:
+        """
+        Gets the file source provider that in turn provides information about the file structure within the database.
+        """
+        pass
+
+    @abstractmethod
+    def read_single(self, info: ReadInfo) -> None:
+        """
+        Reads a dataset from the provided file. This method is invoked from a worker thread. Files which cover the same period are read sequentially, all others in parallel.
+
+        Args:
+            info: The read information.
+        """
+        pass
+
+    def get_index_folder_path(self) -> Optional[str]:
+        """Gets the folder to persist the file index in. Return None to keep the index in memory only."""
+        return os.path.join(str(Path.home()), ".nexus-extensibility", "file-index", quote(self.root, safe=""))
+
+    def get_file_availability(self, file_path: str) -> float:
+        """
+        Returns the availability within a file. This method is invoked from a worker thread.
+
+        Args:
+            file_path: The file path.
+        """
+        return 1.0
+
+    def read_mapped_file(self, info: ReadInfo, header_size: int = 0) -> None:
+        """
+        Reads the data of a file which contains the values of a single resource as contiguous elements via a memory-mapped file and marks all read elements as valid. Files which are shorter than expected (partially written files) are read as far as possible.
+
+        Args:
+            info: The read information.
+            header_size: The size of the file header in bytes.
+        """
+
+        element_size = info.catalog_item.representation.element_size
+        start = header_size + info.file_offset * element_size
+
+        with open(info.file_path, "rb") as file:
+
+            file_size = os.fstat(file.fileno()).st_size
+            element_count = max(0, min(info.file_block, (file_size - start) // element_size))
+
+            if element_count == 0:
+                return
+
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as memory_map:
+
+                length = element_count * element_size
+
+                # let the operating system prefetch the requested range
+                if hasattr(memory_map, "madvise"):
+                    page_start = start - start % mmap.ALLOCATIONGRANULARITY
+                    memory_map.madvise(mmap.MADV_WILLNEED, page_start, start + length - page_start)
+
+                with memoryview(memory_map) as view:
+                    info.data[:length] = view[start:start + length]
+
+        info.status[:element_count] = b"\x01" * element_count
+
+    async def get_time_range_async(self, catalog_id: str) -> Tuple[datetime, datetime]:
+
+        await self._update_indexes_async()
+
+        begin = datetime.max
+        end = datetime.min
+
+        for file_source in self.file_source_provider.all[catalog_id]:
+
+            index = self._indexes[file_source]
+
+            if index.begins:
+                begin = min(begin, index.begins[0])
+                end = max(end, index.begins[-1] + file_source.file_period)
+
+        if begin > end:
+            return (datetime.max.replace(tzinfo=timezone.utc), datetime.min.replace(tzinfo=timezone.utc))
+
+        return (begin.replace(tzinfo=timezone.utc), end.replace(tzinfo=timezone.utc))
+
+    async def get_availability_async(self, catalog_id: str, begin: datetime, end: datetime) -> float:
+
+        if begin >= end:
+            raise Exception("The start time must be before the end time.")
+
+        await self._update_indexes_async()
+
+        begin = _to_naive_utc(begin)
+        end = _to_naive_utc(end)
+        file_sources = self.file_source_provider.all[catalog_id]
+
+        if not file_sources:
+            return 0.0
+
+        summed_availability = 0.0
+
+        for file_source in file_sources:
+
+            file_paths = [
+                os.path.join(self.root, file_path)
+                for file_begin, file_path in self._indexes[file_source].find(begin, end)
+                if begin <= file_begin
+            ]
+
+            availabilities = await asyncio.gather(*[asyncio.to_thread(self._try_get_file_availability, file_path) for file_path in file_paths])
+            total = (end - begin) / file_source.file_period
+
+            summed_availability += sum(availabilities) / total
+
+        return summed_availability / len(file_sources)
+
+    async def read_async(
+        self,
+        begin: datetime,
+        end: datetime,
+        requests: list[ReadRequest],
+        read_data: ReadDataHandler,
+        report_progress: Callable[[float], None]) -> None:
+
+        if begin >= end:
+            raise Exception("The start time must be before the end time.")
+
+        await self._update_indexes_async()
+
+        begin = _to_naive_utc(begin)
+        end = _to_naive_utc(end)
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        counter = 0.0
+
+        for request in requests:
+
+            try:
+                await self._read_request_async(request, begin, end, semaphore)
+
+            except Exception as ex:
+                self.context.logger.log(LogLevel.Error, f"Could not read catalog item {request.catalog_item.to_path()}: {ex}")
+
+            counter += 1
+            report_progress(counter / len(requests))
+
+    async def _read_request_async(self, request: ReadRequest, begin: datetime, end: datetime, semaphore: asyncio.Semaphore):
+
+        catalog_item = request.catalog_item
+        representation = catalog_item.representation
+        sample_period = representation.sample_period
+        element_size = representation.element_size
+        file_source = self.file_source_provider.single(catalog_item)
+        file_length = file_source.file_period // sample_period
+
+        # versioned files of the same period must be read in order
+        groups: dict[datetime, list[ReadInfo]] = {}
+
+        for file_begin, file_path in self._indexes[file_source].find(begin, end):
+
+            current_begin = max(begin, file_begin)
+            current_end = min(end, file_begin + file_source.file_period)
+
+            if current_begin >= current_end:
+                continue
+
+            buffer_offset = (current_begin - begin) // sample_period
+            file_block = (current_end - current_begin) // sample_period
+
+            info = ReadInfo(
+                os.path.join(self.root, file_path),
+                catalog_item,
+                request.data[buffer_offset * element_size:(buffer_offset + file_block) * element_size],
+                request.status[buffer_offset:buffer_offset + file_block],
+                file_begin.replace(tzinfo=timezone.utc),
+                (current_begin - file_begin) // sample_period,
+                file_block,
+                file_length)
+
+            groups.setdefault(_EPOCH + (file_begin - _EPOCH) // file_source.file_period * file_source.file_period, []).append(info)
+
+        async def read_group(infos: list[ReadInfo]):
+            async with semaphore:
+                await asyncio.to_thread(self._try_read_group, infos)
+
+        await asyncio.gather(*[read_group(infos) for infos in groups.values()])
+
+    def _try_read_group(self, infos: list[ReadInfo]):
+
+        for info in infos:
+
+            try:
+                self.read_single(info)
+
+            except Exception as ex:
+                self.context.logger.log(LogLevel.Debug, f"Could not process file {info.file_path}: {ex}")
+
+    def _try_get_file_availability(self, file_path: str) -> float:
+
+        try:
+            return self.get_file_availability(file_path)
+
+        except Exception as ex:
+            self.context.logger.log(LogLevel.Debug, f"Could not process file {file_path}: {ex}")
+            return 0.0
+
+    async def _update_indexes_async(self):
+
+        # concurrent callers share the update
+        async with self._index_lock:
+            await asyncio.to_thread(self._update_indexes)
+
+    def _update_indexes(self):
+
+        changed = False
+
+        for file_sources in self.file_source_provider.all.values():
+            for file_source in file_sources:
+
+                index = self._indexes.get(file_source)
+
+                if index is None:
+                    index = _FileIndex(file_source)
+                    self._indexes[file_source] = index
+
+                if os.path.isdir(self.root):
+                    changed = index.update(self.root) or changed
+
+        if changed:
+            self._save_indexes()
+
+    def _load_indexes(self):
+
+        index_folder_path = self.get_index_folder_path()
+
+        if index_folder_path is None:
+            return
+
+        index_file_path = os.path.join(index_folder_path, self._index_file_name)
+
+        if not os.path.isfile(index_file_path):
+            return
+
+        try:
+            with open(index_file_path) as json_file:
+                jsonObject = json.load(json_file)
+
+        # the index is rebuilt if it cannot be loaded
+        except Exception as ex:
+            self.context.logger.log(LogLevel.Debug, f"Could not load file index {index_file_path}: {ex}")
+            return
+
+        file_sources = {
+            _get_file_source_key(file_source): file_source
+            for file_sources in self.file_source_provider.all.values()
+            for file_source in file_sources
+        }
+
+        for entry in jsonObject:
+
+            file_source = file_sources.get(entry["fileSource"])
+
+            if file_source is not None:
+                self._indexes[file_source] = _FileIndex(file_source, entry["folders"])
+
+    def _save_indexes(self):
+
+        index_folder_path = self.get_index_folder_path()
+
+        if index_folder_path is None:
+            return
+
+        os.makedirs(index_folder_path, exist_ok=True)
+
+        index_file_path = os.path.join(index_folder_path, self._index_file_name)
+        temp_file_path = f"{index_file_path}.{os.getpid()}.tmp"
+
+        jsonObject = [
+            { "fileSource": _get_file_source_key(file_source), "folders": index.folders }
+            for file_source, index in self._indexes.items()
+        ]
+
+        with open(temp_file_path, "w") as json_file:
+            json.dump(jsonObject, json_file)
+
+        os.replace(temp_file_path, index_file_path)
+
+def _get_file_source_key(file_source: FileSource) -> str:
+
+    return json.dumps([
+        list(file_source.path_segments),
+        file_source.file_template,
+        file_source.file_date_time_preselector,
+        file_source.file_date_time_selector,
+        file_source.file_period.total_seconds(),
+        file_source.utc_offset.total_seconds()
+    ])
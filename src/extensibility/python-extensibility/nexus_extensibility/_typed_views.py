@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+from typing import Any, Literal
+
+from ._data_model import NexusDataType
+
+_StructFormat = Literal["B", "b", "H", "h", "I", "i", "Q", "q", "f", "d"]
+
+_struct_formats: dict[NexusDataType, _StructFormat] = {
+    NexusDataType.UINT8: "B",
+    NexusDataType.INT8: "b",
+    NexusDataType.UINT16: "H",
+    NexusDataType.INT16: "h",
+    NexusDataType.UINT32: "I",
+    NexusDataType.INT32: "i",
+    NexusDataType.UINT64: "Q",
+    NexusDataType.INT64: "q",
+    NexusDataType.FLOAT32: "f",
+    NexusDataType.FLOAT64: "d"
+}
+
+# the data buffers are little-endian
+_numpy_dtypes: dict[NexusDataType, str] = {
+    NexusDataType.UINT8: "u1",
+    NexusDataType.INT8: "i1",
+    NexusDataType.UINT16: "<u2",
+    NexusDataType.INT16: "<i2",
+    NexusDataType.UINT32: "<u4",
+    NexusDataType.INT32: "<i4",
+    NexusDataType.UINT64: "<u8",
+    NexusDataType.INT64: "<i8",
+    NexusDataType.FLOAT32: "<f4",
+    NexusDataType.FLOAT64: "<f8"
+}
+
+def get_struct_format(data_type: NexusDataType) -> str:
+    """
+    Gets the struct / memoryview format character of the specified data type.
+
+    Args:
+        data_type: The data type.
+    """
+    return _struct_formats[data_type]
+
+def get_numpy_dtype(data_type: NexusDataType) -> Any:
+    """
+    Gets the NumPy dtype of the specified data type (requires numpy).
+
+    Args:
+        data_type: The data type.
+    """
+
+    import numpy
+
+    return numpy.dtype(_numpy_dtypes[data_type])
+
+def cast_buffer(buffer: memoryview, data_type: NexusDataType) -> memoryview[Any]:
+    """
+    Casts a byte buffer to a typed memoryview without copying the data. The memoryview uses the native byte order (which is little-endian on all common platforms).
+
+    Args:
+        buffer: The byte buffer.
+        data_type: The data type of the buffer elements.
+    """
+    return memoryview(buffer).cast("B").cast(_struct_formats[data_type])
+
+def to_numpy_array(buffer: memoryview, data_type: NexusDataType) -> Any:
+    """
+    Creates a numpy.ndarray view of a byte buffer without copying the data (requires numpy). The array is writable if the buffer is writable.
+
+    Args:
+        buffer: The byte buffer.
+        data_type: The data type of the buffer elements.
+    """
+
+    import numpy
+
+    return numpy.frombuffer(buffer, dtype=get_numpy_dtype(data_type))
@@ -0,0 +1,181 @@
+from __future__ import annotations
+
+import enum
+import warnings
+
+import numpy
+
+from ._data_model import NexusDataType
+from ._extensibility_data_source import ReadRequest
+from ._typed_views import to_numpy_array
+
+
+class RepresentationKind(enum.IntEnum):
+    """Specifies the representation kind."""
+
+    ORIGINAL = 0
+    """The original data."""
+
+    RESAMPLED = 10
+    """The resampled data."""
+
+    MEAN = 20
+    """The mean of each block."""
+
+    MEAN_POLAR_DEG = 30
+    """The mean of the angles (in degrees) of each block."""
+
+    MIN = 40
+    """The minimum of each block."""
+
+    MAX = 50
+    """The maximum of each block."""
+
+    STD = 60
+    """The (sample) standard deviation of each block."""
+
+    RMS = 70
+    """The root mean square of each block."""
+
+    MIN_BITWISE = 80
+    """The bitwise AND of the values of each block (integer data types only)."""
+
+    MAX_BITWISE = 90
+    """The bitwise OR of the values of each block (integer data types only)."""
+
+    SUM = 100
+    """The sum of each block."""
+
+_BITWISE_KINDS = (RepresentationKind.MIN_BITWISE, RepresentationKind.MAX_BITWISE)
+
+def apply_status(data: memoryview, status: memoryview, data_type: NexusDataType) -> numpy.ndarray:
+    """
+    Converts the data to float64 and replaces all values whose status is not 1 with NaN.
+
+    Args:
+        data: The data buffer.
+        status: The status buffer.
+        data_type: The data type of the data buffer.
+    """
+
+    values = to_numpy_array(data, data_type).astype(numpy.float64)
+    values[to_numpy_array(status, NexusDataType.UINT8) != 1] = numpy.nan
+
+    return values
+
+def aggregate(
+    kind: RepresentationKind,
+    data: memoryview,
+    status: memoryview,
+    data_type: NexusDataType,
+    block_size: int,
+    nan_threshold: float = 0.99) -> numpy.ndarray:
+    """
+    Aggregates the data block-wise like the Nexus server does (requires numpy). A block whose share of valid values is less than the NaN threshold results in NaN.
+
+    Args:
+        kind: The aggregation function.
+        data: The data buffer.
+        status: The status buffer.
+        data_type: The data type of the data buffer.
+        block_size: The number of elements per block.
+        nan_threshold: The minimum share of valid values per block (see the AggregationNaNThreshold option of the server).
+    """
+
+    if block_size <= 0:
+        raise Exception("The block size must be greater than zero.")
+
+    if kind in _BITWISE_KINDS:
+        result, valid_count = _aggregate_bitwise(kind, data, status, data_type, block_size)
+
+    else:
+        result, valid_count = _aggregate(kind, apply_status(data, status, data_type), block_size)
+
+    result[valid_count / block_size < nan_threshold] = numpy.nan
+
+    return result
+
+def aggregate_request(
+    kind: RepresentationKind,
+    request: ReadRequest,
+    block_size: int,
+    nan_threshold: float = 0.99) -> numpy.ndarray:
+    """
+    Aggregates the data of the read request block-wise (see aggregate).
+
+    Args:
+        kind: The aggregation function.
+        request: The read request.
+        block_size: The number of elements per block.
+        nan_threshold: The minimum share of valid values per block.
+    """
+
+    data_type = request.catalog_item.representation.data_type
+    return aggregate(kind, request.data, request.status, data_type, block_size, nan_threshold)
+
+def _to_blocks(values: numpy.ndarray, block_size: int) -> numpy.ndarray:
+
+    if len(values) % block_size != 0:
+        raise Exception(f"The number of elements {len(values)} is not a multiple of the block size {block_size}.")
+
+    return values.reshape(-1, block_size)
+
+def _aggregate(kind: RepresentationKind, values: numpy.ndarray, block_size: int):
+
+    blocks = _to_blocks(values, block_size)
+    valid_count = numpy.count_nonzero(~numpy.isnan(blocks), axis=1)
+
+    # blocks without valid values result in NaN (with a warning)
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", category=RuntimeWarning)
+
+        if kind == RepresentationKind.MEAN:
+            result = numpy.nanmean(blocks, axis=1)
+
+        elif kind == RepresentationKind.MEAN_POLAR_DEG:
+            limit = 360
+            factor = 2 * numpy.pi / limit
+            radians = blocks * factor
+            result = numpy.arctan2(numpy.nansum(numpy.sin(radians), axis=1), numpy.nansum(numpy.cos(radians), axis=1)) / factor
+            result[result < 0] += limit
+
+        elif kind == RepresentationKind.MIN:
+            result = numpy.nanmin(blocks, axis=1)
+
+        elif kind == RepresentationKind.MAX:
+            result = numpy.nanmax(blocks, axis=1)
+
+        elif kind == RepresentationKind.STD:
+            result = numpy.nanstd(blocks, axis=1, ddof=1)
+
+        elif kind == RepresentationKind.RMS:
+            result = numpy.sqrt(numpy.nanmean(blocks * blocks, axis=1))
+
+        elif kind == RepresentationKind.SUM:
+            result = numpy.nansum(blocks, axis=1)
+
+        else:
+            raise Exception(f"The representation kind {kind.name} is not supported.")
+
+    return result, valid_count
+
+def _aggregate_bitwise(kind: RepresentationKind, data: memoryview, status: memoryview, data_type: NexusDataType, block_size: int):
+
+    values = to_numpy_array(data, data_type)
+
+    if values.dtype.kind not in "iu":
+        raise Exception(f"The representation kind {kind.name} is not supported for data type {data_type.name}.")
+
+    blocks = _to_blocks(values, block_size)
+    is_valid = _to_blocks(to_numpy_array(status, NexusDataType.UINT8), block_size) == 1
+    valid_count = numpy.count_nonzero(is_valid, axis=1)
+
+    # invalid values are replaced by the neutral element of the operation
+    if kind == RepresentationKind.MIN_BITWISE:
+        result = numpy.bitwise_and.reduce(numpy.where(is_valid, blocks, ~blocks.dtype.type(0)), axis=1)
+        result[valid_count == 0] = 0
+
+    else:
+        result = numpy.bitwise_or.reduce(numpy.where(is_valid, blocks, blocks.dtype.type(0)), axis=1)
+
+    return result.astype(numpy.float64), valid_count
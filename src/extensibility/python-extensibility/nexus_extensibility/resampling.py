@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+import numpy
+
+from ._data_model import NexusDataType
+from ._extensibility_data_source import ReadRequest
+from .processing import apply_status
+
+_EPOCH = datetime(1, 1, 1)
+
+def _to_offset(value: datetime) -> timedelta:
+
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+
+    return value - _EPOCH
+
+def validate_resampling(begin: datetime, end: datetime, base_sample_period: timedelta, sample_period: timedelta) -> None:
+    """
+    Validates that the begin, the end and both sample periods are multiples of each other, which is required for resampling.
+
+    Args:
+        begin: Start date/time.
+        end: End date/time.
+        base_sample_period: The sample period of the data to resample.
+        sample_period: The target sample period.
+    """
+
+    if begin >= end:
+        raise Exception("The begin datetime must be less than the end datetime.")
+
+    if base_sample_period <= timedelta(0) or sample_period <= timedelta(0):
+        raise Exception("The sample periods must be greater than zero.")
+
+    larger_sample_period = max(base_sample_period, sample_period)
+    smaller_sample_period = min(base_sample_period, sample_period)
+
+    if larger_sample_period % smaller_sample_period != timedelta(0):
+        raise Exception("The base sample period and the sample period must be multiples of each other.")
+
+    if _to_offset(begin) % larger_sample_period != timedelta(0):
+        raise Exception(f"The begin parameter must be a multiple of the sample period {larger_sample_period}.")
+
+    if _to_offset(end) % larger_sample_period != timedelta(0):
+        raise Exception(f"The end parameter must be a multiple of the sample period {larger_sample_period}.")
+
+def resample(
+    data: memoryview,
+    status: memoryview,
+    data_type: NexusDataType,
+    begin: datetime,
+    end: datetime,
+    base_sample_period: timedelta,
+    sample_period: timedelta) -> numpy.ndarray:
+    """
+    Resamples the data to the target sample period (requires numpy). When the target sample period is smaller, each value is repeated. When it is larger, the first value of each block is taken. Values whose status is not 1 result in NaN.
+
+    Args:
+        data: The data buffer.
+        status: The status buffer.
+        data_type: The data type of the data buffer.
+        begin: Start date/time.
+        end: End date/time.
+        base_sample_period: The sample period of the data buffer.
+        sample_period: The target sample period.
+    """
+
+    validate_resampling(begin, end, base_sample_period, sample_period)
+
+    element_count = (end - begin) // base_sample_period
+    values = apply_status(data, status, data_type)
+
+    if len(values) != element_count:
+        raise Exception(f"The buffer contains {len(values)} elements but {element_count} elements are required for the period from {begin} to {end}.")
+
+    if base_sample_period > sample_period:
+        return numpy.repeat(values, base_sample_period // sample_period)
+
+    elif base_sample_period < sample_period:
+        return values[::sample_period // base_sample_period]
+
+    else:
+        return values
+
+def resample_request(request: ReadRequest, begin: datetime, end: datetime, sample_period: timedelta) -> numpy.ndarray:
+    """
+    Resamples the data of the read request to the target sample period (see resample).
+
+    Args:
+        request: The read request.
+        begin: Start date/time.
+        end: End date/time.
+        sample_period: The target sample period.
+    """
+
+    representation = request.catalog_item.representation
+
+    return resample(
+        request.data,
+        request.status,
+        representation.data_type,
+        begin,
+        end,
+        representation.sample_period,
+        sample_period)
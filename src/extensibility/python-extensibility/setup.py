@@ -70,5 +70,8 @@ setuptools.setup(
     python_requires=">=3.9",
     install_requires=[
         
-    ]
+    ],
+    extras_require={
+        "numpy": ["numpy>=1.20.0"]
+    }
 )
@@ -1,16 +1,44 @@
+import asyncio
 import base64
+import io
 import json
+import os
+import struct
+import sys
+import time
 import uuid
+import zipfile
+from array import array
+from datetime import datetime, timedelta, timezone
+from urllib.parse import unquote
 
+import numpy
 import pytest
-from httpx import AsyncClient, MockTransport, Request, Response, codes
-from nexus_api import NexusAsyncClient, ResourceCatalog
+from httpx import (URL, AsyncByteStream, AsyncClient, MockTransport,
+                   ReadError, Request, Response, codes)
+from nexus_api import (CatalogCache, CatalogInfo, DataCache, ExportParameters,
+                       FileTokenStore, Job, JobStatus, KeyringTokenStore,
+                       MemoryMappedStorage, MemoryTokenStore, NexusAsyncClient,
+                       NexusDataType, OrjsonBackend,
+                       Representation, Resource, ResourceCatalog,
+                       ResourceIndex, StdlibJsonBackend, TaskStatus,
+                       TransportProfile, _nexus_api, transport_profiles)
+from nexus_api._data_storage import _to_element_index
 
 nexus_configuration_header_key = "Nexus-Configuration"
 
 refresh_token = str(uuid.uuid1())
 refresh_token_try_count: int = 0
 catalog_try_count: int = 0
+catalog_request_count: int = 0
+job_status_request_counts: dict[str, int] = {}
+artifact_range_headers: list = []
+export_jobs: dict[str, dict] = {}
+uploaded_attachments: dict[str, bytes] = {}
+token_refresh_count: int = 0
+valid_refresh_tokens: set[str] = set()
+token_lifetime: float = 0
+unauthorized_count: int = 0
 
 def _handler1(request: Request):
     global refresh_token
@@ -32,14 +60,14 @@ def _handler1(request: Request):
 
     elif "refresh-token" in request.url.path:
         refresh_token_try_count += 1
-        requestContent = request.content.decode("utf-8")
+        requestContent = json.loads(request.content)
 
         if refresh_token_try_count == 1:
-            assert f'{{"refreshToken": "{refresh_token}"}}' == requestContent
+            assert { "refreshToken": refresh_token } == requestContent
             return Response(codes.OK, content='{ "accessToken": "111", "refreshToken": "222" }')
 
         else:
-            assert '{"refreshToken": "222"}' == requestContent
+            assert { "refreshToken": "222" } == requestContent
             return Response(codes.OK, content='{ "accessToken": "333", "refreshToken": "444" }')
 
     else:
@@ -127,3 +155,1261 @@ async def can_add_configuration_test():
         # assert (already asserted in _handler2)
 
     b = 1
+
+def _handler14(request: Request):
+
+    if "catalogs" in request.url.path:
+
+        # echo the configuration
+        encoded_configuration = request.headers.get(nexus_configuration_header_key)
+        configuration = None if encoded_configuration is None else json.loads(base64.b64decode(encoded_configuration))
+        catalog_id = "none" if configuration is None else configuration["user"]
+
+        return Response(codes.OK, content=json.dumps({ "id": catalog_id, "properties": None, "resources": None }))
+
+    else:
+        raise Exception("Unsupported path.")
+
+@pytest.mark.asyncio
+async def can_scope_configuration_to_task_test():
+
+    # arrange
+    http_client = AsyncClient(base_url="http://localhost", transport=MockTransport(_handler14))
+
+    async with NexusAsyncClient(http_client) as client:
+
+        async def get_catalog_id(user: str):
+
+            with client.attach_configuration({ "user": user }):
+
+                # let the other tasks attach their configuration in the meantime
+                await asyncio.sleep(0)
+                catalog = await client.catalogs.get("/A")
+
+            return catalog.id
+
+        # act
+        users = [f"user{i}" for i in range(10)]
+        actual = await asyncio.gather(*[get_catalog_id(user) for user in users])
+        actual_without_configuration = (await client.catalogs.get("/A")).id
+
+        # assert
+        assert users == actual
+        assert "none" == actual_without_configuration
+
+def _handler3(request: Request):
+
+    if "data" in request.url.path:
+
+        values = [float(i) for i in range(10)]
+        data = struct.pack(f"<{len(values)}d", *values)
+
+        # deliver the data in chunks which are not aligned to 8-byte boundaries
+        async def stream():
+            for i in range(0, len(data), 13):
+                yield data[i:i + 13]
+
+        return Response(codes.OK, content=stream())
+
+    else:
+        raise Exception("Unsupported path.")
+
+@pytest.mark.asyncio
+async def can_iterate_doubles_test():
+
+    # arrange
+    begin = datetime(2020, 1, 1, 0, 0, tzinfo=timezone.utc)
+    end = datetime(2020, 1, 1, 0, 0, 10, tzinfo=timezone.utc)
+    http_client = AsyncClient(base_url="http://localhost", transport=MockTransport(_handler3))
+
+    async with NexusAsyncClient(http_client) as client:
+
+        # act
+        async with await client.data.get_stream("/a/b/c/T1/1_s", begin, end) as response:
+            actual = [list(block) async for block in response.iter_doubles(chunk_elements=4)]
+
+        # assert
+        expected = [[0.0, 1.0, 2.0, 3.0], [4.0, 5.0, 6.0, 7.0], [8.0, 9.0]]
+        assert expected == actual
+
+@pytest.mark.asyncio
+async def can_read_into_buffer_test():
+
+    # arrange
+    begin = datetime(2020, 1, 1, 0, 0, tzinfo=timezone.utc)
+    end = datetime(2020, 1, 1, 0, 0, 10, tzinfo=timezone.utc)
+    http_client = AsyncClient(base_url="http://localhost", transport=MockTransport(_handler3))
+    target = array("d", [-1.0] * 12)
+
+    async with NexusAsyncClient(http_client) as client:
+
+        # act
+        async with await client.data.get_stream("/a/b/c/T1/1_s", begin, end) as response:
+            actual = await response.read_into(target)
+
+        # assert
+        assert 10 == actual
+        assert [float(i) for i in range(10)] + [-1.0, -1.0] == list(target)
+
+@pytest.mark.asyncio
+async def read_into_throws_for_too_small_buffer_test():
+
+    # arrange
+    begin = datetime(2020, 1, 1, 0, 0, tzinfo=timezone.utc)
+    end = datetime(2020, 1, 1, 0, 0, 10, tzinfo=timezone.utc)
+    http_client = AsyncClient(base_url="http://localhost", transport=MockTransport(_handler3))
+
+    async with NexusAsyncClient(http_client) as client:
+
+        async with await client.data.get_stream("/a/b/c/T1/1_s", begin, end) as response:
+
+            # act / assert
+            with pytest.raises(Exception):
+                await response.read_into(bytearray(9 * 8))
+
+@pytest.mark.asyncio
+async def read_into_throws_for_other_element_types_test():
+
+    # arrange
+    begin = datetime(2020, 1, 1, 0, 0, tzinfo=timezone.utc)
+    end = datetime(2020, 1, 1, 0, 0, 10, tzinfo=timezone.utc)
+    http_client = AsyncClient(base_url="http://localhost", transport=MockTransport(_handler3))
+
+    async with NexusAsyncClient(http_client) as client:
+
+        async with await client.data.get_stream("/a/b/c/T1/1_s", begin, end) as response:
+
+            # act / assert
+            with pytest.raises(Exception, match="float64"):
+                await response.read_into(numpy.zeros(20, dtype=numpy.float32))
+
+data_request_count: int = 0
+data_element_count: int = 0
+
+def _handler4(request: Request):
+    global data_request_count
+    global data_element_count
+
+    if "data" in request.url.path:
+        data_request_count += 1
+
+        # each value is the number of seconds since the reference date/time
+        reference = datetime(2020, 1, 1, 0, 0, tzinfo=timezone.utc)
+        begin = datetime.fromisoformat(request.url.params["begin"])
+        end = datetime.fromisoformat(request.url.params["end"])
+
+        values = [
+            (begin - reference).total_seconds() + i 
+            for i in range(int((end - begin).total_seconds()))
+        ]
+
+        data_element_count += len(values)
+
+        return Response(codes.OK, content=struct.pack(f"<{len(values)}d", *values))
+
+    else:
+        raise Exception("Unsupported path.")
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "parts, part_period, expected_request_count", 
+    [
+        (3, None, 3),
+        (4, timedelta(seconds=2), 5)
+    ])
+async def can_get_stream_parallel_test(parts: int, part_period: timedelta, expected_request_count: int):
+    global data_request_count
+
+    # arrange
+    data_request_count = 0
+    begin = datetime(2020, 1, 1, 0, 0, tzinfo=timezone.utc)
+    end = datetime(2020, 1, 1, 0, 0, 10, tzinfo=timezone.utc)
+    http_client = AsyncClient(base_url="http://localhost", transport=MockTransport(_handler4))
+
+    async with NexusAsyncClient(http_client) as client:
+
+        # act
+        actual = await client.data.get_stream_parallel("/a/b/c/T1/1_s_mean", begin, end, parts=parts, part_period=part_period)
+
+        # assert
+        assert [float(i) for i in range(10)] == list(actual)
+        assert expected_request_count == data_request_count
+
+@pytest.mark.asyncio
+async def can_get_many_test():
+
+    # arrange
+    begin = datetime(2020, 1, 1, 0, 0, 5, tzinfo=timezone.utc)
+    end = datetime(2020, 1, 1, 0, 0, 10, tzinfo=timezone.utc)
+    resource_paths = ["/a/b/c/T1/1_s", "/a/b/c/T2/1_s_mean", "/a/b/c/T3/1_s"]
+    http_client = AsyncClient(base_url="http://localhost", transport=MockTransport(_handler4))
+
+    async with NexusAsyncClient(http_client) as client:
+
+        # act
+        data, actual_resource_paths = await client.data.get_many(resource_paths, begin, end, max_concurrency=2)
+
+        # assert
+        assert resource_paths == actual_resource_paths
+        assert (3, 5) == data.shape
+        assert [[5.0, 6.0, 7.0, 8.0, 9.0]] * 3 == data.tolist()
+
+@pytest.mark.asyncio
+async def can_get_many_into_column_major_target_test():
+
+    # arrange
+    begin = datetime(2020, 1, 1, 0, 0, 5, tzinfo=timezone.utc)
+    end = datetime(2020, 1, 1, 0, 0, 10, tzinfo=timezone.utc)
+    resource_paths = ["/a/b/c/T1/1_s", "/a/b/c/T2/1_s"]
+    target = numpy.zeros((5, 2), order="F")
+    http_client = AsyncClient(base_url="http://localhost", transport=MockTransport(_handler4))
+
+    async with NexusAsyncClient(http_client) as client:
+
+        # act
+        await client.data.get_many(resource_paths, begin, end, target=target)
+
+        # assert
+        assert [[5.0, 5.0], [6.0, 6.0], [7.0, 7.0], [8.0, 8.0], [9.0, 9.0]] == target.tolist()
+
+        # a row-major matrix with one column per resource would be filled in scrambled order
+        with pytest.raises(Exception, match="shape"):
+            await client.data.get_many(resource_paths, begin, end, target=numpy.zeros((5, 2)))
+
+        with pytest.raises(Exception, match="float64"):
+            await client.data.get_many(resource_paths, begin, end, target=numpy.zeros((5, 2), dtype=numpy.float32, order="F"))
+
+@pytest.mark.asyncio
+async def get_many_throws_for_different_sample_periods_test():
+
+    # arrange
+    begin = datetime(2020, 1, 1, 0, 0, tzinfo=timezone.utc)
+    end = datetime(2020, 1, 1, 0, 1, tzinfo=timezone.utc)
+    http_client = AsyncClient(base_url="http://localhost", transport=MockTransport(_handler4))
+
+    async with NexusAsyncClient(http_client) as client:
+
+        # act / assert
+        with pytest.raises(Exception):
+            await client.data.get_many(["/a/b/c/T1/1_s", "/a/b/c/T2/100_ms"], begin, end)
+
+def can_parse_nanosecond_sample_periods_test():
+
+    # act
+    actual = _nexus_api._to_sample_period("/a/b/c/T1/2000_ns")
+
+    # assert
+    assert timedelta(microseconds=2) == actual
+
+    with pytest.raises(Exception, match="less than one microsecond"):
+        _nexus_api._to_sample_period("/a/b/c/T1/100_ns")
+
+@pytest.mark.asyncio
+async def can_cache_data_test(tmp_path):
+    global data_element_count
+
+    # arrange
+    data_element_count = 0
+    reference = datetime(2020, 1, 1, 0, 0, tzinfo=timezone.utc)
+    http_client = AsyncClient(base_url="http://localhost", transport=MockTransport(_handler4))
+
+    async with NexusAsyncClient(http_client) as client:
+
+        cache = DataCache(client, str(tmp_path), max_size=1024**2, block_element_count=4)
+
+        # act
+        actual1 = await cache.get("/a/b/c/T1/1_s", reference + timedelta(seconds=2), reference + timedelta(seconds=6))
+        actual2 = await cache.get("/a/b/c/T1/1_s", reference + timedelta(seconds=8), reference + timedelta(seconds=10))
+        actual3 = await cache.get("/a/b/c/T1/1_s", reference, reference + timedelta(seconds=10))
+        actual4 = await DataCache(client, str(tmp_path), max_size=1024**2, block_element_count=4) \
+            .get("/a/b/c/T1/1_s", reference + timedelta(seconds=1), reference + timedelta(seconds=9))
+
+        # assert
+        assert [2.0, 3.0, 4.0, 5.0] == list(actual1)
+        assert [8.0, 9.0] == list(actual2)
+        assert [float(i) for i in range(10)] == list(actual3)
+        assert [float(i) for i in range(1, 9)] == list(actual4)
+
+        # only the gaps [0, 2) and [6, 8) are requested by the third call
+        assert 4 + 2 + 4 == data_element_count
+
+@pytest.mark.asyncio
+async def can_evict_least_recently_used_data_test(tmp_path):
+    global data_request_count
+
+    # arrange
+    data_request_count = 0
+    reference = datetime(2020, 1, 1, 0, 0, tzinfo=timezone.utc)
+    http_client = AsyncClient(base_url="http://localhost", transport=MockTransport(_handler4))
+
+    async with NexusAsyncClient(http_client) as client:
+
+        # two blocks of 4 elements fit into the cache
+        cache = DataCache(client, str(tmp_path), max_size=2 * 4 * 8, block_element_count=4)
+
+        # act
+        await cache.get("/a/b/c/T1/1_s", reference, reference + timedelta(seconds=4))
+        await cache.get("/a/b/c/T2/1_s", reference, reference + timedelta(seconds=4))
+        await cache.get("/a/b/c/T3/1_s", reference, reference + timedelta(seconds=4))
+        await cache.get("/a/b/c/T3/1_s", reference, reference + timedelta(seconds=4))
+        await cache.get("/a/b/c/T2/1_s", reference, reference + timedelta(seconds=4))
+        await cache.get("/a/b/c/T1/1_s", reference, reference + timedelta(seconds=4))
+
+        # assert
+        assert 2 * 4 * 8 == cache.size
+        assert 4 == data_request_count
+
+@pytest.mark.asyncio
+async def can_share_cache_folder_test(tmp_path):
+    global data_request_count
+
+    # arrange
+    data_request_count = 0
+    reference = datetime(2020, 1, 1, 0, 0, tzinfo=timezone.utc)
+    http_client = AsyncClient(base_url="http://localhost", transport=MockTransport(_handler4))
+
+    async with NexusAsyncClient(http_client) as client:
+
+        # act
+        with DataCache(client, str(tmp_path), max_size=1024**2, block_element_count=4, max_open_maps=1) as cache1, \
+             DataCache(client, str(tmp_path), max_size=1024**2, block_element_count=4, max_open_maps=1) as cache2:
+
+            await cache1.get("/a/b/c/T1/1_s", reference, reference + timedelta(seconds=8))
+            await cache2.get("/a/b/c/T2/1_s", reference, reference + timedelta(seconds=4))
+
+        with DataCache(client, str(tmp_path), max_size=1024**2, block_element_count=4) as cache3:
+
+            actual1 = await cache3.get("/a/b/c/T1/1_s", reference, reference + timedelta(seconds=8))
+            actual2 = await cache3.get("/a/b/c/T2/1_s", reference, reference + timedelta(seconds=4))
+
+            # assert
+            assert [float(i) for i in range(8)] == list(actual1)
+            assert [float(i) for i in range(4)] == list(actual2)
+            assert 3 * 4 * 8 == cache3.size
+
+            # the changes of both caches have been merged into the index file
+            assert 3 == data_request_count
+
+@pytest.mark.asyncio
+async def can_detect_data_removed_by_other_cache_test(tmp_path):
+    global data_request_count
+
+    # arrange
+    data_request_count = 0
+    reference = datetime(2020, 1, 1, 0, 0, tzinfo=timezone.utc)
+    end = reference + timedelta(seconds=8)
+    index_file_path = tmp_path / "index.json"
+    http_client = AsyncClient(base_url="http://localhost", transport=MockTransport(_handler4))
+
+    async with NexusAsyncClient(http_client) as client:
+
+        with DataCache(client, str(tmp_path), max_size=1024**2, block_element_count=4) as cache1, \
+             DataCache(client, str(tmp_path), max_size=1024**2, block_element_count=4) as cache2:
+
+            await cache1.get("/a/b/c/T1/1_s", reference, end)
+            version = os.stat(index_file_path).st_mtime_ns
+
+            # act
+
+            # cache hits do not rewrite the index
+            await cache1.get("/a/b/c/T1/1_s", reference, end)
+            version_after_hit = os.stat(index_file_path).st_mtime_ns
+
+            # the data is removed via the index
+            cache2.invalidate("/a/b/c/T1/1_s")
+            actual1 = await cache1.get("/a/b/c/T1/1_s", reference, end)
+
+            # the block file is removed before the index is updated
+            os.remove(cache1.storage.get_block_file_path("/a/b/c/T1/1_s", _to_element_index(reference, timedelta(seconds=1)) // 4))
+            actual2 = await cache1.get("/a/b/c/T1/1_s", reference, end)
+
+        # assert
+        assert version == version_after_hit
+        assert [float(i) for i in range(8)] == list(actual1)
+        assert [float(i) for i in range(8)] == list(actual2)
+        assert 2 + 2 + 1 == data_request_count
+
+@pytest.mark.asyncio
+async def can_download_into_memory_mapped_storage_test(tmp_path):
+
+    # arrange
+    begin = datetime(2020, 1, 1, 0, 0, 1, tzinfo=timezone.utc)
+    end = datetime(2020, 1, 1, 0, 0, 10, tzinfo=timezone.utc)
+    http_client = AsyncClient(base_url="http://localhost", transport=MockTransport(_handler4))
+
+    async with NexusAsyncClient(http_client) as client:
+
+        with MemoryMappedStorage(str(tmp_path), block_element_count=4) as storage:
+
+            # act
+            await storage.download(client, "/a/b/c/T1/1_s", begin, end)
+            views = storage.get_views("/a/b/c/T1/1_s", begin, end)
+
+            # assert
+            assert [float(i) for i in range(1, 10)] == [value for view in views for value in view.tolist()]
+
+        # the data is shared via the file system
+        with MemoryMappedStorage(str(tmp_path), block_element_count=4) as storage:
+
+            target = array("d", [0.0]) * 3
+            storage.read_into("/a/b/c/T1/1_s", begin, begin + timedelta(seconds=3), memoryview(target))
+
+            assert [1.0, 2.0, 3.0] == list(target)
+
+def _handler5(request: Request):
+
+    if "child-catalog-infos" in request.url.path:
+
+        catalog_infos_json_string = json.dumps([
+            {
+                "id": f"/A/B/C{i}", "title": "C", "contact": None, "license": None, "isReadable": True, "isWritable": False, 
+                "isReleased": True, "isVisible": True, "isOwner": False, "dataSourceInfoUrl": None, "dataSourceType": "Nexus.Sources.Sample", 
+                "dataSourceRegistrationId": "f2ad3e4a-2a48-4a0c-8f44-4d5d4d5f5a01", "packageReferenceId": "1dd3bd18-1a5b-4b1a-92d5-4d2b1ed5bb31",
+                "unknownProperty": 1
+            }
+            for i in range(2)
+        ])
+
+        return Response(codes.OK, content=catalog_infos_json_string)
+
+    elif "status" in request.url.path:
+
+        job_status_json_string = '{"start":"2020-01-01T00:00:00.000000Z","status":"RanToCompletion","progress":1,"exceptionMessage":null,"result":null}'
+        return Response(codes.OK, content=job_status_json_string)
+
+    else:
+        raise Exception("Unsupported path.")
+
+@pytest.mark.asyncio
+async def can_decode_responses_test():
+
+    # arrange
+    http_client = AsyncClient(base_url="http://localhost", transport=MockTransport(_handler5))
+
+    async with NexusAsyncClient(http_client) as client:
+
+        # act
+        catalog_infos = await client.catalogs.get_child_catalog_infos("/A/B")
+        job_status = await client.jobs.get_job_status(uuid.uuid4())
+
+        # assert
+        assert 2 == len(catalog_infos)
+        assert isinstance(catalog_infos[0], CatalogInfo)
+        assert "/A/B/C1" == catalog_infos[1].id
+        assert catalog_infos[1].is_readable
+        assert uuid.UUID("1dd3bd18-1a5b-4b1a-92d5-4d2b1ed5bb31") == catalog_infos[1].package_reference_id
+
+        assert isinstance(job_status, JobStatus)
+        assert TaskStatus.RAN_TO_COMPLETION == job_status.status
+        assert datetime(2020, 1, 1) == job_status.start
+
+def can_serialize_models_test():
+
+    # arrange
+    representation = Representation(data_type=NexusDataType.FLOAT64, sample_period=timedelta(seconds=1))
+    resource = Resource(id="T1", properties={ "unit": "°C" }, representations=[representation])
+    catalog = ResourceCatalog(id="/A/B/C", properties=None, resources=[resource])
+
+    parameters = ExportParameters(
+        begin=datetime(2020, 1, 1, 0, 0, 0, 500000),
+        end=datetime(2020, 1, 2),
+        file_period=timedelta(hours=1),
+        type="Nexus.Writers.Csv",
+        resource_paths=["/A/B/C/T1/1_s"],
+        configuration={})
+
+    # act
+    catalog_json = json.loads(json.dumps(catalog.to_json()))
+    parameters_json = json.loads(json.dumps(parameters.to_json()))
+
+    actual_catalog = ResourceCatalog.from_json(catalog_json)
+    actual_parameters = ExportParameters.from_json({ **parameters_json, "begin": "2020-01-01T00:00:00.500000Z", "end": "2020-01-02T00:00:00.000000Z" })
+
+    # assert
+    assert "FLOAT64" == catalog_json["resources"][0]["representations"][0]["dataType"]
+    assert "0.00:00:01.000000" == catalog_json["resources"][0]["representations"][0]["samplePeriod"]
+    assert "2020-01-01T00:00:00.500000" == parameters_json["begin"]
+    assert ["/A/B/C/T1/1_s"] == parameters_json["resourcePaths"]
+
+    assert catalog == actual_catalog
+    assert parameters == actual_parameters
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        timedelta(0),
+        timedelta(milliseconds=5),
+        timedelta(microseconds=1),
+        timedelta(seconds=1, microseconds=250000),
+        timedelta(days=3000, hours=12, minutes=8, seconds=7, microseconds=125000)
+    ])
+def can_round_trip_timedelta_test(value: timedelta):
+
+    # act
+    actual = _nexus_api._decode_timedelta(_nexus_api._encode_timedelta(value))
+
+    # assert
+    assert value == actual
+
+@pytest.mark.parametrize(
+    "data, expected",
+    [
+        ("12:08:07", timedelta(hours=12, minutes=8, seconds=7)),
+        ("00:00:00.5", timedelta(milliseconds=500)),
+        ("00:00:00.005", timedelta(milliseconds=5)),
+        ("3000.00:08:07.1250000", timedelta(days=3000, minutes=8, seconds=7, milliseconds=125)),
+        ("00:00:00.0000015", timedelta(microseconds=1))
+    ])
+def can_decode_timedelta_test(data: str, expected: timedelta):
+    assert expected == _nexus_api._decode_timedelta(data)
+
+def can_decode_models_with_other_property_casing_test():
+
+    # act
+    actual = _nexus_api._decode(Representation, { "DataType": "FLOAT64", "SamplePeriod": "00:00:01" })
+
+    # assert
+    assert Representation(data_type=NexusDataType.FLOAT64, sample_period=timedelta(seconds=1)) == actual
+
+    # schema mismatches are not hidden by the generic decoder
+    with pytest.raises(KeyError):
+        _nexus_api._decode(Representation, { "dataType": "FLOAT64" })
+
+def _handler6(request: Request):
+
+    if "export" in request.url.path:
+
+        parameters = json.loads(request.content)
+
+        assert "2020-01-01T00:00:00" == parameters["begin"]
+        assert "0.01:00:00.000000" == parameters["filePeriod"]
+        assert ["/A/B/C/T1/1_s"] == parameters["resourcePaths"]
+
+        job_json_string = '{"id":"1dd3bd18-1a5b-4b1a-92d5-4d2b1ed5bb31","type":"export","owner":"test","parameters":null}'
+        return Response(codes.OK, content=job_json_string.encode("utf-8"))
+
+    else:
+        raise Exception("Unsupported path.")
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("json_backend_type", [StdlibJsonBackend, OrjsonBackend])
+async def can_use_json_backend_test(json_backend_type):
+
+    # arrange
+    http_client = AsyncClient(base_url="http://localhost", transport=MockTransport(_handler6))
+    json_backend = json_backend_type()
+
+    parameters = ExportParameters(
+        begin=datetime(2020, 1, 1),
+        end=datetime(2020, 1, 2),
+        file_period=timedelta(hours=1),
+        type="Nexus.Writers.Csv",
+        resource_paths=["/A/B/C/T1/1_s"],
+        configuration={})
+
+    async with NexusAsyncClient(http_client, json_backend) as client:
+
+        # act
+        job = await client.jobs.export(parameters)
+
+        # assert
+        assert json_backend is client.json_backend
+        assert isinstance(job, Job)
+        assert uuid.UUID("1dd3bd18-1a5b-4b1a-92d5-4d2b1ed5bb31") == job.id
+
+def _handler7(request: Request):
+    global catalog_request_count
+
+    if "timerange" in request.url.path:
+        catalog_request_count += 1
+
+        if request.headers.get("If-None-Match") == '"1"':
+            return Response(codes.NOT_MODIFIED, headers={"ETag": '"1"'})
+
+        time_range_json_string = '{"begin":"2020-01-01T00:00:00.000000Z","end":"2020-01-02T00:00:00.000000Z"}'
+        return Response(codes.OK, headers={"ETag": '"1"'}, content=time_range_json_string)
+
+    else:
+        raise Exception("Unsupported path.")
+
+@pytest.mark.asyncio
+async def can_cache_catalog_metadata_test(tmp_path):
+    global catalog_request_count
+
+    # arrange
+    catalog_request_count = 0
+    http_client = AsyncClient(base_url="http://localhost", transport=MockTransport(_handler7))
+
+    async with NexusAsyncClient(http_client) as client:
+
+        cache = CatalogCache(client, folder_path=str(tmp_path))
+        revalidating_cache = CatalogCache(client, time_range_ttl=timedelta(0))
+        transient_cache = CatalogCache(client, is_transient=lambda catalog_id: True)
+
+        # act
+        time_ranges = [await cache.get_time_range("/A/B/C") for _ in range(3)]
+        persisted_time_range = await CatalogCache(client, folder_path=str(tmp_path)).get_time_range("/A/B/C")
+        cached_request_count = catalog_request_count
+
+        revalidated_time_ranges = [await revalidating_cache.get_time_range("/A/B/C") for _ in range(2)]
+        revalidated_request_count = catalog_request_count - cached_request_count
+
+        await transient_cache.get_time_range("/A/B/C")
+        await transient_cache.get_time_range("/A/B/C")
+        transient_request_count = catalog_request_count - cached_request_count - revalidated_request_count
+
+        cache.invalidate("/A/B/C")
+        await cache.get_time_range("/A/B/C")
+
+        # assert
+        assert 1 == cached_request_count
+        assert datetime(2020, 1, 1) == time_ranges[0].begin
+        assert time_ranges[0] is time_ranges[2]
+        assert time_ranges[0] == persisted_time_range
+
+        assert 2 == revalidated_request_count
+        assert revalidated_time_ranges[0] is revalidated_time_ranges[1]
+
+        assert 2 == transient_request_count
+        assert 6 == catalog_request_count
+
+@pytest.mark.asyncio
+async def can_share_catalog_cache_folder_test(tmp_path):
+    global catalog_request_count
+
+    # arrange
+    catalog_request_count = 0
+    http_client = AsyncClient(base_url="http://localhost", transport=MockTransport(_handler7))
+
+    async with NexusAsyncClient(http_client) as client:
+
+        cache1 = CatalogCache(client, folder_path=str(tmp_path))
+        cache2 = CatalogCache(client, folder_path=str(tmp_path))
+
+        # act
+        await asyncio.gather(*[cache1.get_time_range("/A/B/C1") for _ in range(3)])
+        await cache2.get_time_range("/A/B/C2")
+
+        cache3 = CatalogCache(client, folder_path=str(tmp_path))
+        await cache3.get_time_range("/A/B/C1")
+        await cache3.get_time_range("/A/B/C2")
+
+        # assert
+
+        # the entries of both caches have been merged into the cache file
+        assert 2 == catalog_request_count
+
+        # the locks of the entries are released
+        assert not cache1._locks
+
+def _handler8(request: Request):
+
+    catalog_tree = { "/": ["/A", "/B"], "/A": ["/A/C", "/A/D"], "/A/C": ["/A/C/E"] }
+    catalog_id = unquote(request.url.raw_path.decode("utf-8").split("/")[4])
+
+    if request.url.path.endswith("child-catalog-infos"):
+
+        catalog_infos_json_string = json.dumps([
+            {
+                "id": child_id, "title": child_id, "contact": None, "license": None, "isReadable": True, "isWritable": False,
+                "isReleased": True, "isVisible": True, "isOwner": False, "dataSourceInfoUrl": None, "dataSourceType": "Nexus.Sources.Sample",
+                "dataSourceRegistrationId": "f2ad3e4a-2a48-4a0c-8f44-4d5d4d5f5a01", "packageReferenceId": "1dd3bd18-1a5b-4b1a-92d5-4d2b1ed5bb31"
+            }
+            for child_id in catalog_tree.get(catalog_id, [])
+        ])
+
+        return Response(codes.OK, content=catalog_infos_json_string)
+
+    else:
+        return Response(codes.OK, content=json.dumps({ "id": catalog_id, "properties": None, "resources": None }))
+
+@pytest.mark.asyncio
+async def can_walk_catalogs_test():
+
+    # arrange
+    http_client = AsyncClient(base_url="http://localhost", transport=MockTransport(_handler8))
+
+    async with NexusAsyncClient(http_client) as client:
+
+        # act
+        catalog_ids = [catalog_info.id async for catalog_info in client.catalogs.walk("/", max_concurrency=2)]
+        child_catalog_ids = [catalog_info.id async for catalog_info in client.catalogs.walk("/", depth=1)]
+        catalogs = [item async for item in client.catalogs.walk_with_catalogs("/A")]
+
+        # assert
+        assert ["/A", "/B", "/A/C", "/A/D", "/A/C/E"] == catalog_ids
+        assert ["/A", "/B"] == child_catalog_ids
+        assert ["/A/C", "/A/C/E", "/A/D"] == sorted(catalog_info.id for catalog_info, _ in catalogs)
+        assert all(catalog_info.id == catalog.id for catalog_info, catalog in catalogs)
+
+def can_find_resources_in_index_test(tmp_path):
+
+    # arrange
+    representation = Representation(data_type=NexusDataType.FLOAT64, sample_period=timedelta(milliseconds=100))
+
+    catalog1 = ResourceCatalog(id="/A/B/C", properties=None, resources=[
+        Resource(id="T1", properties={ "Unit": "°C", "Groups": ["Temperature"], "Description": "Outdoor temperature" }, representations=[representation]),
+        Resource(id="V1", properties={ "Unit": "m/s", "Groups": ["Wind", "Met Mast"], "Description": "Wind speed at hub height" }, representations=[representation])
+    ])
+
+    catalog2 = ResourceCatalog(id="/D/E/F", properties=None, resources=[
+        Resource(id="V1", properties={ "Unit": "m/s", "Groups": ["Wind"], "Description": "Nacelle wind speed" }, representations=None),
+        Resource(id="P1", properties=None, representations=None)
+    ])
+
+    index = ResourceIndex()
+    index.add(catalog1)
+    index.add(catalog2)
+
+    # act
+    index.save(str(tmp_path / "index.json.gz"))
+    loaded_index = ResourceIndex.load(str(tmp_path / "index.json.gz"))
+
+    # assert
+    for actual_index in [index, loaded_index]:
+
+        assert 4 == len(actual_index)
+        entry_t1 = actual_index.get("/A/B/C/T1")
+        entry_v1 = actual_index.get("/A/B/C/V1")
+
+        assert entry_t1 is not None
+        assert entry_v1 is not None
+        assert entry_v1.resource.representations is not None
+        assert "T1" == entry_t1.resource.id
+        assert actual_index.get("/A/B/C/X1") is None
+        assert timedelta(milliseconds=100) == entry_v1.resource.representations[0].sample_period
+
+        assert ["/A/B/C/V1", "/D/E/F/V1"] == [entry.path for entry in actual_index.find({ "Unit": "m/s", "Groups": "Wind" })]
+        assert ["/A/B/C/V1"] == [entry.path for entry in actual_index.find({ "Unit": "m/s", "Groups": "Met Mast" })]
+        assert ["/A/B/C/V1", "/D/E/F/V1"] == [entry.path for entry in actual_index.find(description="WIND SPEED")]
+        assert ["/D/E/F/V1"] == [entry.path for entry in actual_index.find(description="wind", catalog_id="/D/E/F")]
+        assert ["/A/B/C/T1"] == [entry.path for entry in actual_index.find(description="or")]
+        assert [] == actual_index.find({ "Unit": "Pa" })
+
+    index.remove("/A/B/C")
+
+    assert ["/D/E/F/V1"] == [entry.path for entry in index.find({ "Unit": "m/s" })]
+    assert [] == index.find(description="outdoor")
+
+def _handler9(request: Request):
+
+    if request.url.path.endswith("status"):
+
+        job_id = request.url.path.split("/")[4]
+        count = job_status_request_counts.get(job_id, 0) + 1
+        job_status_request_counts[job_id] = count
+
+        # job 1 completes after 4 requests, job 2 faults after 2 requests
+        if job_id == "00000000-0000-0000-0000-000000000001":
+            status, progress = ("RanToCompletion", 1) if count >= 4 else ("Running", count * 0.25)
+
+        else:
+            status, progress = ("Faulted", 0.5) if count >= 2 else ("Running", 0.5)
+
+        job_status_json_string = json.dumps({ "start": "2020-01-01T00:00:00.000000Z", "status": status, "progress": progress, "exceptionMessage": None, "result": None })
+        return Response(codes.OK, content=job_status_json_string)
+
+    else:
+        raise Exception("Unsupported path.")
+
+@pytest.mark.asyncio
+async def can_wait_for_jobs_test():
+
+    # arrange
+    job_status_request_counts.clear()
+    job_id1 = uuid.UUID("00000000-0000-0000-0000-000000000001")
+    job_id2 = uuid.UUID("00000000-0000-0000-0000-000000000002")
+    http_client = AsyncClient(base_url="http://localhost", transport=MockTransport(_handler9))
+
+    async with NexusAsyncClient(http_client) as client:
+
+        # act
+        updates = [update async for update in client.jobs.watch([job_id1, job_id2], min_interval=timedelta(milliseconds=1), max_concurrency=1)]
+
+        job_status_request_counts.clear()
+        job_statuses = await client.jobs.wait([job_id1, job_id2], min_interval=timedelta(milliseconds=1))
+
+        # assert
+        assert [0.25, 0.5, 0.75, 1] == [job_status.progress for job_id, job_status in updates if job_id == job_id1]
+        assert [TaskStatus.RUNNING, TaskStatus.FAULTED] == [job_status.status for job_id, job_status in updates if job_id == job_id2]
+
+        assert TaskStatus.RAN_TO_COMPLETION == job_statuses[job_id1].status
+        assert TaskStatus.FAULTED == job_statuses[job_id2].status
+        assert 4 == job_status_request_counts[str(job_id1)]
+        assert 2 == job_status_request_counts[str(job_id2)]
+
+artifact = bytes(range(256)) * 1000
+
+class _InterruptedStream(AsyncByteStream):
+
+    async def __aiter__(self):
+        yield artifact[:100000]
+        raise ReadError("The connection was interrupted.")
+
+def _handler10(request: Request):
+
+    if request.url.path.endswith("export"):
+        return Response(codes.OK, content='{"id":"00000000-0000-0000-0000-000000000001","type":"export","owner":"test","parameters":null}')
+
+    elif request.url.path.endswith("status"):
+        return Response(codes.OK, content='{"start":"2020-01-01T00:00:00.000000Z","status":"RanToCompletion","progress":1,"exceptionMessage":null,"result":"export.zip"}')
+
+    elif "artifacts/export.zip" in request.url.path:
+
+        range_header = request.headers.get("Range")
+        artifact_range_headers.append((range_header, request.headers.get("If-Range")))
+
+        if range_header is None:
+            return Response(codes.OK, headers={"Content-Length": str(len(artifact)), "ETag": '"1"'}, stream=_InterruptedStream())
+
+        else:
+            offset = int(range_header[len("bytes="):-1])
+            return Response(codes.PARTIAL_CONTENT, content=artifact[offset:])
+
+    else:
+        raise Exception("Unsupported path.")
+
+@pytest.mark.asyncio
+async def can_export_to_file_test(tmp_path):
+
+    # arrange
+    artifact_range_headers.clear()
+    file_path = str(tmp_path / "export.zip")
+
+    # stale temporary file of a previous download
+    with open(file_path + ".part", "wb") as file:
+        file.write(b"stale")
+    http_client = AsyncClient(base_url="http://localhost", transport=MockTransport(_handler10))
+
+    parameters = ExportParameters(
+        begin=datetime(2020, 1, 1),
+        end=datetime(2020, 1, 2),
+        file_period=timedelta(hours=1),
+        type="Nexus.Writers.Csv",
+        resource_paths=["/A/B/C/T1/1_s"],
+        configuration={})
+
+    async with NexusAsyncClient(http_client) as client:
+
+        # act
+        result = await client.jobs.export_to(file_path, parameters, min_interval=timedelta(milliseconds=1), chunk_size=25000)
+
+        # assert
+        assert result
+        assert [(None, None), ("bytes=100000-", '"1"')] == artifact_range_headers
+
+        with open(file_path, "rb") as file:
+            assert artifact == file.read()
+
+def _handler11(request: Request):
+
+    if request.url.path.endswith("export"):
+
+        job_id = str(uuid.uuid4())
+        export_jobs[job_id] = json.loads(request.content)
+
+        return Response(codes.OK, content=json.dumps({ "id": job_id, "type": "export", "owner": "test", "parameters": None }))
+
+    elif request.url.path.endswith("status"):
+
+        job_id = request.url.path.split("/")[4]
+        job_status = { "start": "2020-01-01T00:00:00.000000Z", "status": "RanToCompletion", "progress": 1, "exceptionMessage": None, "result": f"{job_id}.zip" }
+
+        return Response(codes.OK, content=json.dumps(job_status))
+
+    elif "artifacts" in request.url.path:
+
+        job_id = request.url.path.split("/")[4][:-len(".zip")]
+        parameters = export_jobs[job_id]
+        stream = io.BytesIO()
+
+        # one file per hour
+        with zipfile.ZipFile(stream, "w") as zip_file:
+
+            begin = datetime.fromisoformat(parameters["begin"])
+            end = datetime.fromisoformat(parameters["end"])
+
+            while begin < end:
+                zip_file.writestr(f"{begin:%Y-%m-%dT%H}.csv", "data")
+                begin += timedelta(hours=1)
+
+        return Response(codes.OK, content=stream.getvalue())
+
+    else:
+        raise Exception("Unsupported path.")
+
+def can_split_export_parameters_test():
+
+    # arrange
+    parameters = ExportParameters(
+        begin=datetime(2020, 1, 1, 0, 30),
+        end=datetime(2020, 1, 1, 10, 0),
+        file_period=timedelta(hours=1),
+        type="Nexus.Writers.Csv",
+        resource_paths=["/A/B/C/T1/1_s"],
+        configuration={})
+
+    # act
+    shards = _nexus_api._split_export_parameters(parameters, 3)
+    too_many_shards = _nexus_api._split_export_parameters(parameters, 100)
+
+    # assert
+    assert [
+        (datetime(2020, 1, 1, 0, 30), datetime(2020, 1, 1, 3)),
+        (datetime(2020, 1, 1, 3), datetime(2020, 1, 1, 6)),
+        (datetime(2020, 1, 1, 6), datetime(2020, 1, 1, 10))
+    ] == [(shard.begin, shard.end) for shard in shards]
+
+    assert 10 == len(too_many_shards)
+    assert all(shard.begin.minute == 0 for shard in too_many_shards[1:])
+
+@pytest.mark.asyncio
+async def can_export_sharded_test(tmp_path):
+
+    # arrange
+    export_jobs.clear()
+    http_client = AsyncClient(base_url="http://localhost", transport=MockTransport(_handler11))
+
+    parameters = ExportParameters(
+        begin=datetime(2020, 1, 1),
+        end=datetime(2020, 1, 2),
+        file_period=timedelta(hours=1),
+        type="Nexus.Writers.Csv",
+        resource_paths=["/A/B/C/T1/1_s"],
+        configuration={})
+
+    async with NexusAsyncClient(http_client) as client:
+
+        # act
+        file_names = await client.jobs.export_sharded(str(tmp_path), parameters, shards=5, max_concurrency=2, min_interval=timedelta(milliseconds=1))
+
+        # assert
+        assert 5 == len(export_jobs)
+        assert 24 == len(file_names)
+        assert sorted(file_names) == sorted(os.listdir(tmp_path))
+
+async def _handler12(request: Request):
+
+    if "attachments" in request.url.path:
+
+        assert "chunked" != request.headers.get("Transfer-Encoding")
+
+        content = await request.aread()
+        assert int(request.headers["Content-Length"]) == len(content)
+
+        uploaded_attachments[unquote(request.url.raw_path.decode("utf-8"))] = content
+        return Response(codes.OK)
+
+    else:
+        raise Exception("Unsupported path.")
+
+@pytest.mark.asyncio
+async def can_upload_attachments_from_paths_test(tmp_path):
+
+    # arrange
+    uploaded_attachments.clear()
+    http_client = AsyncClient(base_url="http://localhost", transport=MockTransport(_handler12))
+
+    files = {
+        "a.zip": bytes(range(256)) * 1000,
+        "b.zip": b"calibration" * 100,
+        "c.zip": b""
+    }
+
+    for file_name, content in files.items():
+        (tmp_path / file_name).write_bytes(content)
+
+    async with NexusAsyncClient(http_client) as client:
+
+        # act
+        await client.catalogs.upload_attachment_from_path("/A/B/C", "a.zip", str(tmp_path / "a.zip"), chunk_size=1000)
+
+        await client.catalogs.upload_attachments_from_paths(
+            [("/D/E/F", file_name, str(tmp_path / file_name)) for file_name in files],
+            max_concurrency=2,
+            max_bytes_per_second=100_000_000,
+            chunk_size=4096)
+
+        # assert
+        assert files["a.zip"] == uploaded_attachments["/api/v1/catalogs//A/B/C/attachments/a.zip"]
+
+        for file_name, content in files.items():
+            assert content == uploaded_attachments[f"/api/v1/catalogs//D/E/F/attachments/{file_name}"]
+
+def _create_access_token(refresh_count: int) -> str:
+
+    # only the first access token has a custom lifetime
+    lifetime = token_lifetime if refresh_count == 1 else 3600
+    header = base64.urlsafe_b64encode(b'{"alg":"none"}').decode("utf-8").rstrip("=")
+    payload = base64.urlsafe_b64encode(json.dumps({ "exp": time.time() + lifetime, "n": refresh_count }).encode("utf-8")).decode("utf-8").rstrip("=")
+
+    return f"{header}.{payload}."
+
+def _handler13(request: Request):
+    global token_refresh_count
+    global unauthorized_count
+
+    if "refresh-token" in request.url.path:
+        token_refresh_count += 1
+        return Response(codes.OK, content=json.dumps({ "accessToken": _create_access_token(token_refresh_count), "refreshToken": str(uuid.uuid4()) }))
+
+    elif "catalogs" in request.url.path:
+
+        payload = request.headers["Authorization"].split(".")[1]
+        refresh_count = json.loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))["n"]
+
+        # only the latest access token is valid
+        if refresh_count != token_refresh_count:
+            unauthorized_count += 1
+            return Response(codes.UNAUTHORIZED, headers={"WWW-Authenticate" : "Bearer The token expired at ..."})
+
+        return Response(codes.OK, content='{"id":"/A/B/C","properties":null,"resources":null}')
+
+    else:
+        raise Exception("Unsupported path.")
+
+@pytest.mark.asyncio
+async def can_share_token_refresh_test():
+    global token_refresh_count
+    global token_lifetime
+    global unauthorized_count
+
+    # arrange
+    token_refresh_count = 0
+    unauthorized_count = 0
+    token_lifetime = 3600
+    http_client = AsyncClient(base_url="http://localhost", transport=MockTransport(_handler13))
+
+    async with NexusAsyncClient(http_client) as client:
+
+        await client.sign_in(str(uuid.uuid4()))
+
+        # invalidate the current access token
+        token_refresh_count += 1
+
+        # act
+        catalogs = await asyncio.gather(*[client.catalogs.get("/A/B/C") for _ in range(20)])
+
+        # assert
+        assert 20 == len(catalogs)
+        assert 3 == token_refresh_count
+        assert 0 < unauthorized_count
+
+async def _handler17(request: Request):
+
+    # keep the refresh pending for a while
+    if "refresh-token" in request.url.path:
+        await asyncio.sleep(0.1)
+
+    return _handler13(request)
+
+@pytest.mark.asyncio
+async def can_cancel_request_during_token_refresh_test():
+    global token_refresh_count
+    global token_lifetime
+
+    # arrange
+    token_refresh_count = 0
+    token_lifetime = 3600
+    http_client = AsyncClient(base_url="http://localhost", transport=MockTransport(_handler17))
+
+    async with NexusAsyncClient(http_client) as client:
+
+        await client.sign_in(str(uuid.uuid4()))
+
+        # invalidate the current access token
+        token_refresh_count += 1
+
+        # act
+        task1 = asyncio.ensure_future(client.catalogs.get("/A/B/C"))
+        task2 = asyncio.ensure_future(client.catalogs.get("/A/B/C"))
+
+        # both requests wait for the refresh
+        await asyncio.sleep(0.05)
+        task1.cancel()
+
+        catalog = await task2
+
+        # assert
+        with pytest.raises(asyncio.CancelledError):
+            await task1
+
+        assert "/A/B/C" == catalog.id
+        assert client._token_pair is not None
+        assert "Authorization" in client._http_client.headers
+
+@pytest.mark.asyncio
+async def can_refresh_token_proactively_test():
+    global token_refresh_count
+    global token_lifetime
+    global unauthorized_count
+
+    # arrange
+    token_refresh_count = 0
+    unauthorized_count = 0
+    token_lifetime = 10
+    http_client = AsyncClient(base_url="http://localhost", transport=MockTransport(_handler13))
+
+    async with NexusAsyncClient(http_client, token_refresh_margin=timedelta(seconds=60)) as client:
+
+        await client.sign_in(str(uuid.uuid4()))
+
+        # invalidate the current access token
+        token_refresh_count += 1
+
+        # act
+        await asyncio.gather(*[client.catalogs.get("/A/B/C") for _ in range(5)])
+        await client.catalogs.get("/A/B/C")
+
+        # assert
+        assert 3 == token_refresh_count
+        assert 0 == unauthorized_count
+
+@pytest.mark.asyncio
+async def can_store_rotated_refresh_token_test(tmp_path):
+    global token_refresh_count
+    global token_lifetime
+
+    # arrange
+    token_refresh_count = 0
+    token_lifetime = 3600
+    initial_refresh_token = str(uuid.uuid4())
+    token_store = FileTokenStore(str(tmp_path))
+    http_client = AsyncClient(base_url="http://localhost", transport=MockTransport(_handler13))
+
+    async with NexusAsyncClient(http_client, token_store=token_store) as client:
+
+        # act
+        await client.sign_in(initial_refresh_token)
+        stored_refresh_token1 = token_store.load(initial_refresh_token)
+
+        await client.sign_in(initial_refresh_token)
+        stored_refresh_token2 = token_store.load(initial_refresh_token)
+
+        # assert
+        token_pair = client._token_pair
+
+        assert token_pair is not None
+        assert stored_refresh_token1 is not None
+        assert stored_refresh_token1 != initial_refresh_token
+        assert stored_refresh_token2 == token_pair.refresh_token
+        assert 2 == token_refresh_count
+        assert 1 == len(os.listdir(tmp_path))
+
+def keyring_token_store_throws_without_keyring_package_test(monkeypatch):
+
+    # arrange
+    monkeypatch.setitem(sys.modules, "keyring", None)
+
+    # act / assert
+    with pytest.raises(Exception, match="requires the keyring package"):
+        KeyringTokenStore()
+
+def _handler16(request: Request):
+
+    if "refresh-token" in request.url.path:
+
+        refresh_token = json.loads(request.content)["refreshToken"]
+
+        # refresh tokens can only be used once
+        if refresh_token not in valid_refresh_tokens:
+            return Response(codes.UNAUTHORIZED)
+
+        valid_refresh_tokens.remove(refresh_token)
+        new_refresh_token = str(uuid.uuid4())
+        valid_refresh_tokens.add(new_refresh_token)
+
+        return Response(codes.OK, content=json.dumps({ "accessToken": _create_access_token(0), "refreshToken": new_refresh_token }))
+
+    else:
+        raise Exception("Unsupported path.")
+
+@pytest.mark.asyncio
+async def can_refresh_token_rotated_by_other_client_test():
+
+    # arrange
+    initial_refresh_token = str(uuid.uuid4())
+    valid_refresh_tokens.clear()
+    valid_refresh_tokens.add(initial_refresh_token)
+    token_store = MemoryTokenStore()
+
+    async with NexusAsyncClient(AsyncClient(base_url="http://localhost", transport=MockTransport(_handler16)), token_store=token_store) as client1, \
+               NexusAsyncClient(AsyncClient(base_url="http://localhost", transport=MockTransport(_handler16)), token_store=token_store) as client2:
+
+        await client1.sign_in(initial_refresh_token)
+        await client2.sign_in(initial_refresh_token)
+
+        # act
+        old_token_pair = client1._token_pair
+        assert old_token_pair is not None
+
+        await client1._refresh_token_async(old_token_pair.refresh_token)
+
+        # assert
+        new_token_pair = client1._token_pair
+
+        assert new_token_pair is not None
+        assert valid_refresh_tokens == { new_token_pair.refresh_token }
+        assert new_token_pair.refresh_token == token_store.load(initial_refresh_token)
+
+def can_create_client_with_transport_profile_test():
+
+    # arrange
+    profile = transport_profiles["bulk-download"]
+
+    # act
+    http_client = profile.create_http_client("http://localhost")
+    client = NexusAsyncClient.create("http://localhost", transport_profile=TransportProfile(read_timeout=60.0))
+
+    # assert
+    assert 300.0 == http_client.timeout.read
+    assert http_client.timeout.pool is None
+    assert 60.0 == client._http_client.timeout.read
+
+    with pytest.raises(Exception):
+        NexusAsyncClient.create("http://localhost", transport_profile="unknown")
+
+@pytest.mark.parametrize("profile_name", ["default", "bulk-download"])
+def can_create_client_with_environment_proxies_test(profile_name: str, monkeypatch):
+
+    # arrange
+    for key in ["https_proxy", "no_proxy", "all_proxy", "ALL_PROXY"]:
+        monkeypatch.delenv(key, raising=False)
+
+    monkeypatch.setenv("HTTPS_PROXY", "http://proxy:8080")
+    monkeypatch.setenv("NO_PROXY", "localhost, 127.0.0.1")
+
+    # act
+    http_client = transport_profiles[profile_name].create_http_client("https://localhost")
+
+    # assert
+    assert http_client._transport_for_url(URL("https://example.com")) is not http_client._transport
+    assert http_client._transport_for_url(URL("https://localhost")) is http_client._transport
+    assert http_client._transport_for_url(URL("https://127.0.0.1")) is http_client._transport
+    assert http_client._transport_for_url(URL("https://127.0.0.10")) is not http_client._transport
+
+warm_up_request_count: int = 0
+
+async def _handler15(request: Request):
+    global warm_up_request_count
+
+    if "authentication-schemes" in request.url.path:
+        warm_up_request_count += 1
+        return Response(codes.OK, content="[]")
+
+    else:
+        raise Exception("Unsupported path.")
+
+@pytest.mark.asyncio
+async def can_warm_up_test():
+
+    # arrange
+    http_client = AsyncClient(base_url="http://localhost", transport=MockTransport(_handler15))
+
+    async with NexusAsyncClient(http_client) as client:
+
+        # act
+        await client.warm_up(connection_count=4)
+
+        # assert
+        assert 4 == warm_up_request_count
@@ -0,0 +1,61 @@
+from datetime import datetime, timedelta
+
+from nexus_extensibility import (BufferPool, ExtensibilityUtilities,
+                                 NexusDataType, Representation)
+
+
+def can_reuse_buffers_test():
+
+    # arrange
+    pool = BufferPool()
+
+    # act
+    buffer1 = pool.rent(5000)
+    buffer1[:] = b"\x01" * 5000
+    underlying_buffer1 = buffer1.obj
+    pool.release(buffer1)
+
+    buffer2 = pool.rent(6000)
+
+    # assert
+    assert 6000 == len(buffer2)
+    assert underlying_buffer1 is buffer2.obj
+    assert bytes(6000) == buffer2.tobytes()
+
+def can_create_buffers_test():
+
+    # arrange
+    representation = Representation(NexusDataType.FLOAT64, timedelta(seconds=1))
+    begin = datetime(2020, 1, 1)
+    end = datetime(2020, 1, 1, 0, 0, 10)
+    pool = BufferPool()
+
+    # act
+    data1, status1 = ExtensibilityUtilities.create_buffers(representation, begin, end)
+    data2, status2 = ExtensibilityUtilities.create_buffers(representation, begin, end, pool)
+
+    # assert
+    assert 10 * representation.element_size == len(data1)
+    assert 10 == len(status1)
+    assert 10 * representation.element_size == len(data2)
+    assert 10 == len(status2)
+    assert bytes(10) == status2.tobytes()
+
+def can_rent_typed_buffers_test():
+
+    # arrange
+    pool = BufferPool()
+
+    # act
+    buffer1 = pool.rent_typed(600, NexusDataType.FLOAT64)
+    buffer1[0] = 1.5
+    underlying_buffer1 = buffer1.obj
+    pool.release(buffer1)
+
+    buffer2 = pool.rent_typed(1200, NexusDataType.INT32)
+
+    # assert
+    assert "i" == buffer2.format
+    assert 1200 == len(buffer2)
+    assert underlying_buffer1 is buffer2.obj
+    assert [0] * 1200 == buffer2.tolist()
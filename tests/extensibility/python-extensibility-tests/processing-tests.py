@@ -0,0 +1,54 @@
+import math
+import struct
+
+import pytest
+from nexus_extensibility import NexusDataType
+from nexus_extensibility.processing import RepresentationKind, aggregate
+
+
+@pytest.mark.parametrize(
+    "kind, expected",
+    [
+        (RepresentationKind.MEAN, [2.5, math.nan, 7.0]),
+        (RepresentationKind.MIN, [1.0, math.nan, 4.0]),
+        (RepresentationKind.MAX, [4.0, math.nan, 10.0]),
+        (RepresentationKind.STD, [math.sqrt(5 / 3), math.nan, math.sqrt(20 / 3)]),
+        (RepresentationKind.RMS, [math.sqrt(7.5), math.nan, math.sqrt(54)]),
+        (RepresentationKind.SUM, [10.0, math.nan, 28.0]),
+        (RepresentationKind.MEAN_POLAR_DEG, [2.5, math.nan, 7.0]),
+        (RepresentationKind.MIN_BITWISE, [0.0, math.nan, 0.0]),
+        (RepresentationKind.MAX_BITWISE, [7.0, math.nan, 14.0])
+    ])
+def can_aggregate_test(kind: RepresentationKind, expected: list[float]):
+
+    # arrange
+    values = [1, 2, 3, 4, 5, 6, 7, 8, 4, 6, 8, 10]
+    data = memoryview(bytearray(struct.pack(f"<{len(values)}i", *values)))
+    status = memoryview(bytearray([1, 1, 1, 1, 1, 0, 1, 1, 1, 1, 1, 1]))
+
+    # act
+    actual = aggregate(kind, data, status, NexusDataType.INT32, block_size=4, nan_threshold=0.99)
+
+    # assert
+    assert len(expected) == len(actual)
+
+    for expected_value, actual_value in zip(expected, actual):
+
+        if math.isnan(expected_value):
+            assert math.isnan(actual_value)
+
+        else:
+            assert expected_value == pytest.approx(actual_value)
+
+def can_aggregate_with_nan_threshold_test():
+
+    # arrange
+    values = [1.0, math.nan, 3.0, 5.0]
+    data = memoryview(bytearray(struct.pack("<4d", *values)))
+    status = memoryview(bytearray([1, 1, 1, 1]))
+
+    # act
+    actual = aggregate(RepresentationKind.MEAN, data, status, NexusDataType.FLOAT64, block_size=4, nan_threshold=0.5)
+
+    # assert
+    assert [3.0] == actual.tolist()
@@ -0,0 +1,54 @@
+import math
+import struct
+from datetime import datetime, timedelta
+
+import pytest
+from nexus_extensibility import NexusDataType
+from nexus_extensibility.resampling import resample
+
+
+@pytest.mark.parametrize(
+    "base_sample_period, sample_period, expected",
+    [
+        (timedelta(seconds=10), timedelta(seconds=5), [1.0, 1.0, math.nan, math.nan, 3.0, 3.0, 4.0, 4.0]),
+        (timedelta(seconds=10), timedelta(seconds=10), [1.0, math.nan, 3.0, 4.0]),
+        (timedelta(seconds=10), timedelta(seconds=20), [1.0, 3.0])
+    ])
+def can_resample_test(base_sample_period: timedelta, sample_period: timedelta, expected: list[float]):
+
+    # arrange
+    begin = datetime(2020, 1, 1)
+    end = begin + 4 * base_sample_period
+    data = memoryview(bytearray(struct.pack("<4h", 1, 2, 3, 4)))
+    status = memoryview(bytearray([1, 0, 1, 1]))
+
+    # act
+    actual = resample(data, status, NexusDataType.INT16, begin, end, base_sample_period, sample_period)
+
+    # assert
+    assert len(expected) == len(actual)
+
+    for expected_value, actual_value in zip(expected, actual):
+
+        if math.isnan(expected_value):
+            assert math.isnan(actual_value)
+
+        else:
+            assert expected_value == actual_value
+
+@pytest.mark.parametrize(
+    "begin, base_sample_period, sample_period",
+    [
+        # begin is not a multiple of the larger sample period
+        (datetime(2020, 1, 1, 0, 0, 10), timedelta(seconds=10), timedelta(seconds=20)),
+
+        # sample periods are not multiples of each other
+        (datetime(2020, 1, 1), timedelta(seconds=10), timedelta(seconds=15))
+    ])
+def can_detect_misaligned_resampling_test(begin: datetime, base_sample_period: timedelta, sample_period: timedelta):
+
+    data = memoryview(bytearray(struct.pack("<4h", 1, 2, 3, 4)))
+    status = memoryview(bytearray([1, 1, 1, 1]))
+
+    with pytest.raises(Exception):
+        resample(data, status, NexusDataType.INT16, begin, begin + 4 * base_sample_period, base_sample_period, sample_period)
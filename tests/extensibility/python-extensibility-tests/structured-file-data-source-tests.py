@@ -0,0 +1,123 @@
+import os
+import struct
+from array import array
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import List
+from urllib.parse import urlparse
+
+import pytest
+from nexus_extensibility import (CatalogItem, CatalogRegistration,
+                                 DataSourceContext, ExtensibilityUtilities,
+                                 FileSource, FileSourceProvider, ILogger,
+                                 LogLevel, NexusDataType, ReadInfo,
+                                 ReadRequest, Representation, Resource,
+                                 ResourceCatalog, StructuredFileDataSource)
+
+_file_source = FileSource(
+    path_segments=("%Y-%m",),
+    file_template="%Y-%m-%d_%H-%M-%S.dat",
+    file_date_time_preselector=None,
+    file_date_time_selector=None,
+    file_period=timedelta(seconds=10),
+    utc_offset=timedelta(0))
+
+_representation = Representation(NexusDataType.FLOAT64, timedelta(seconds=1))
+_resource = Resource("T1", representations=[_representation])
+_catalog = ResourceCatalog("/A/B/C", resources=[_resource])
+
+class _Logger(ILogger):
+
+    def log(self, log_level: LogLevel, message: str):
+        pass
+
+class _TestSource(StructuredFileDataSource):
+
+    def __init__(self, index_folder_path: str):
+        self._index_folder_path = index_folder_path
+
+    async def get_file_source_provider_async(self) -> FileSourceProvider:
+        return FileSourceProvider(lambda _: _file_source, { _catalog.id: [_file_source] })
+
+    async def get_catalog_registrations_async(self, path: str) -> List[CatalogRegistration]:
+        return [CatalogRegistration(_catalog.id, "", False)]
+
+    async def get_catalog_async(self, catalog_id: str) -> ResourceCatalog:
+        return _catalog
+
+    def get_index_folder_path(self) -> str:
+        return self._index_folder_path
+
+    def read_single(self, info: ReadInfo) -> None:
+        self.read_mapped_file(info)
+
+def _read_data(resource_path: str, begin: datetime, end: datetime) -> array:
+    raise Exception("Unsupported resource path.")
+
+def _write_file(root: Path, begin: datetime, values: List[float]):
+
+    folder_path = root / begin.strftime("%Y-%m")
+    folder_path.mkdir(parents=True, exist_ok=True)
+    (folder_path / begin.strftime("%Y-%m-%d_%H-%M-%S.dat")).write_bytes(struct.pack(f"<{len(values)}d", *values))
+
+async def _create_source(root: Path, index_folder_path: Path) -> _TestSource:
+
+    source = _TestSource(str(index_folder_path))
+    context = DataSourceContext(urlparse(root.as_uri()), {}, {}, {}, _Logger())
+
+    await source.set_context_async(context)
+
+    return source
+
+@pytest.mark.asyncio
+async def can_read_across_files_test(tmp_path):
+
+    # arrange
+    root = tmp_path / "data"
+    _write_file(root, datetime(2020, 1, 1, 0, 0, 0), [float(i) for i in range(10)])
+    _write_file(root, datetime(2020, 1, 1, 0, 0, 20), [float(i) for i in range(20, 30)])
+
+    # partially written file
+    _write_file(root, datetime(2020, 1, 1, 0, 0, 30), [30.0, 31.0])
+
+    source = await _create_source(root, tmp_path / "index")
+
+    begin = datetime(2020, 1, 1, 0, 0, 5, tzinfo=timezone.utc)
+    end = datetime(2020, 1, 1, 0, 0, 35, tzinfo=timezone.utc)
+    data, status = ExtensibilityUtilities.create_buffers(_representation, begin, end)
+    request = ReadRequest(CatalogItem(_catalog, _resource, _representation), data, status)
+
+    # act
+    await source.read_async(begin, end, [request], _read_data, lambda _: None)
+
+    # assert
+    expected_status = [1] * 5 + [0] * 10 + [1] * 10 + [1, 1, 0, 0, 0]
+    expected_data = [5.0, 6.0, 7.0, 8.0, 9.0] + [0.0] * 10 + [float(i) for i in range(20, 30)] + [30.0, 31.0, 0.0, 0.0, 0.0]
+
+    assert expected_status == list(status)
+    assert expected_data == list(data.cast("d"))
+
+@pytest.mark.asyncio
+async def can_update_file_index_test(tmp_path):
+
+    # arrange
+    root = tmp_path / "data"
+    index_folder_path = tmp_path / "index"
+    _write_file(root, datetime(2020, 1, 1, 0, 0, 0), [0.0] * 10)
+
+    source1 = await _create_source(root, index_folder_path)
+    time_range1 = await source1.get_time_range_async(_catalog.id)
+
+    # act
+    _write_file(root, datetime(2020, 2, 1, 0, 0, 0), [0.0] * 10)
+
+    source2 = await _create_source(root, index_folder_path)
+    time_range2 = await source2.get_time_range_async(_catalog.id)
+    availability = await source2.get_availability_async(
+        _catalog.id, datetime(2020, 1, 1, tzinfo=timezone.utc), datetime(2020, 1, 1, 0, 0, 20, tzinfo=timezone.utc))
+
+    # assert
+    assert (datetime(2020, 1, 1, tzinfo=timezone.utc), datetime(2020, 1, 1, 0, 0, 10, tzinfo=timezone.utc)) == time_range1
+    assert (datetime(2020, 1, 1, tzinfo=timezone.utc), datetime(2020, 2, 1, 0, 0, 10, tzinfo=timezone.utc)) == time_range2
+    assert 0.5 == availability
+    assert os.path.isfile(index_folder_path / "index.json")
@@ -0,0 +1,47 @@
+from array import array
+from datetime import datetime, timedelta
+
+import numpy
+import pytest
+from nexus_extensibility import (CatalogItem, ExtensibilityUtilities,
+                                 NexusDataType, ReadRequest, Representation,
+                                 Resource, ResourceCatalog)
+
+
+@pytest.mark.parametrize(
+    "data_type, expected",
+    [
+        (NexusDataType.UINT8, 1),
+        (NexusDataType.INT16, 2),
+        (NexusDataType.UINT32, 4),
+        (NexusDataType.INT64, 8),
+        (NexusDataType.FLOAT32, 4),
+        (NexusDataType.FLOAT64, 8)
+    ])
+def can_get_element_size_test(data_type: NexusDataType, expected: int):
+
+    representation = Representation(data_type, timedelta(seconds=1))
+    assert expected == representation.element_size
+
+def can_create_typed_views_test():
+
+    # arrange
+    representation = Representation(NexusDataType.INT16, timedelta(seconds=1))
+    resource = Resource("T1", representations=[representation])
+    catalog = ResourceCatalog("/A/B/C", resources=[resource])
+    catalog_item = CatalogItem(catalog, resource, representation)
+
+    data, status = ExtensibilityUtilities.create_buffers(
+        representation, datetime(2020, 1, 1), datetime(2020, 1, 1, 0, 0, 4))
+
+    request = ReadRequest(catalog_item, data, status)
+
+    # act
+    request.typed_data()[0:2] = array("h", [1, -2])
+    request.data_array()[2:4] = [3, -4]
+    request.status_array()[:] = 1
+
+    # assert
+    assert [1, -2, 3, -4] == request.typed_data().tolist()
+    assert numpy.int16 == request.data_array().dtype
+    assert bytes([1, 1, 1, 1]) == status.tobytes()